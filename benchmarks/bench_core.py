@@ -3,7 +3,8 @@
 Run with: py -3.12 benchmarks/bench_core.py
 
 Measures JSON load/save, keyword search, and bookmark add latency at
-various library sizes. Results printed as a table to stdout.
+various library sizes, plus the client-side overhead of one link probe.
+Results printed as a table to stdout.
 """
 
 import importlib
@@ -101,11 +102,48 @@ def bench_add_bookmark(count=500):
     return count, add_ms, per_ms
 
 
+def bench_link_probe_overhead(count=2000):
+    """Client-side cost of one link probe, with the network stubbed out.
+
+    Goes through the same BoundedEgressClient path link checks use (policy
+    check, requests session, HEAD then ranged GET fallback) so the number is
+    the Python overhead a faster HTTP stack could at best remove.
+    """
+    import io
+    import requests
+    from requests.adapters import BaseAdapter
+    from bookmark_organizer_pro.link_checker import probe_url
+    from bookmark_organizer_pro.services.egress import BoundedEgressClient
+
+    class _StubAdapter(BaseAdapter):
+        def send(self, request, **_kwargs):
+            response = requests.Response()
+            response.status_code = 405 if request.method == "HEAD" else 206
+            response.request = request
+            response.url = request.url
+            response.raw = io.BytesIO(b"")
+            return response
+
+        def close(self):
+            pass
+
+    client = BoundedEgressClient()
+    client.session.mount("https://", _StubAdapter())
+    url = "https://93.184.216.34/page"
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        probe_url(client, url, timeout=10)
+    total_ms = (time.perf_counter() - t0) * 1000
+    return count, total_ms, total_ms * 1000 / max(count, 1)
+
+
 CEILINGS = {
     "save_5000_ms": 500,
     "load_5000_ms": 200,
     "search_5000_ms": 100,
     "add_per_ms": 500.0,
+    "probe_per_us": 2000.0,
 }
 
 
@@ -147,6 +185,12 @@ def main():
         if per > CEILINGS["add_per_ms"]:
             violations.append(f"add/bookmark: {per:.2f}ms > {CEILINGS['add_per_ms']}ms ceiling")
 
+        print("\n--- Link Probe Overhead (HEAD + ranged GET, network stubbed) ---")
+        count, total, per = bench_link_probe_overhead()
+        print(f"  {count} probes in {total:.0f}ms ({per:.0f}us/probe)")
+        if per > CEILINGS["probe_per_us"]:
+            violations.append(f"probe overhead: {per:.0f}us > {CEILINGS['probe_per_us']:.0f}us ceiling")
+
         print("\n" + "=" * 70)
         if violations:
             print("\nPERFORMANCE VIOLATIONS:")
@@ -110,8 +110,10 @@ class FinalBookmarkOrganizerApp(
         self.root.geometry("1540x980")
         self.root.minsize(1180, 680)
         
-        theme = get_theme()
-        self.root.configure(bg=theme.bg_primary)
+        # Resolved once and refreshed on theme change; mixins read self.theme
+        # instead of going through the theme manager on every hover or row.
+        self.theme = get_theme()
+        self.root.configure(bg=self.theme.bg_primary)
         
         apply_window_chrome(self.root)
         
@@ -135,11 +137,13 @@ class FinalBookmarkOrganizerApp(
         self.current_category: Optional[str] = None
         self.search_query: str = ""
         self.selected_bookmarks: List[int] = []
+        self._bookmark_editor = None
         
         # Placeholder attributes (set before UI is built to prevent errors)
         self.status_label = None
         self.analytics_frame = None
         self.categories_frame = None
+        self.category_tree = None
         self.tree = None
         self.grid_canvas = None
         self.grid_inner = None
@@ -147,6 +151,7 @@ class FinalBookmarkOrganizerApp(
         self.main_container = None
         self.filter_buttons = {}
         self.filter_button_parts = {}
+        self._filter_visual_states = {}
         self.count_label = None
         self.collection_summary_frame = None
         self.summary_metric_labels = {}
@@ -161,6 +166,9 @@ class FinalBookmarkOrganizerApp(
         self.search_var = None
         self.search_entry = None
         self._search_after = None
+        self._save_after = None
+        self._favicon_decode_pool = None
+        self._favicon_decodes_pending = set()  # favicon paths queued for decoding
         self.active_filter = "All"
         self.quick_filter = None  # "pinned", "recent", "broken", "untagged" or None
         self._suppress_search_callback = False  # Flag to prevent search callback during programmatic changes
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import tkinter as tk
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Dict, List
@@ -238,7 +239,7 @@ class AiMenuDataMixin:
                 for tag in bm.ai_tags:
                     tag_counts[tag] = tag_counts.get(tag, 0) + 1
             
-            top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+            top_tags = sorted(tag_counts.items(), key=itemgetter(1), reverse=True)[:10]
             tags_text = ", ".join(f"{t} ({c})" for t, c in top_tags)
             
             tk.Label(dialog, text=tags_text, bg=theme.bg_primary,
@@ -307,7 +308,7 @@ class AiMenuDataMixin:
                     domain_counts[d] = domain_counts.get(d, 0) + 1
             
             # Sort by frequency and take top patterns
-            sorted_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)
+            sorted_domains = sorted(domain_counts.items(), key=itemgetter(1), reverse=True)
             top_patterns = [d for d, c in sorted_domains[:20]]  # Top 20 domains per category
             
             export_data["categories"][cat] = top_patterns
@@ -69,6 +69,9 @@ class AiSettingsMixin:
         ).pack(anchor="w", pady=(8, 6))
 
         provider_var = tk.StringVar(value=self.ai_config.get_provider())
+        # Model lists are fixed for the dialog's lifetime; provider toggles
+        # look them up here instead of rebuilding them from AI_PROVIDERS.
+        provider_models = {name: list(info.models) for name, info in AI_PROVIDERS.items()}
         provider_frame = tk.Frame(body, bg=theme.bg_primary)
         provider_frame.pack(fill=tk.X, pady=(0, 8))
 
@@ -474,11 +477,11 @@ class AiSettingsMixin:
 
         def _update_fo_models(*_):
             fp = fo_provider_var.get()
-            info = AI_PROVIDERS.get(fp)
-            if info:
-                fo_model_combo["values"] = info.models
-                if fo_model_var.get() not in info.models:
-                    fo_model_var.set(info.default_model)
+            models = provider_models.get(fp)
+            if models is not None:
+                fo_model_combo["values"] = models
+                if fo_model_var.get() not in models:
+                    fo_model_var.set(AI_PROVIDERS[fp].default_model)
         fo_provider_var.trace_add("write", _update_fo_models)
         _update_fo_models()
 
@@ -532,11 +535,11 @@ class AiSettingsMixin:
         # ── Provider change handler ──
         def on_provider_change(*_):
             provider = provider_var.get()
-            info = AI_PROVIDERS.get(provider)
-            if info:
-                model_combo["values"] = info.models
-                if model_var.get() not in info.models:
-                    model_var.set(info.default_model)
+            models = provider_models.get(provider)
+            if models is not None:
+                model_combo["values"] = models
+                if model_var.get() not in models:
+                    model_var.set(AI_PROVIDERS[provider].default_model)
                 api_key_var.set(self.ai_config.get_api_key(provider))
 
             if provider == "ollama":
@@ -15,7 +15,12 @@ from bookmark_organizer_pro.ui.tk_interactions import make_keyboard_activatable,
 from bookmark_organizer_pro.ui.treeview import BookmarkListWidget
 from bookmark_organizer_pro.ui.widget_chat_panel import ChatPanel
 from bookmark_organizer_pro.ui.workflow_detail_panel import BookmarkDetailPanel
-from bookmark_organizer_pro.ui.widgets import ModernButton, Tooltip, get_theme
+from bookmark_organizer_pro.ui.widgets import ModernButton, Tooltip
+
+# Sidebar rows share class-level bindtags so hover dispatches through one
+# handler per event instead of a closure pair bound on every row widget.
+QUICK_FILTER_BINDTAG = "BopQuickFilter"
+SIDEBAR_ROW_BINDTAG = "BopSidebarRow"
 
 
 class AppShellMixin:
@@ -34,7 +39,7 @@ class AppShellMixin:
     
     def _create_menu(self):
         """Create menu bar"""
-        theme = get_theme()
+        theme = self.theme
         
         menubar = tk.Menu(self.root, bg=theme.bg_dark, fg=theme.text_primary,
                          activebackground=theme.selection, borderwidth=0)
@@ -92,7 +97,7 @@ class AppShellMixin:
         win.transient(self.root)
         win.grab_set()
         win.bind("<Escape>", lambda e: win.destroy())
-        theme = get_theme()
+        theme = self.theme
         text = tk.Text(win, bg=theme.bg_primary, fg=theme.text_primary,
                        font=FONTS.body(), wrap=tk.WORD, padx=12, pady=12,
                        relief=tk.FLAT, highlightthickness=0)
@@ -123,7 +128,7 @@ class AppShellMixin:
         win.transient(self.root)
         win.grab_set()
         win.bind("<Escape>", lambda e: win.destroy())
-        theme = get_theme()
+        theme = self.theme
         win.configure(bg=theme.bg_primary)
         for key, desc in shortcuts:
             row = tk.Frame(win, bg=theme.bg_primary)
@@ -139,7 +144,7 @@ class AppShellMixin:
 
     def _create_main_layout(self):
         """Create main application layout"""
-        theme = get_theme()
+        theme = self.theme
         
         # Main container
         self.main_container = tk.Frame(self.root, bg=theme.bg_primary)
@@ -297,6 +302,7 @@ class AppShellMixin:
         )
         left_sidebar.pack(side=tk.LEFT, fill=tk.Y)
         left_sidebar.pack_propagate(False)
+        self._bind_sidebar_row_classes()
         
         # Scrollable container for left sidebar
         self.left_scroll = ScrollableFrame(left_sidebar, bg=theme.bg_dark)
@@ -364,16 +370,8 @@ class AppShellMixin:
             count_lbl.pack(side=tk.RIGHT, padx=(4, 8), pady=6)
 
             for widget in (row, name_lbl, count_lbl):
-                def on_enter(e, f=filter_name):
-                    if self.active_filter != f:
-                        self._set_filter_visual(f, False, hover=True)
-
-                def on_leave(e, f=filter_name):
-                    if self.active_filter != f:
-                        self._set_filter_visual(f, False)
-
-                widget.bind("<Enter>", on_enter)
-                widget.bind("<Leave>", on_leave)
+                widget._bop_filter_name = filter_name
+                widget.bindtags((QUICK_FILTER_BINDTAG,) + widget.bindtags())
 
             self.filter_buttons[filter_name] = row
             self.filter_button_parts[filter_name] = (row, name_lbl, count_lbl)
@@ -441,6 +439,8 @@ class AppShellMixin:
             anchor="w",
         )
         self._rl_empty.pack(fill=tk.X, pady=2)
+        self._rl_rows = []
+        self._rl_row_ids = []
 
         # --- Flows section (R-67) ---
         flows_header = tk.Frame(self.left_scroll.inner, bg=theme.bg_dark)
@@ -457,7 +457,8 @@ class AppShellMixin:
 
         self._flows_frame = tk.Frame(self.left_scroll.inner, bg=theme.bg_dark)
         self._flows_frame.pack(fill=tk.X, padx=DesignTokens.PANEL_PAD, pady=(0, 20))
-        self._render_empty_workflows(theme)
+        self._flows_empty = self._render_empty_workflows(theme)
+        self._flow_rows = []
 
         # A persistent local-save footer keeps the privacy/trust state visible
         # even when the global status bar is reporting a transient operation.
@@ -606,6 +607,8 @@ class AppShellMixin:
         self.tree.bind("<ButtonRelease-1>", self._on_library_table_release, add="+")
         self.tree.bind("<<TreeviewSelect>>", self._on_selection_change)
         self.tree.bind("<<TreeviewSort>>", self._refresh_table_semantic_status)
+        if hasattr(self.tree, "visible_item_ids"):
+            self.tree.bind("<<TableViewportChanged>>", self._queue_visible_favicons)
         
         # Ctrl+Scroll zoom binding
         self.tree.bind("<Control-MouseWheel>", self._on_mousewheel_zoom)
@@ -669,7 +672,7 @@ class AppShellMixin:
 
     def _show_shell_actions_menu(self):
         """Consolidate secondary destinations into one laptop-safe menu."""
-        theme = get_theme()
+        theme = self.theme
         menu = tk.Menu(
             self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
             activebackground=theme.selection, activeforeground=theme.text_primary,
@@ -686,7 +689,7 @@ class AppShellMixin:
 
     def _create_right_rail_header(self):
         """Create a compact contextual heading for the focus rail."""
-        theme = get_theme()
+        theme = self.theme
         header = tk.Frame(
             self.right_scroll.inner, bg=theme.bg_dark,
             highlightbackground=theme.border_muted, highlightthickness=0,
@@ -811,7 +814,7 @@ class AppShellMixin:
 
     def _toggle_pin_from_row(self, item_id: str):
         """Select one rendered row and toggle its persisted pin state."""
-        if item_id not in self.tree.get_children():
+        if not self._has_table_row(item_id):
             return
         try:
             self.tree.selection_set(item_id, emit=False)
@@ -829,7 +832,7 @@ class AppShellMixin:
 
     def _show_library_view_menu(self):
         """Open a compact view menu anchored to the visible view-options control."""
-        theme = get_theme()
+        theme = self.theme
         menu = tk.Menu(
             self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
             activebackground=theme.selection, activeforeground=theme.text_primary,
@@ -846,7 +849,7 @@ class AppShellMixin:
 
     def _show_library_collection_menu(self):
         """Filter the current library by a live collection list."""
-        theme = get_theme()
+        theme = self.theme
         menu = tk.Menu(
             self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
             activebackground=theme.selection, activeforeground=theme.text_primary,
@@ -867,7 +870,7 @@ class AppShellMixin:
 
     def _show_library_tag_menu(self):
         """Apply a search-backed tag filter from the library toolbar."""
-        theme = get_theme()
+        theme = self.theme
         menu = tk.Menu(
             self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
             activebackground=theme.selection, activeforeground=theme.text_primary,
@@ -890,7 +893,7 @@ class AppShellMixin:
 
     def _show_library_type_menu(self):
         """Expose the highest-value saved views without another persistent row."""
-        theme = get_theme()
+        theme = self.theme
         menu = tk.Menu(
             self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
             activebackground=theme.selection, activeforeground=theme.text_primary,
@@ -909,7 +912,7 @@ class AppShellMixin:
         """Set a structured query through the shared search contract."""
         self._suppress_search_callback = True
         self.search_var.set(str(query or ""))
-        self.search_entry.configure(fg=get_theme().text_primary)
+        self.search_entry.configure(fg=self.theme.text_primary)
         self._suppress_search_callback = False
         self.search_query = str(query or "")
         self.quick_filter = None
@@ -1014,64 +1017,107 @@ class AppShellMixin:
 
     # --- Sidebar refresh helpers (R-67) -------------------------------------
 
+    def _bind_sidebar_row_classes(self):
+        """Register the shared hover handlers for tagged sidebar rows once."""
+        self.root.bind_class(QUICK_FILTER_BINDTAG, "<Enter>", self._on_quick_filter_enter)
+        self.root.bind_class(QUICK_FILTER_BINDTAG, "<Leave>", self._on_quick_filter_leave)
+        self.root.bind_class(SIDEBAR_ROW_BINDTAG, "<Enter>", self._on_sidebar_row_enter)
+        self.root.bind_class(SIDEBAR_ROW_BINDTAG, "<Leave>", self._on_sidebar_row_leave)
+
+    def _on_quick_filter_enter(self, event):
+        name = getattr(event.widget, "_bop_filter_name", None)
+        if name and self.active_filter != name:
+            self._set_filter_visual(name, False, hover=True)
+
+    def _on_quick_filter_leave(self, event):
+        name = getattr(event.widget, "_bop_filter_name", None)
+        if name and self.active_filter != name:
+            self._set_filter_visual(name, False)
+
+    def _on_sidebar_row_enter(self, event):
+        theme = self.theme
+        event.widget.configure(bg=theme.bg_hover, fg=theme.text_primary)
+
+    def _on_sidebar_row_leave(self, event):
+        theme = self.theme
+        event.widget.configure(bg=theme.bg_dark, fg=theme.text_secondary)
+
     def _refresh_read_later_sidebar(self):
         from bookmark_organizer_pro.services.read_later import ReadLaterQueue
-        theme = get_theme()
+        theme = self.theme
         bms = self.bookmark_manager.get_all_bookmarks()
         queue = ReadLaterQueue.list_queue(bms)
-
-        for w in self._rl_frame.winfo_children():
-            w.destroy()
+        visible = queue[:8]
 
         self._rl_count_label.config(text=str(len(queue)))
-        if not queue:
-            tk.Label(
-                self._rl_frame, text=_("Nothing queued"),
-                bg=theme.bg_dark, fg=theme.text_muted, font=FONTS.small(),
-                anchor="w",
-            ).pack(fill=tk.X, pady=2)
-            return
-
-        for bm in queue[:8]:
+        self._rl_row_ids[:] = [bm.id for bm in visible]
+        labels = []
+        for bm in visible:
             title = (bm.title or bm.url)[:40]
-            row = tk.Label(
-                self._rl_frame, text=format_message('  {value_0}', value_0=title),
-                bg=theme.bg_dark, fg=theme.text_secondary, font=FONTS.small(),
-                cursor="hand2", anchor="w",
-            )
-            row.pack(fill=tk.X, pady=1)
-            make_keyboard_activatable(
-                row,
-                lambda b=bm: self._select_bookmark_by_id(b.id),
-                accessible_name=_("Open Read Later bookmark: {title}").format(title=title),
-            )
-            row.bind("<Enter>", lambda e, w=row: w.configure(bg=theme.bg_hover, fg=theme.text_primary))
-            row.bind("<Leave>", lambda e, w=row: w.configure(bg=theme.bg_dark, fg=theme.text_secondary))
+            labels.append((
+                format_message('  {value_0}', value_0=title),
+                _("Open Read Later bookmark: {title}").format(title=title),
+            ))
+        self._sync_sidebar_rows(
+            self._rl_rows, labels, lambda index: self._create_read_later_row(theme, index),
+            self._rl_empty, empty_pady=2,
+        )
+
+    def _sync_sidebar_rows(self, rows, labels, build_row, empty, empty_pady=2):
+        """Show ``labels`` on a recycled pool of sidebar rows.
+
+        Existing labels are relabelled, new ones are only built when the list
+        outgrows the pool, and surplus rows are unpacked. ``labels`` holds
+        ``(text, accessible_name)`` pairs; a ``None`` name leaves it unset.
+        """
+        if labels:
+            empty.pack_forget()
+        elif not empty.winfo_manager():
+            empty.pack(fill=tk.X, pady=empty_pady)
+        for index, (text, accessible_name) in enumerate(labels):
+            if index == len(rows):
+                rows.append(build_row(index))
+            row = rows[index]
+            row.configure(text=text)
+            if accessible_name is not None:
+                row._bop_accessible_name = accessible_name
+            if not row.winfo_manager():
+                row.pack(fill=tk.X, pady=1)
+        for row in rows[len(labels):]:
+            row.pack_forget()
+
+    def _create_read_later_row(self, theme, index: int):
+        """Build one reusable Read Later sidebar row bound to its queue slot."""
+        row = tk.Label(
+            self._rl_frame, bg=theme.bg_dark, fg=theme.text_secondary,
+            font=FONTS.small(), cursor="hand2", anchor="w",
+        )
+        make_keyboard_activatable(row, lambda: self._select_bookmark_by_id(self._rl_row_ids[index]))
+        row.bindtags((SIDEBAR_ROW_BINDTAG,) + row.bindtags())
+        return row
 
     def _refresh_flows_sidebar(self):
         from bookmark_organizer_pro.services.flows import FlowManager
-        theme = get_theme()
+        theme = self.theme
         fm = FlowManager()
         flows = fm.list_flows()
-
-        for w in self._flows_frame.winfo_children():
-            w.destroy()
+        visible = flows[:8]
 
         self._flows_count_label.config(text=str(len(flows)))
-        if not flows:
-            self._render_empty_workflows(theme)
-            return
+        labels = [(f"  {flow.icon or '📋'} {flow.name}"[:40], None) for flow in visible]
+        self._sync_sidebar_rows(
+            self._flow_rows, labels, lambda _index: self._create_flow_row(theme),
+            self._flows_empty, empty_pady=(2, 0),
+        )
 
-        for flow in flows[:8]:
-            label = f"  {flow.icon or '📋'} {flow.name}"[:40]
-            row = tk.Label(
-                self._flows_frame, text=label,
-                bg=theme.bg_dark, fg=theme.text_secondary, font=FONTS.small(),
-                cursor="hand2", anchor="w",
-            )
-            row.pack(fill=tk.X, pady=1)
-            row.bind("<Enter>", lambda e, w=row: w.configure(bg=theme.bg_hover, fg=theme.text_primary))
-            row.bind("<Leave>", lambda e, w=row: w.configure(bg=theme.bg_dark, fg=theme.text_secondary))
+    def _create_flow_row(self, theme):
+        """Build one reusable workflow sidebar row."""
+        row = tk.Label(
+            self._flows_frame, bg=theme.bg_dark, fg=theme.text_secondary,
+            font=FONTS.small(), cursor="hand2", anchor="w",
+        )
+        row.bindtags((SIDEBAR_ROW_BINDTAG,) + row.bindtags())
+        return row
 
     def _render_empty_workflows(self, theme):
         """Keep the secondary workflow empty state quiet and compact."""
@@ -1086,10 +1132,11 @@ class AppShellMixin:
             bg=theme.bg_dark, fg=theme.text_muted, font=FONTS.tiny(),
             justify=tk.LEFT, anchor="w", wraplength=190,
         ).pack(fill=tk.X, pady=(3, 0))
+        return empty
 
     def _select_bookmark_by_id(self, bookmark_id: int):
         item_id = str(bookmark_id)
-        if item_id in self.tree.get_children():
+        if self._has_table_row(item_id):
             self.tree.selection_set(item_id)
             self.tree.see(item_id)
             self.tree.focus(item_id)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import Dict
 
 from bookmark_organizer_pro.commands import DeleteBookmarksCommand
@@ -52,7 +53,14 @@ class BookmarkCrudMixin:
         if self.selected_bookmarks:
             bookmark = self.bookmark_manager.get_bookmark(self.selected_bookmarks[0])
             if bookmark:
-                BookmarkEditorDialog(
+                # Re-invoking Edit on the same bookmark raises the open editor
+                # instead of building a second copy of the whole form.
+                editor = getattr(self, "_bookmark_editor", None)
+                if editor is not None and editor.bookmark is bookmark and editor.winfo_exists():
+                    editor.lift()
+                    editor.focus_set()
+                    return
+                self._bookmark_editor = BookmarkEditorDialog(
                     self.root, bookmark,
                     categories=self.category_manager.get_sorted_categories(),
                     available_tags=self.tag_manager.get_all_tags(),
@@ -84,15 +92,25 @@ class BookmarkCrudMixin:
             self.root.clipboard_append('\n'.join(urls))
             self._set_status(f"Copied {pluralize(len(urls), 'URL')}")
     
+    def _selection_batch(self):
+        """Coalesce the saves of a multi-row edit into one library write.
+
+        A single row saves directly, skipping the batch snapshot copy.
+        """
+        if len(self.selected_bookmarks) > 1:
+            return self.bookmark_manager.batch()
+        return contextlib.nullcontext()
+
     def _toggle_pin(self):
-        """Toggle pin status"""
+        """Toggle pin status, writing the library once for the whole selection"""
         changed = 0
-        for bm_id in self.selected_bookmarks:
-            bookmark = self.bookmark_manager.get_bookmark(bm_id)
-            if bookmark:
-                bookmark.is_pinned = not bookmark.is_pinned
-                self.bookmark_manager.update_bookmark(bookmark)
-                changed += 1
+        with self._selection_batch():
+            for bm_id in self.selected_bookmarks:
+                bookmark = self.bookmark_manager.get_bookmark(bm_id)
+                if bookmark:
+                    bookmark.is_pinned = not bookmark.is_pinned
+                    self.bookmark_manager.update_bookmark(bookmark)
+                    changed += 1
         self._refresh_bookmark_list()
         if changed:
             self._set_status(f"Updated pin state for {pluralize(changed, 'bookmark')}")
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import tkinter as tk
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Dict, List
 
 from bookmark_organizer_pro.i18n import _
@@ -11,19 +13,49 @@ from bookmark_organizer_pro.models import Bookmark
 from bookmark_organizer_pro.ui.feedback import ToastNotification
 from bookmark_organizer_pro.ui.foundation import DesignTokens, display_or_fallback, truncate_middle
 from bookmark_organizer_pro.ui.shell_widgets import ViewMode
-from bookmark_organizer_pro.ui.widgets import get_theme
+from bookmark_organizer_pro.ui.treeview import decode_favicon
+
+# Rows below the viewport whose favicons are fetched ahead of scrolling.
+FAVICON_PREFETCH_AHEAD = 40
+
+
+def _iso_date(value: str) -> date | None:
+    """Return the calendar date written at the start of an ISO timestamp.
+
+    Stored timestamps are ISO-8601, so the first ten characters already are
+    the date; slicing them avoids a full datetime parse per table row.
+    """
+    text = str(value or "")
+    if len(text) >= 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return date(int(text[:4]), int(text[5:7]), int(text[8:10]))
+        except ValueError:
+            pass
+    return _iso_date_fallback(text)
+
+
+@lru_cache(maxsize=1024)
+def _iso_date_fallback(text: str) -> date | None:
+    """Parse a timestamp without a plain ``YYYY-MM-DD`` prefix.
+
+    These come from imports and repeat across rows, so the datetime parse is
+    memoized; text that cannot start an ISO date is rejected without raising.
+    """
+    if not text[:1].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
 
 
 def _relative_added(value: str, now: datetime | None = None) -> str:
     """Return a compact date label for the library table."""
-    try:
-        parsed = datetime.fromisoformat(str(value or "").replace("Z", "+00:00"))
-        if parsed.tzinfo is not None:
-            parsed = parsed.replace(tzinfo=None)
-    except (TypeError, ValueError):
+    parsed = _iso_date(value)
+    if parsed is None:
         return "—"
     now = now or datetime.now()
-    delta = max(0, (now.date() - parsed.date()).days)
+    delta = max(0, (now.date() - parsed).days)
     if delta == 0:
         return "Today"
     if delta == 1:
@@ -46,14 +78,18 @@ def _bookmark_status(bookmark: Bookmark) -> str:
 
 def _saved_cell(value: str, now: datetime | None = None) -> str:
     """Return a two-line saved date that stays readable in a dense row."""
-    try:
-        parsed = datetime.fromisoformat(str(value or "").replace("Z", "+00:00"))
-        if parsed.tzinfo is not None:
-            parsed = parsed.replace(tzinfo=None)
-    except (TypeError, ValueError):
-        return "—"
     now = now or datetime.now()
-    age_in_days = max(0, (now.date() - parsed.date()).days)
+    return _saved_cell_on(str(value or ""), now.date())
+
+
+@lru_cache(maxsize=4096)
+def _saved_cell_on(value: str, today: date) -> str:
+    """Format one saved date per calendar day; many bookmarks share a date."""
+    parsed = _iso_date(value)
+    if parsed is None:
+        return "—"
+    now = datetime.combine(today, datetime.min.time())
+    age_in_days = max(0, (today - parsed).days)
     if age_in_days < 7:
         return f"{_relative_added(value, now)}\n{parsed.strftime('%b %d')}"
     return f"{parsed.strftime('%b %d')}\n{parsed.strftime('%Y')}"
@@ -79,6 +115,45 @@ def _status_sort_value(bookmark: Bookmark) -> int:
     return 3
 
 
+def _fmt_tags(tags: List[str], ai_tags: List[str]) -> str:
+    """Summarize tags as one primary tag plus a count, built in one f-string."""
+    if tags:
+        remaining = len(tags) + len(ai_tags) - 1
+        return f"#{tags[0]} +{remaining}" if remaining else f"#{tags[0]}"
+    if ai_tags:
+        remaining = len(ai_tags) - 1
+        return f"AI #{ai_tags[0]} +{remaining}" if remaining else f"AI #{ai_tags[0]}"
+    return "—"
+
+
+def _bookmark_row_cells(bm: Bookmark, today: date) -> tuple:
+    """Format the display cells for one bookmark row.
+
+    Returns ``(domain, site, title, organization, added, status, saved_sort,
+    status_sort)`` and is memoized per bookmark through ``Bookmark.row_cache``.
+    """
+    title_text = display_or_fallback(bm.title, "Untitled bookmark")
+    subtitle = truncate_middle(
+        display_or_fallback(bm.description or bm.notes, bm.url), 72,
+    )
+    title = f"{truncate_middle(title_text, 54)}\n{subtitle}"
+
+    category = truncate_middle(display_or_fallback(bm.category, "Uncategorized"), 22)
+    organization = f"{category}\n{truncate_middle(_fmt_tags(bm.tags, bm.ai_tags), 28)}"
+    domain = bm.domain
+    site = truncate_middle(display_or_fallback(domain, _("Unknown site")), 14)
+    return (
+        domain,
+        site,
+        title,
+        organization,
+        _saved_cell_on(str(bm.created_at or ""), today),
+        _bookmark_status(bm),
+        _saved_sort_value(bm.created_at),
+        _status_sort_value(bm),
+    )
+
+
 class BookmarkViewMixin:
     """Bookmark filtering, list rendering, and favicon UI update behavior."""
 
@@ -91,29 +166,26 @@ class BookmarkViewMixin:
             set_semantic_state("loading", _("Loading bookmarks"))
             self._refresh_table_semantic_status()
         
-        # Get base bookmarks - always start from all bookmarks for quick filters
-        if self.current_category:
-            bookmarks = self.bookmark_manager.get_bookmarks_by_category(self.current_category)
-        else:
-            bookmarks = self.bookmark_manager.get_all_bookmarks()
-        
         query = self.search_query.strip() if hasattr(self, 'search_query') and self.search_query else ""
         search_has_error = False
+        manager = self.bookmark_manager
+        category = self.current_category
 
-        # Apply quick filter (takes priority over search)
+        # Apply quick filter (takes priority over search). The flag filters
+        # read the manager's cached columns instead of scanning the library.
         quick_filter = getattr(self, 'quick_filter', None)
-        if quick_filter:
-            if quick_filter == "pinned":
-                bookmarks = [bm for bm in bookmarks if bm.is_pinned]
-            elif quick_filter == "broken":
-                bookmarks = [bm for bm in bookmarks if not bm.is_valid]
-            elif quick_filter == "recent":
-                week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-                # Handle bookmarks with empty or invalid created_at
-                bookmarks = [bm for bm in bookmarks if bm.created_at and bm.created_at >= week_ago]
-            elif quick_filter == "untagged":
-                bookmarks = [bm for bm in bookmarks if not bm.tags and not bm.ai_tags]
+        if quick_filter == "pinned":
+            bookmarks = manager.get_pinned_bookmarks(category)
+        elif quick_filter == "broken":
+            bookmarks = manager.find_broken_links(category)
+        elif quick_filter == "recent":
+            bookmarks = manager.get_recent_bookmarks(7, category)
         else:
+            # Base bookmarks arrive pinned-first and title-ordered; filters keep that order.
+            bookmarks = manager.get_sorted_bookmarks(category)
+        if quick_filter == "untagged":
+            bookmarks = [bm for bm in bookmarks if not bm.tags and not bm.ai_tags]
+        elif not quick_filter:
             # Apply search query only if no quick filter
             if query:
                 if getattr(self, '_nl_search_mode', False):
@@ -131,10 +203,8 @@ class BookmarkViewMixin:
             elif hasattr(self, "_set_search_validation"):
                 self._set_search_validation([])
         
-        if query:
+        if query and not quick_filter:
             bookmarks.sort(key=lambda b: not b.is_pinned)
-        else:
-            bookmarks.sort(key=lambda b: (not b.is_pinned, b.title.lower()))
 
         if self.count_label and not bookmarks and not self.bookmark_manager.bookmarks:
             self.count_label.configure(text=_("Library"))
@@ -220,91 +290,80 @@ class BookmarkViewMixin:
 
     def _populate_list_view(self, bookmarks: List[Bookmark]):
         """Populate the virtualized bookmark table with bookmarks."""
-        theme = get_theme()
+        theme = self.theme
         self.tree.tag_configure("oddrow", background=theme.bg_primary, foreground=theme.text_primary)
         self.tree.tag_configure("evenrow", background=theme.bg_secondary, foreground=theme.text_primary)
         self.tree.tag_configure("broken", foreground=theme.accent_error)
         self.tree.tag_configure("archived", foreground=theme.text_muted)
         previous_selection = set(getattr(self, 'selected_bookmarks', []))
         restored_selection = []
+        restored_ids = []
         
         self._tree_items: Dict[int, str] = {}
+        self._tree_item_ids: Dict[str, int] = {}
         self._tree_domains: Dict[str, List[str]] = {}
+        self._tree_item_domains: Dict[str, str] = {}
         row_specs = []
         favicon_updates = []
         
+        # Everything that does not vary per row is resolved once up front:
+        # translated favorite labels, the six stripe/state tag tuples, and the
+        # bound lookups the loop calls for every bookmark.
+        today = date.today()
+        favorite_labels = (_("No"), _("Yes"))
+        row_tag_sets = tuple(
+            ((stripe,), (stripe, "broken"), (stripe, "archived"))
+            for stripe in ("oddrow", "evenrow")
+        )
+        tree_items = self._tree_items
+        tree_item_ids = self._tree_item_ids
+        tree_domains = self._tree_domains
+        tree_item_domains = self._tree_item_domains
+        get_cached_favicon = self.favicon_manager.get_cached
         for index, bm in enumerate(bookmarks):
-            # Build calm two-line cells and keep state/favorite controls in their
-            # own predictable columns.
-            title_text = display_or_fallback(bm.title, "Untitled bookmark")
-            subtitle = truncate_middle(
-                display_or_fallback(bm.description or bm.notes, bm.url), 72,
+            # Calm two-line cells are cached per bookmark; state and favorite
+            # controls keep their own predictable columns.
+            domain, site, title, organization, added, status, saved_sort, status_sort = (
+                bm.row_cache(_bookmark_row_cells, today)
             )
-            title = f"{truncate_middle(title_text, 54)}\n{subtitle}"
-            
-            # Keep rows scan-friendly: show one primary tag plus a count.
-            if bm.tags:
-                tags_str = f"#{bm.tags[0]}"
-                remaining = len(bm.tags) + len(bm.ai_tags) - 1
-            elif bm.ai_tags:
-                tags_str = f"AI #{bm.ai_tags[0]}"
-                remaining = len(bm.ai_tags) - 1
-            else:
-                tags_str = "—"
-                remaining = 0
-            if remaining > 0:
-                tags_str += f" +{remaining}"
-
-            category = truncate_middle(display_or_fallback(bm.category, "Uncategorized"), 22)
-            organization = f"{category}\n{truncate_middle(tags_str, 28)}"
-            added = _saved_cell(bm.created_at)
-            status = _bookmark_status(bm)
-            favorite = _("Yes") if bm.is_pinned else _("No")
-            site = truncate_middle(
-                display_or_fallback(bm.domain, _("Unknown site")),
-                14,
-            )
-
-            row_tags = ["evenrow" if index % 2 else "oddrow"]
-            if not bm.is_valid:
-                row_tags.append("broken")
-            elif bm.is_archived:
-                row_tags.append("archived")
+            pinned = bool(bm.is_pinned)
+            state = 1 if not bm.is_valid else (2 if bm.is_archived else 0)
             
             item_id = str(bm.id)
             row_specs.append({
                 "iid": item_id,
                 "text": site,
-                "values": (title, organization, added, status, favorite),
-                "tags": tuple(row_tags),
+                "values": (title, organization, added, status, favorite_labels[pinned]),
+                "tags": row_tag_sets[index % 2][state],
                 "sort_values": {
-                    "#0": bm.domain,
+                    "#0": domain,
                     "title": bm.title,
                     "organization": bm.category,
-                    "saved": _saved_sort_value(bm.created_at),
-                    "status": _status_sort_value(bm),
-                    "favorite": bool(bm.is_pinned),
+                    "saved": saved_sort,
+                    "status": status_sort,
+                    "favorite": pinned,
                 },
             })
             if bm.id in previous_selection:
                 restored_selection.append(item_id)
+                restored_ids.append(bm.id)
             
-            self._tree_items[bm.id] = item_id
-            
-            if bm.domain not in self._tree_domains:
-                self._tree_domains[bm.domain] = []
-            self._tree_domains[bm.domain].append(item_id)
+            tree_items[bm.id] = item_id
+            tree_item_ids[item_id] = bm.id
+            tree_domains.setdefault(domain, []).append(item_id)
+            tree_item_domains[item_id] = domain
             
             # Set favicon if cached
-            favicon_path = self.favicon_manager.get_cached(bm.domain)
+            favicon_path = get_cached_favicon(domain)
             if favicon_path:
                 favicon_updates.append((item_id, favicon_path))
 
         if hasattr(self.tree, "set_bookmark_rows"):
             self.tree.set_bookmark_rows(row_specs)
         else:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            existing = self.tree.get_children()
+            if existing:
+                self.tree.delete(*existing)
             for row in row_specs:
                 self.tree.insert(
                     "", "end",
@@ -315,15 +374,22 @@ class BookmarkViewMixin:
                 )
                 if hasattr(self.tree, "set_sort_values"):
                     self.tree.set_sort_values(row["iid"], row["sort_values"])
+        needs_decode = getattr(self.tree, "needs_favicon_decode", None)
+        undecoded = {}
         for item_id, favicon_path in favicon_updates:
-            self.tree.set_favicon(item_id, favicon_path)
+            if needs_decode is not None and needs_decode(favicon_path):
+                undecoded[favicon_path] = self._tree_item_domains[item_id]
+            else:
+                self.tree.set_favicon(item_id, favicon_path)
+        if undecoded:
+            self._decode_favicons_async(undecoded)
 
         if restored_selection:
             try:
                 self.tree.selection_set(restored_selection, emit=False)
             except TypeError:
                 self.tree.selection_set(restored_selection)
-            self.selected_bookmarks = [int(item) for item in restored_selection]
+            self.selected_bookmarks = restored_ids
         else:
             if hasattr(self.tree, "selection_clear"):
                 self.tree.selection_clear()
@@ -333,6 +399,22 @@ class BookmarkViewMixin:
         if hasattr(self, "_update_right_rail_selection"):
             self._update_right_rail_selection()
 
+    def _bookmark_ids_for(self, item_ids) -> List[int]:
+        """Bookmark ids for table item ids, read from the last populate's index.
+
+        Selections can cover every row, so this is a dict lookup per item
+        rather than an ``int()`` parse; unknown items still fall back to one.
+        """
+        known = getattr(self, "_tree_item_ids", {}).get
+        return [known(item_id) or int(item_id) for item_id in item_ids]
+
+    def _has_table_row(self, item_id) -> bool:
+        """Return whether the last populate rendered ``item_id``, in O(1)."""
+        try:
+            return int(item_id) in getattr(self, "_tree_items", {})
+        except (TypeError, ValueError):
+            return False
+
     def _refresh_table_semantic_status(self, _event=None):
         """Publish visible row, selection, state, sort, and action context."""
         label = getattr(self, "library_footer_label", None)
@@ -389,20 +471,77 @@ class BookmarkViewMixin:
             )
         label.configure(text=" · ".join(parts))
     
+    def _queue_visible_favicons(self, _event=None):
+        """Download missing favicons for the viewport and the rows just below it.
+
+        Visible rows come first, so their downloads are queued before the
+        ``FAVICON_PREFETCH_AHEAD`` rows the next scroll will reveal.
+        """
+        visible_item_ids = getattr(getattr(self, "tree", None), "visible_item_ids", None)
+        if visible_item_ids is None or not self.favicon_manager.enabled:
+            return
+        item_domains = getattr(self, "_tree_item_domains", {})
+        visible = []
+        for item_id in visible_item_ids(ahead=FAVICON_PREFETCH_AHEAD):
+            domain = item_domains.get(item_id)
+            if domain:
+                visible.append((domain, int(item_id)))
+        self.favicon_manager.prefetch(visible)
+
     def _on_favicon_progress(self, completed: int, total: int, current: str):
         """Favicon progress callback - thread-safe"""
-        self._post_to_ui(lambda: self.favicon_status.update_status(completed, total, current))
+        self._post_latest_to_ui(
+            "favicon-progress",
+            lambda: self.favicon_status.update_status(completed, total, current),
+        )
     
     def _on_favicon_ready_threadsafe(self, domain: str, filepath: str, bookmark_id: int):
-        """Favicon ready callback - schedules UI update on main thread"""
-        self._post_to_ui(lambda: self._update_favicon_in_tree(domain, filepath))
+        """Favicon ready callback - hands the file to the UI thread.
+
+        The tree's image cache is only read there; icons it lacks are then
+        decoded on the decode pool before they are applied.
+        """
+        def apply():
+            tree = getattr(self, "tree", None)
+            if tree is not None and tree.needs_favicon_decode(filepath):
+                self._decode_favicons_async({filepath: domain})
+            else:
+                self._update_favicon_in_tree(domain, filepath)
+
+        self._post_to_ui(apply)
     
-    def _update_favicon_in_tree(self, domain: str, filepath: str):
+    def _decode_favicons_async(self, paths: Dict[str, str]):
+        """Decode cached favicon files off the UI thread, then apply them.
+
+        ``paths`` maps favicon files to their domain. A path already being
+        decoded for an earlier refresh is not queued again.
+        """
+        pending = self._favicon_decodes_pending
+        pool = self._favicon_decode_pool
+        if pool is None:
+            pool = self._favicon_decode_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="favicon-decode",
+            )
+        for filepath, domain in paths.items():
+            if filepath not in pending:
+                pending.add(filepath)
+                pool.submit(self._decode_favicon_worker, domain, filepath)
+
+    def _decode_favicon_worker(self, domain: str, filepath: str):
+        decoded = decode_favicon(filepath)
+
+        def apply():
+            self._favicon_decodes_pending.discard(filepath)
+            self._update_favicon_in_tree(domain, filepath, decoded)
+
+        self._post_to_ui(apply)
+
+    def _update_favicon_in_tree(self, domain: str, filepath: str, decoded=None):
         """Update favicon in treeview (runs on main thread)"""
         if hasattr(self, '_tree_domains') and domain in self._tree_domains:
             for item_id in self._tree_domains[domain]:
                 try:
-                    self.tree.set_favicon(item_id, filepath)
+                    self.tree.set_favicon(item_id, filepath, decoded)
                 except Exception:
                     pass
     
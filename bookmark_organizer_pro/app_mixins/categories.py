@@ -3,129 +3,233 @@
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 
 from bookmark_organizer_pro.i18n import _
 from bookmark_organizer_pro.ui.foundation import FONTS, format_compact_count, pluralize, truncate_middle
-from bookmark_organizer_pro.ui.tk_interactions import make_keyboard_activatable, route_pointer_to_control
-from bookmark_organizer_pro.ui.widgets import ModernButton, Tooltip, apply_window_chrome, get_theme
+from bookmark_organizer_pro.ui.tk_interactions import make_keyboard_activatable
+from bookmark_organizer_pro.ui.widgets import ModernButton, apply_window_chrome
 
 
 class CategoryActionsMixin:
     """Category sidebar rendering and category-management actions."""
 
     def _refresh_category_list(self):
-        """Refresh category list in sidebar with right-click support"""
+        """Refresh category list in sidebar with right-click support.
+
+        Categories are items of one borderless Treeview, keyed by name. A
+        refresh diffs the new category list against the items already shown:
+        only added, removed or re-parented items are touched, and otherwise
+        just the counts and selection that changed are rewritten.
+        """
+        self._cancel_category_refresh()
         if not hasattr(self, 'categories_frame') or not self.categories_frame:
             return
-        
-        theme = get_theme()
-        
-        for widget in self.categories_frame.winfo_children():
-            widget.destroy()
-        
+        tree = self._category_tree_widget()
+
         counts = self.bookmark_manager.get_category_counts()
         categories = sorted(
             set(self.category_manager.get_sorted_categories()) |
             {cat for cat, count in counts.items() if count > 0},
             key=lambda name: name.lower()
         )
-        self.categories_frame.bind("<Button-3>", self._show_add_category_menu)
-
         total_bookmarks = len(self.bookmark_manager.get_all_bookmarks())
+        notice = None
         if total_bookmarks == 0:
-            tk.Label(
-                self.categories_frame,
-                text=_("Categories appear after you import or add bookmarks."),
-                bg=theme.bg_dark, fg=theme.text_muted,
-                font=FONTS.small(), wraplength=185, justify=tk.LEFT, anchor="w",
-            ).pack(fill=tk.X, padx=10, pady=8)
+            notice = _("Categories appear after you import or add bookmarks.")
+        else:
+            categories = [cat for cat in categories if counts.get(cat, 0) > 0 or cat == self.current_category]
+            if not categories:
+                notice = _("No active categories yet.")
+        if notice:
+            if self._category_tree_order:
+                tree.delete(*tree.get_children(""))
+                self._category_tree_order = []
+                self._category_tree_counts = {}
+                self._category_tree_layout = {}
+            tree.pack_forget()
+            self._set_category_notice(notice)
             return
+        self._set_category_notice(None)
+        if not tree.winfo_manager():
+            tree.pack(fill=tk.X)
+
+        if categories != self._category_tree_order:
+            self._sync_category_tree(tree, categories)
+            tree.configure(height=len(categories))
+            self._category_tree_order = list(categories)
 
-        categories = [cat for cat in categories if counts.get(cat, 0) > 0 or cat == self.current_category]
-        if not categories:
-            tk.Label(
-                self.categories_frame,
-                text=_("No active categories yet."),
-                bg=theme.bg_dark, fg=theme.text_muted,
-                font=FONTS.small(), wraplength=185, justify=tk.LEFT, anchor="w",
-            ).pack(fill=tk.X, padx=10, pady=8)
-            return
-        
         for cat in categories:
             count = counts.get(cat, 0)
-            is_selected = (cat == self.current_category)
-            bg = theme.selection if is_selected else theme.bg_dark
-
-            depth = cat.count(" / ")
-            indent = depth * 16
-            display_name = cat.rsplit(" / ", 1)[-1] if " / " in cat else cat
-
-            row = tk.Frame(
-                self.categories_frame, bg=bg, cursor="hand2",
-                highlightthickness=1,
-                highlightbackground=theme.border_muted if is_selected else bg
-            )
-            row.pack(fill=tk.X, pady=2)
-
-            name_lbl = tk.Label(
-                row, text=truncate_middle(display_name, 20 - depth * 2),
-                bg=bg, fg=theme.text_primary if is_selected else theme.text_secondary,
-                font=FONTS.body(bold=is_selected), anchor="w",
-                padx=4, pady=6, cursor="hand2"
-            )
-            name_lbl.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10 + indent, 0))
-
-            if count > 0:
-                count_lbl = tk.Label(
-                    row, text=format_compact_count(count),
-                    bg=bg, fg=theme.accent_primary if is_selected else theme.text_muted,
-                    font=FONTS.tiny(bold=True), padx=4, pady=1,
-                    cursor="hand2"
-                )
-                count_lbl.pack(side=tk.RIGHT, padx=(4, 8), pady=6)
+            if self._category_tree_counts.get(cat) != count:
+                tree.item(cat, values=(format_compact_count(count) if count > 0 else "",))
+                self._category_tree_counts[cat] = count
+
+        selected = (self.current_category,) if self.current_category in self._category_tree_counts else ()
+        if tuple(tree.selection()) != selected:
+            if selected:
+                tree.selection_set(selected)
+                tree.see(selected[0])
             else:
-                count_lbl = None
-
-            for w in [row, name_lbl] + ([count_lbl] if count_lbl else []):
-                w.bind("<Button-3>", lambda e, c=cat: self._show_category_context_menu(e, c))
-
-            def on_enter(e, r=row, n=name_lbl, cl=count_lbl, c=cat):
-                if c != self.current_category:
-                    for w in [r, n] + ([cl] if cl else []):
-                        w.configure(bg=theme.bg_hover)
-                    n.configure(fg=theme.text_primary)
-                    if cl:
-                        cl.configure(fg=theme.text_primary)
-            def on_leave(e, r=row, n=name_lbl, cl=count_lbl, c=cat):
-                if c != self.current_category:
-                    bg_ = theme.bg_dark
-                    for w in [r, n]:
-                        w.configure(bg=bg_)
-                    n.configure(fg=theme.text_secondary)
-                    if cl:
-                        cl.configure(bg=bg_, fg=theme.text_muted)
-
-            for w in [row, name_lbl] + ([count_lbl] if count_lbl else []):
-                w.bind("<Enter>", on_enter)
-                w.bind("<Leave>", on_leave)
-
-            make_keyboard_activatable(
-                row,
-                lambda c=cat: self._select_category(c),
-                accessible_name=_("Show category: {category}").format(category=cat),
-            )
-            route_pointer_to_control(row, name_lbl, count_lbl)
-            row.bind("<FocusIn>", lambda e, r=row, n=name_lbl, cl=count_lbl, c=cat: on_enter(e, r, n, cl, c), add="+")
-            row.bind("<FocusOut>", lambda e, r=row, n=name_lbl, cl=count_lbl, c=cat: on_leave(e, r, n, cl, c), add="+")
-            Tooltip(row, f"Show {cat} ({pluralize(count, 'bookmark')})")
-        
-        # Also bind right-click on empty space for "Add Category"
+                tree.selection_remove(*tree.selection())
+
+    def _sync_category_tree(self, tree, categories):
+        """Insert, remove and re-parent tree items to match ``categories``.
+
+        A subcategory nests under its parent when the parent is shown and
+        otherwise sits at the root under its full name. Items whose parent
+        and label are unchanged are left alone.
+        """
+        wanted = {}
+        for cat in categories:
+            parent = cat.rsplit(" / ", 1)[0] if " / " in cat else ""
+            if parent in wanted:
+                wanted[cat] = (parent, cat.rsplit(" / ", 1)[-1])
+            else:
+                wanted[cat] = ("", cat)
+
+        layout = self._category_tree_layout
+        removed = [cat for cat in layout if cat not in wanted]
+        if removed:
+            # Deleting an item takes its subtree with it; lift survivors out first.
+            for cat in removed:
+                for child in tree.get_children(cat):
+                    if child in wanted:
+                        tree.move(child, "", "end")
+                        layout[child] = None
+            tree.delete(*[cat for cat in removed if tree.exists(cat)])
+            for cat in removed:
+                layout.pop(cat, None)
+                self._category_tree_counts.pop(cat, None)
+
+        positions = {}
+        for cat, (parent, text) in wanted.items():
+            index = positions.get(parent, 0)
+            positions[parent] = index + 1
+            if cat not in layout:
+                tree.insert(parent, index, iid=cat, text=truncate_middle(text, 24), open=True)
+            else:
+                placed = layout[cat]
+                if placed is None or placed[0] != parent:
+                    tree.move(cat, parent, index)
+                if placed is None or placed[1] != text:
+                    tree.item(cat, text=truncate_middle(text, 24))
+            layout[cat] = (parent, text)
+
+    def _schedule_category_refresh(self):
+        """Coalesce a burst of sidebar refreshes into one idle-time render."""
+        if getattr(self, "_category_refresh_after", None) is not None:
+            return
+        self._category_refresh_after = self.root.after_idle(self._refresh_category_list)
+
+    def _cancel_category_refresh(self):
+        pending = getattr(self, "_category_refresh_after", None)
+        if pending is None:
+            return
+        self._category_refresh_after = None
+        try:
+            self.root.after_cancel(pending)
+        except Exception:
+            pass
+
+    def _flush_category_refresh(self):
+        """Render a scheduled sidebar refresh now, if one is pending."""
+        if getattr(self, "_category_refresh_after", None) is not None:
+            self._refresh_category_list()
+
+    def _set_category_notice(self, text):
+        """Show or remove the sidebar's empty-state message."""
+        label = getattr(self, "_category_notice", None)
+        if text is None:
+            if label is not None:
+                label.destroy()
+                self._category_notice = None
+            return
+        if label is not None:
+            label.configure(text=text)
+            return
+        theme = self.theme
+        self._category_notice = tk.Label(
+            self.categories_frame,
+            text=text,
+            bg=theme.bg_dark, fg=theme.text_muted,
+            font=FONTS.small(), wraplength=185, justify=tk.LEFT, anchor="w",
+        )
+        self._category_notice.pack(fill=tk.X, padx=10, pady=8)
+
+    def _category_tree_widget(self):
+        """Return the sidebar Treeview, creating it for a new categories frame."""
+        tree = getattr(self, "category_tree", None)
+        if tree is not None and getattr(self, "_category_tree_frame", None) is self.categories_frame:
+            return tree
+        # The shell (and this frame) is rebuilt on theme changes.
+        theme = self.theme
+        style = ttk.Style(self.root)
+        style.configure(
+            "Sidebar.Treeview",
+            background=theme.bg_dark,
+            fieldbackground=theme.bg_dark,
+            foreground=theme.text_secondary,
+            borderwidth=0,
+            rowheight=30,
+            font=FONTS.body(),
+        )
+        style.map(
+            "Sidebar.Treeview",
+            background=[("selected", theme.selection)],
+            foreground=[("selected", theme.text_primary)],
+        )
+        style.layout("Sidebar.Treeview", [("Treeview.treearea", {"sticky": "nswe"})])
+
+        tree = ttk.Treeview(
+            self.categories_frame, columns=("count",), show="tree",
+            selectmode="browse", style="Sidebar.Treeview", height=1,
+        )
+        tree.column("#0", width=150, stretch=True)
+        tree.column("count", width=44, anchor="e", stretch=False)
+        # Native class bindings run first so clicks and keys have already
+        # moved the focus row when the activation handler reads it.
+        tags = tree.bindtags()
+        tree.bindtags((tags[1], tags[0], *tags[2:]))
+        make_keyboard_activatable(
+            tree, self._activate_category_tree_row,
+            accessible_name=_("Collections"),
+        )
+        tree.bind("<<TreeviewSelect>>", self._on_category_tree_select)
+        tree.bind("<Button-3>", self._on_category_tree_context)
         self.categories_frame.bind("<Button-3>", self._show_add_category_menu)
+
+        self.category_tree = tree
+        self._category_tree_frame = self.categories_frame
+        self._category_tree_order = []
+        self._category_tree_counts = {}
+        self._category_tree_layout = {}
+        self._category_notice = None
+        return tree
+
+    def _on_category_tree_select(self, event):
+        selection = event.widget.selection()
+        if selection and selection[0] != self.current_category:
+            self._select_category(selection[0])
+
+    def _activate_category_tree_row(self):
+        """Show the focused category; activating the active one clears it."""
+        tree = getattr(self, "category_tree", None)
+        name = tree.focus() if tree is not None else ""
+        if name:
+            self._select_category(name)
+
+    def _on_category_tree_context(self, event):
+        name = event.widget.identify_row(event.y)
+        if name:
+            self._show_category_context_menu(event, name)
+        else:
+            self._show_add_category_menu(event)
+        return "break"
     
     def _show_category_context_menu(self, event, category: str):
         """Show context menu for category"""
-        theme = get_theme()
+        theme = self.theme
         
         menu = tk.Menu(self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
                       activebackground=theme.bg_hover, activeforeground=theme.text_primary)
@@ -138,7 +242,7 @@ class CategoryActionsMixin:
     
     def _show_add_category_menu(self, event):
         """Show menu for adding new category"""
-        theme = get_theme()
+        theme = self.theme
         
         menu = tk.Menu(self.root, tearoff=0, bg=theme.bg_secondary, fg=theme.text_primary,
                       activebackground=theme.bg_hover, activeforeground=theme.text_primary)
@@ -148,7 +252,7 @@ class CategoryActionsMixin:
 
     def _add_new_category_dialog(self):
         """Show dialog to add new category"""
-        theme = get_theme()
+        theme = self.theme
         
         dialog = tk.Toplevel(self.root)
         dialog.title(_("Add Category"))
@@ -210,7 +314,7 @@ class CategoryActionsMixin:
     
     def _rename_category_dialog(self, old_name: str):
         """Show dialog to rename category"""
-        theme = get_theme()
+        theme = self.theme
         
         dialog = tk.Toplevel(self.root)
         dialog.title(_("Rename Category"))
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 import tkinter as tk
+from functools import lru_cache
+from operator import itemgetter
 from tkinter import ttk
 from typing import Dict
 
@@ -12,7 +15,31 @@ from bookmark_organizer_pro.ui.components import EnhancedProgressBar, FaviconSta
 from bookmark_organizer_pro.ui.foundation import FONTS, DesignTokens, format_compact_count, pluralize, truncate_middle
 from bookmark_organizer_pro.ui.tk_interactions import make_keyboard_activatable, route_pointer_to_control
 from bookmark_organizer_pro.ui.view_models import build_collection_pulse, build_collection_summary
-from bookmark_organizer_pro.ui.widgets import ModernButton, Tooltip, get_theme
+from bookmark_organizer_pro.ui.widgets import ModernButton, Tooltip
+
+
+@lru_cache(maxsize=16)
+def _health_score(total: int, broken: int, uncategorized: int,
+                  duplicates: int, with_tags: int, with_notes: int) -> int:
+    """Score one set of statistics; pulse and detail refreshes share it."""
+    score = 100
+    total = total or 1
+
+    broken_pct = (broken / total) * 100
+    uncat_pct = (uncategorized / total) * 100
+    dupe_pct = (duplicates / total) * 100
+
+    score -= min(30, broken_pct * 3)
+    score -= min(20, uncat_pct * 0.5)
+    score -= min(15, dupe_pct * 2)
+
+    tagged_pct = (with_tags / total) * 100
+    noted_pct = (with_notes / total) * 100
+
+    score += min(10, tagged_pct * 0.1)
+    score += min(5, noted_pct * 0.1)
+
+    return max(0, min(100, int(score)))
 
 
 class DashboardActionsMixin:
@@ -20,7 +47,7 @@ class DashboardActionsMixin:
 
     def _create_collection_summary(self):
         """Create the library query/filter toolbar below the collection header."""
-        theme = get_theme()
+        theme = self.theme
         self.collection_summary_frame = tk.Frame(
             self.content_area, bg=theme.bg_primary,
             highlightbackground=theme.border_muted, highlightthickness=0,
@@ -93,7 +120,7 @@ class DashboardActionsMixin:
 
     def _create_summary_metric(self, parent, key: str, label: str, color: str):
         """Create one compact metric in the summary strip."""
-        theme = get_theme()
+        theme = self.theme
         block = tk.Frame(parent, bg=theme.bg_card)
         block.pack(side=tk.LEFT, padx=(8, 0))
         value_lbl = tk.Label(
@@ -168,7 +195,7 @@ class DashboardActionsMixin:
 
     def _create_selection_bar(self):
         """Create the contextual action bar shown when rows are selected."""
-        theme = get_theme()
+        theme = self.theme
         self.selection_bar = tk.Frame(
             self.content_area, bg=theme.bg_tertiary,
             highlightbackground=theme.border_muted, highlightthickness=1
@@ -230,7 +257,7 @@ class DashboardActionsMixin:
 
     def _create_analytics_panel(self, parent=None):
         """Create the compact collection pulse shown in the right rail."""
-        theme = get_theme()
+        theme = self.theme
         parent = parent or self.right_scroll.inner
 
         header = tk.Frame(parent, bg=theme.bg_dark)
@@ -258,7 +285,7 @@ class DashboardActionsMixin:
 
     def _refresh_collection_pulse(self, stats, all_bookmarks):
         """Render health, trustworthy zero-state metrics, and one next action."""
-        theme = get_theme()
+        theme = self.theme
         frame = self.collection_pulse_frame
         for widget in frame.winfo_children():
             widget.destroy()
@@ -421,7 +448,7 @@ class DashboardActionsMixin:
             return
         if not getattr(self, "analytics_frame", None):
             return
-        theme = get_theme()
+        theme = self.theme
 
         stats = self.bookmark_manager.get_statistics()
         all_bookmarks = self.bookmark_manager.get_all_bookmarks()
@@ -564,13 +591,11 @@ class DashboardActionsMixin:
         # Top categories (compact) - clickable like domains
         section_label(_("Top Categories"))
         
-        sorted_cats = [
-            item for item in sorted(
-                stats.get('category_counts', {}).items(),
-                key=lambda x: -x[1]
-            )
-            if item[1] > 0
-        ][:5]
+        sorted_cats = heapq.nlargest(
+            5,
+            (item for item in stats.get('category_counts', {}).items() if item[1] > 0),
+            key=itemgetter(1),
+        )
         max_count = max(sorted_cats[0][1], 1) if sorted_cats else 1
         
         if not sorted_cats:
@@ -792,28 +817,18 @@ class DashboardActionsMixin:
         """Calculate collection health score"""
         if stats.get('total_bookmarks', 0) == 0:
             return 0
-        score = 100
-        total = stats['total_bookmarks'] or 1
-        
-        broken_pct = (stats['broken'] / total) * 100
-        uncat_pct = (stats['uncategorized'] / total) * 100
-        dupe_pct = (stats['duplicate_bookmarks'] / total) * 100
-        
-        score -= min(30, broken_pct * 3)
-        score -= min(20, uncat_pct * 0.5)
-        score -= min(15, dupe_pct * 2)
-        
-        tagged_pct = (stats['with_tags'] / total) * 100
-        noted_pct = (stats['with_notes'] / total) * 100
-        
-        score += min(10, tagged_pct * 0.1)
-        score += min(5, noted_pct * 0.1)
-        
-        return max(0, min(100, int(score)))
+        return _health_score(
+            stats['total_bookmarks'],
+            stats['broken'],
+            stats['uncategorized'],
+            stats['duplicate_bookmarks'],
+            stats['with_tags'],
+            stats['with_notes'],
+        )
     
     def _create_status_bar(self):
         """Create enhanced status bar with counts and progress"""
-        theme = get_theme()
+        theme = self.theme
         
         self.status_bar = tk.Frame(self.root, bg=theme.bg_dark, height=DesignTokens.STATUS_BAR_HEIGHT)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
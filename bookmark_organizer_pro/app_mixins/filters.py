@@ -7,7 +7,6 @@ import tkinter as tk
 from bookmark_organizer_pro.i18n import _
 from bookmark_organizer_pro.ui import build_filter_counts
 from bookmark_organizer_pro.ui.foundation import FONTS, format_compact_count
-from bookmark_organizer_pro.ui.widgets import get_theme
 
 SEARCH_FILTER_HINTS = [
     ("tag:", "tag:python — bookmarks with tag"),
@@ -25,16 +24,21 @@ SEARCH_FILTER_HINTS = [
     ("regex:", "regex:pattern — time-bounded regular expression"),
     ("#", "#python — tag shorthand"),
 ]
+_FILTER_HINT_PREFIXES = frozenset(prefix for prefix, _desc in SEARCH_FILTER_HINTS)
+
+# Quiet period after the last keystroke before the library list is filtered.
+SEARCH_DEBOUNCE_MS = 150
 
 
 class FilterActionsMixin:
     """Search box, sidebar quick-filter, and category-selection behavior."""
 
     _filter_hint_popup = None
+    _filter_hint_key = None
 
     def _on_search_focus_in(self, e):
         """Clear placeholder when search entry gains focus"""
-        theme = get_theme()
+        theme = self.theme
         if hasattr(self, 'search_frame') and self.search_frame:
             border = (
                 theme.accent_error
@@ -53,7 +57,7 @@ class FilterActionsMixin:
     def _on_search_focus_out(self, e):
         """Restore placeholder when search entry loses focus and is empty"""
         self._dismiss_filter_hints()
-        theme = get_theme()
+        theme = self.theme
         if hasattr(self, 'search_frame') and self.search_frame:
             border = (
                 theme.accent_error
@@ -72,21 +76,29 @@ class FilterActionsMixin:
                 self.clear_search_btn.pack_forget()
 
     def _show_filter_hints(self, text: str):
-        """Show a filter-hint popup when the user types a recognized prefix."""
-        self._dismiss_filter_hints()
-        if not text or text == getattr(self, '_search_placeholder', ''):
-            return
+        """Show a filter-hint popup when the user types a recognized prefix.
 
-        last_token = text.rsplit(None, 1)[-1] if text else ""
-        if not last_token:
+        The popup is kept as-is while successive keystrokes match the same
+        hints, so typing through a prefix does not rebuild a Toplevel and
+        force a layout pass per character.
+        """
+        tokens = []
+        if text and text != getattr(self, '_search_placeholder', ''):
+            tokens = text.rsplit(None, 1)
+        lower = tokens[-1].lower() if tokens else ""
+        matches = ()
+        if lower and lower not in _FILTER_HINT_PREFIXES:
+            matches = tuple(
+                desc for prefix, desc in SEARCH_FILTER_HINTS if prefix.startswith(lower)
+            )[:6]
+        if matches and matches == self.__class__._filter_hint_key \
+                and self.__class__._filter_hint_popup is not None:
             return
-
-        lower = last_token.lower()
-        matches = [desc for prefix, desc in SEARCH_FILTER_HINTS if prefix.startswith(lower)]
-        if not matches or lower in {p for p, _ in SEARCH_FILTER_HINTS}:
+        self._dismiss_filter_hints()
+        if not matches:
             return
 
-        theme = get_theme()
+        theme = self.theme
         popup = tk.Toplevel(self.root)
         popup.overrideredirect(True)
         popup.configure(bg=theme.border_muted)
@@ -95,7 +107,7 @@ class FilterActionsMixin:
         inner = tk.Frame(popup, bg=theme.bg_secondary, padx=1, pady=1)
         inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
 
-        for hint in matches[:6]:
+        for hint in matches:
             tk.Label(
                 inner, text=hint, bg=theme.bg_secondary, fg=theme.text_secondary,
                 font=FONTS.small(), anchor="w", padx=8, pady=2,
@@ -106,11 +118,12 @@ class FilterActionsMixin:
         y = self.search_entry.winfo_rooty() + self.search_entry.winfo_height() + 2
         popup.geometry(f"+{x}+{y}")
         self.__class__._filter_hint_popup = popup
+        self.__class__._filter_hint_key = matches
 
     def _toggle_nl_search(self):
         """Toggle between standard keyword search and AI natural-language search."""
         self._nl_search_mode = not getattr(self, '_nl_search_mode', False)
-        theme = get_theme()
+        theme = self.theme
         btn = getattr(self, '_nl_toggle_btn', None)
         if btn:
             if self._nl_search_mode:
@@ -147,6 +160,7 @@ class FilterActionsMixin:
             except Exception:
                 pass
             self.__class__._filter_hint_popup = None
+        self.__class__._filter_hint_key = None
 
     def _on_search_change(self, *args):
         """Handle search change with debounce"""
@@ -173,7 +187,7 @@ class FilterActionsMixin:
                 self.clear_search_btn.pack_forget()
         
         # When user types in search, clear quick filter and reset filter buttons
-        if self.search_query:
+        if self.search_query and (self.quick_filter or self.active_filter):
             self.quick_filter = None
             self.active_filter = None
             for name in self.filter_buttons:
@@ -183,12 +197,17 @@ class FilterActionsMixin:
         self._cancel_search_debounce()
         
         # Schedule debounced refresh
-        self._search_after = self.root.after(200, self._refresh_bookmark_list)
+        self._search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        """Apply the debounced query once typing has paused."""
+        self._search_after = None
+        self._refresh_bookmark_list()
 
     def _set_search_validation(self, diagnostics) -> None:
         """Render search diagnostics without broadening the entered query."""
         self._search_diagnostics = list(diagnostics or [])
-        theme = get_theme()
+        theme = self.theme
         frame = getattr(self, "search_frame", None)
         if frame:
             focused = (
@@ -211,8 +230,18 @@ class FilterActionsMixin:
         parts = getattr(self, 'filter_button_parts', {}).get(filter_name)
         if not parts:
             return
-        theme = get_theme()
+        theme = self.theme
         row, name_lbl, count_lbl = parts
+        # Pointer moves between a row and its labels fire Leave/Enter pairs;
+        # skip the Tk reconfigure when the row already shows this state.
+        states = getattr(self, '_filter_visual_states', None)
+        if states is None:
+            states = self._filter_visual_states = {}
+        state = (row, theme, active, hover)
+        applied = states.get(filter_name)
+        if applied is not None and all(a is b for a, b in zip(applied, state)):
+            return
+        states[filter_name] = state
         bg = theme.selection if active else (theme.bg_hover if hover else theme.bg_dark)
         count_fg = theme.accent_primary if active else (theme.text_primary if hover else theme.text_muted)
         for widget in (row, name_lbl):
@@ -9,6 +9,18 @@ from bookmark_organizer_pro.logging_config import log
 from bookmark_organizer_pro.services.settings_store import load_settings
 from bookmark_organizer_pro.ui.foundation import pluralize
 
+# Display refreshes requested through _schedule_refresh; one idle-time flush
+# runs each requested refresh once, however many actions asked for it.
+REFRESH_CATEGORIES = 1
+REFRESH_BOOKMARKS = 2
+REFRESH_PANELS = 4
+REFRESH_STATUS = 8
+REFRESH_ALL = REFRESH_CATEGORIES | REFRESH_BOOKMARKS | REFRESH_PANELS | REFRESH_STATUS
+
+# Quiet period after the last deferred edit (e.g. a visit count) before the
+# library is written, so a burst of opens costs one save.
+SAVE_DEBOUNCE_MS = 500
+
 
 class LifecycleActionsMixin:
     """Startup data load, status bar, polling, undo/redo, and close handlers."""
@@ -29,9 +41,10 @@ class LifecycleActionsMixin:
                 daemon=True,
             ).start()
 
-        # Queue favicon downloads
+        # Fetch favicons for the rows on screen; scrolling queues the rest.
         bookmarks = self.bookmark_manager.get_all_bookmarks()
-        self.favicon_manager.queue_bookmarks(bookmarks)
+        if hasattr(self, "_queue_visible_favicons"):
+            self._queue_visible_favicons()
 
         if recovery_required:
             self._set_status(self.bookmark_manager.recovery_message)
@@ -55,6 +68,13 @@ class LifecycleActionsMixin:
         dispatcher = getattr(self, "ui_dispatcher", None)
         return bool(dispatcher and dispatcher.post(callback))
 
+    def _post_latest_to_ui(self, key, callback):
+        """Like _post_to_ui, but a newer callback under ``key`` replaces a pending one."""
+        if getattr(self, "_closing", False):
+            return False
+        dispatcher = getattr(self, "ui_dispatcher", None)
+        return bool(dispatcher and dispatcher.post_latest(key, callback))
+
     def _undo(self):
         """Undo"""
         if self.command_stack.undo():
@@ -66,30 +86,77 @@ class LifecycleActionsMixin:
             self._refresh_all()
     
     def _refresh_all(self):
-        """Refresh all displays"""
-        self._refresh_category_list()
-        self._refresh_bookmark_list()
-        self._refresh_analytics()
-        if hasattr(self, "_refresh_read_later_sidebar"):
+        """Refresh all displays on the next idle pass."""
+        self._schedule_refresh(REFRESH_ALL)
+
+    def _schedule_refresh(self, mask: int):
+        """Request the ``REFRESH_*`` displays in ``mask`` for the idle flush."""
+        self._pending_refresh = getattr(self, "_pending_refresh", 0) | mask
+        if getattr(self, "_refresh_after", None) is None:
+            self._refresh_after = self.root.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run every pending refresh now, each at most once."""
+        pending = getattr(self, "_refresh_after", None)
+        self._refresh_after = None
+        if pending is not None:
             try:
-                self._refresh_read_later_sidebar()
+                self.root.after_cancel(pending)
             except Exception:
                 pass
-        if hasattr(self, "_refresh_flows_sidebar"):
+        mask, self._pending_refresh = getattr(self, "_pending_refresh", 0), 0
+        if mask & REFRESH_CATEGORIES:
+            self._refresh_category_list()
+        if mask & REFRESH_BOOKMARKS:
+            self._refresh_bookmark_list()
+        if mask & REFRESH_PANELS:
+            self._refresh_analytics()
+            if hasattr(self, "_refresh_read_later_sidebar"):
+                try:
+                    self._refresh_read_later_sidebar()
+                except Exception:
+                    pass
+            if hasattr(self, "_refresh_flows_sidebar"):
+                try:
+                    self._refresh_flows_sidebar()
+                except Exception:
+                    pass
+        if mask & REFRESH_STATUS:
+            self._update_status_counts()
+    
+    def _schedule_save(self):
+        """Write the library once the current burst of deferred edits settles."""
+        pending = getattr(self, "_save_after", None)
+        if pending is not None:
             try:
-                self._refresh_flows_sidebar()
+                self.root.after_cancel(pending)
             except Exception:
                 pass
-    
+        self._save_after = self.root.after(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Write edits deferred by _schedule_save now, if any are pending."""
+        pending = getattr(self, "_save_after", None)
+        if pending is None:
+            return
+        self._save_after = None
+        try:
+            self.root.after_cancel(pending)
+        except Exception:
+            pass
+        try:
+            self.bookmark_manager.save_pending_visits()
+        except Exception:
+            log.warning("Deferred bookmark save failed", exc_info=True)
+
     def _set_status(self, message: str):
-        """Set status message and update counts"""
+        """Set status message; counts update on the next idle pass."""
         if self.status_label:
             try:
                 self.status_label.configure(text=message)
             except Exception:
                 pass
-        # Update counts whenever status changes
-        self._update_status_counts()
+        self._schedule_refresh(REFRESH_STATUS)
     
     def _show_status_progress(self, show: bool = True):
         """Show or hide progress indicator in status bar"""
@@ -195,13 +262,14 @@ class LifecycleActionsMixin:
         """Handle close — stop timers and background work before tearing down."""
         self._closing = True
 
-        for attr in ("_analytics_poll_id", "_grid_after_id", "_search_after"):
+        for attr in ("_analytics_poll_id", "_grid_after_id", "_search_after", "_refresh_after"):
             after_id = getattr(self, attr, None)
             if after_id:
                 try:
                     self.root.after_cancel(after_id)
                 except Exception:
                     pass
+        self._flush_save()
 
         scanner = getattr(self, "_dead_link_scanner", None)
         if scanner is not None:
@@ -214,6 +282,10 @@ class LifecycleActionsMixin:
         if bookmark_manager is not None:
             bookmark_manager.stop_file_watcher()
 
+        decode_pool = getattr(self, "_favicon_decode_pool", None)
+        if decode_pool is not None:
+            decode_pool.shutdown(wait=False, cancel_futures=True)
+
         for manager in (getattr(self, "favicon_manager", None),
                         getattr(self, "task_runner", None)):
             if manager is not None:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import tkinter as tk
 import webbrowser
-from datetime import datetime
 
 from bookmark_organizer_pro.i18n import _, format_message
 from bookmark_organizer_pro.models import Bookmark
@@ -23,21 +22,22 @@ class SelectionActionsMixin:
     """Selection state, bookmark opening, and row context-menu behavior."""
 
     def _select_all_bookmarks(self):
-        """Select all bookmarks in view (Ctrl+A)"""
-        all_items = self.tree.get_children()
-        self.tree.selection_set(all_items)
-        self.selected_bookmarks = [int(item) for item in all_items]
-        self._update_selection_bar()
-        if hasattr(self, "_update_right_rail_selection"):
-            self._update_right_rail_selection()
-        if hasattr(self, "_refresh_table_semantic_status"):
-            self._refresh_table_semantic_status()
-        self._set_status(f"Selected {len(all_items)} bookmarks")
+        """Select all bookmarks in view (Ctrl+A).
+
+        Both tables emit <<TreeviewSelect>> for the new selection, so the
+        selection bar, inspector and status are refreshed once, by
+        _on_selection_change, rather than here and again there.
+        """
+        select_all = getattr(self.tree, "select_all", None)
+        if select_all is not None:
+            select_all()
+        else:
+            self.tree.selection_set(self.tree.get_children())
         return "break"  # Prevent default behavior
 
     def _on_selection_change(self, event):
         """Handle tree selection change"""
-        self.selected_bookmarks = [int(item) for item in self.tree.selection()]
+        self.selected_bookmarks = self._bookmark_ids_for(self.tree.selection())
         self._update_status_counts()
         self._update_selection_bar()
         if hasattr(self, "_update_right_rail_selection"):
@@ -60,11 +60,10 @@ class SelectionActionsMixin:
         pass
     
     def _open_bookmark(self, bookmark: Bookmark):
-        """Open bookmark in browser"""
+        """Open bookmark in browser; the visit is saved with the rest of the burst."""
         if _open_external_url(bookmark.url):
-            bookmark.visit_count += 1
-            bookmark.last_visited = datetime.now().isoformat()
-            self.bookmark_manager.update_bookmark(bookmark)
+            if self.bookmark_manager.record_visit(bookmark.id, save=False) is not None:
+                self._schedule_save()
 
     def _open_offline_copy(self, bookmark: Bookmark):
         """Verify and open a selected bookmark's local snapshot."""
@@ -97,7 +96,7 @@ class SelectionActionsMixin:
             self.tree.selection_set(item)
         
         # Update selected_bookmarks list
-        self.selected_bookmarks = [int(i) for i in self.tree.selection()]
+        self.selected_bookmarks = self._bookmark_ids_for(self.tree.selection())
         self._update_selection_bar()
         if hasattr(self, "_update_right_rail_selection"):
             self._update_right_rail_selection()
@@ -194,12 +193,13 @@ class SelectionActionsMixin:
             return
         
         count = 0
-        for bm_id in self.selected_bookmarks:
-            bookmark = self.bookmark_manager.get_bookmark(bm_id)
-            if bookmark:
-                bookmark.category = category
-                self.bookmark_manager.update_bookmark(bookmark)
-                count += 1
+        with self._selection_batch():
+            for bm_id in self.selected_bookmarks:
+                bookmark = self.bookmark_manager.get_bookmark(bm_id)
+                if bookmark:
+                    bookmark.category = category
+                    self.bookmark_manager.update_bookmark(bookmark)
+                    count += 1
         
         self._refresh_all()
         self._set_status(f"Moved {count} bookmark(s) to '{category}'")
@@ -10,6 +10,7 @@ class ThemeActionsMixin:
 
     def _on_theme_change(self, theme_name: str):
         """Handle theme change - apply live"""
+        self.theme = get_theme()
         self._apply_theme_live()
         self._set_status(f"Theme changed to {theme_name}")
     
@@ -18,7 +19,7 @@ class ThemeActionsMixin:
         if not hasattr(self, 'main_container'):
             return
 
-        theme = get_theme()
+        theme = self.theme
         status_text = "Ready"
         try:
             status_text = self.status_label.cget("text") or status_text
@@ -85,6 +86,7 @@ class ThemeActionsMixin:
             self._suppress_search_callback = False
 
         self._refresh_all()
+        self._flush_refresh()
         try:
             self.tree.restore_sort_state(*table_sort_state)
         except Exception:
@@ -93,7 +95,7 @@ class ThemeActionsMixin:
             self._set_filter_visual(filter_name, filter_name == active_filter)
         valid_selection = [
             str(bookmark_id) for bookmark_id in selected_ids
-            if str(bookmark_id) in self.tree.get_children("")
+            if self._has_table_row(bookmark_id)
         ]
         if valid_selection:
             self.tree.selection_set(valid_selection)
@@ -17,6 +17,12 @@ except ImportError:  # pragma: no cover - optional runtime dependency
 from bookmark_organizer_pro.constants import DATA_DIR
 from bookmark_organizer_pro.core.category_manager import get_category_icon
 from bookmark_organizer_pro.i18n import _
+from bookmark_organizer_pro.link_checker import (
+    HostSlots,
+    group_bookmarks_by_url,
+    interleave_by_host,
+    probe_url,
+)
 from bookmark_organizer_pro.logging_config import log
 from bookmark_organizer_pro.models import Category
 from bookmark_organizer_pro.services.favicons import (
@@ -59,6 +65,16 @@ from bookmark_organizer_pro.ui.widgets import (
 )
 from bookmark_organizer_pro.url_utils import URLUtilities
 
+# Link checks spend nearly all their time waiting on the network, so the run
+# keeps many requests in flight; the keep-alive pool is sized to match.
+LINK_CHECK_WORKERS = 32
+# Requests in flight against any one host; the rest of the pool works on
+# other hosts meanwhile instead of hammering a dominant one.
+LINK_CHECK_PER_HOST = 2
+# Seconds between checkpoint saves of link-check results; each save rewrites
+# the whole library on the UI thread, so it is paced by time, not row count.
+LINK_CHECK_SAVE_INTERVAL = 10.0
+
 
 class ToolsActionsMixin:
     """Tools menu, maintenance, and utility actions used by the app coordinator."""
@@ -637,6 +653,27 @@ class ToolsActionsMixin:
                 parent=self.root
             )
 
+    def _apply_link_check_rows(self, rows):
+        """Write one batch of link results in place; returns (checked, broken).
+
+        Cached library views are dropped right away so filters see the new
+        status; the disk write is left to the caller's checkpoint.
+        """
+        checked = broken = 0
+        checked_at = datetime.now().isoformat()
+        for bm_id, http_status, is_valid in rows:
+            bm = self.bookmark_manager.get_bookmark(bm_id)
+            if bm:
+                bm.http_status = http_status
+                bm.is_valid = is_valid
+                bm.last_checked = checked_at
+                if not is_valid:
+                    broken += 1
+                checked += 1
+        if checked:
+            self.bookmark_manager.invalidate_views()
+        return checked, broken
+
     def _check_all_links(self):
         """Check all links - non-blocking with cancel support"""
         if requests is None:
@@ -694,46 +731,74 @@ class ToolsActionsMixin:
         checked_count = [0]
         
         import threading
+        import time
+
+        last_save = [time.monotonic()]
 
-        def _check_one(bm):
+        host_slots = HostSlots(LINK_CHECK_PER_HOST)
+
+        def _check_one(client, group):
+            url = group[0].url
             status = 0
             valid = False
             try:
-                if URLUtilities._is_safe_url(bm.url):
-                    response = requests.head(bm.url, timeout=5, allow_redirects=False, headers={'User-Agent': 'BookmarkOrganizerPro/6.0 LinkChecker'})
+                if URLUtilities._is_safe_url(url):
+                    with host_slots.hold(url):
+                        response = probe_url(client, url, timeout=5, headers={'User-Agent': 'BookmarkOrganizerPro/6.0 LinkChecker'})
                     status = response.status_code
                     valid = response.status_code < 400
             except Exception:
                 pass
-            return bm.id, status, valid
+            return [(bm.id, status, valid) for bm in group]
 
         def _worker():
             from concurrent.futures import ThreadPoolExecutor, as_completed
-            with ThreadPoolExecutor(max_workers=5) as pool:
-                futures = {pool.submit(_check_one, bm): bm for bm in bookmarks}
-                for future in as_completed(futures):
-                    if self._link_check_cancelled:
-                        pool.shutdown(wait=False, cancel_futures=True)
-                        break
-                    bm_id, http_status, is_valid = future.result()
-                    self._post_to_ui(lambda bid=bm_id, hs=http_status, iv=is_valid: _apply_result(bid, hs, iv))
-
+            from bookmark_organizer_pro.services.egress import BoundedEgressClient
+
+            # One keep-alive pool for the run, sized for the hosts it touches.
+            client = BoundedEgressClient(pool_connections=64, pool_maxsize=LINK_CHECK_WORKERS)
+            # Results reach the UI in batches, at most ~30 per second, rather
+            # than as one Tk callback and progress repaint per URL.
+            pending = []
+            last_post = 0.0
+            try:
+                # Each distinct URL is fetched once; its result is applied to
+                # every bookmark that shares it. Submitting round-robin across
+                # hosts keeps workers off a busy host's slots.
+                groups = group_bookmarks_by_url(bookmarks)
+                firsts = interleave_by_host([group[0] for group in groups.values()])
+                with ThreadPoolExecutor(max_workers=LINK_CHECK_WORKERS) as pool:
+                    futures = [pool.submit(_check_one, client, groups[bm.url]) for bm in firsts]
+                    for future in as_completed(futures):
+                        if self._link_check_cancelled:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            break
+                        pending.extend(future.result())
+                        now = time.monotonic()
+                        if now - last_post >= 1 / 30:
+                            last_post = now
+                            batch, pending = pending, []
+                            self._post_to_ui(lambda rows=batch: _apply_results(rows))
+            finally:
+                client.close()
+
+            if pending:
+                self._post_to_ui(lambda rows=pending: _apply_results(rows))
             self._post_to_ui(_finish)
 
-        def _apply_result(bm_id, http_status, is_valid):
-            bm = self.bookmark_manager.get_bookmark(bm_id)
-            if bm:
-                bm.http_status = http_status
-                bm.is_valid = is_valid
-                bm.last_checked = datetime.now().isoformat()
-                if not is_valid:
-                    broken_count[0] += 1
-                checked_count[0] += 1
-                progress = checked_count[0] / len(bookmarks)
-                progress_fill.place(relwidth=progress)
-                progress_label.configure(text=format_message('Checked {value_0}/{value_1} - {value_2} broken', value_0=checked_count[0], value_1=len(bookmarks), value_2=broken_count[0]))
-                if checked_count[0] % 20 == 0:
-                    self.bookmark_manager.save_bookmarks()
+        def _apply_results(rows):
+            checked, broken = self._apply_link_check_rows(rows)
+            if not checked:
+                return
+            checked_count[0] += checked
+            broken_count[0] += broken
+            progress = checked_count[0] / len(bookmarks)
+            progress_fill.place(relwidth=progress)
+            progress_label.configure(text=format_message('Checked {value_0}/{value_1} - {value_2} broken', value_0=checked_count[0], value_1=len(bookmarks), value_2=broken_count[0]))
+            now = time.monotonic()
+            if now - last_save[0] >= LINK_CHECK_SAVE_INTERVAL:
+                last_save[0] = now
+                self.bookmark_manager.save_bookmarks()
 
         def _finish():
             self.bookmark_manager.save_bookmarks()
@@ -771,13 +836,10 @@ class ToolsActionsMixin:
                     "No changes made because a recovery safepoint could not be created.",
                     retryable=True,
                 )
-            removed = 0
-            for group in selected:
-                for bm in list(group)[1:]:
-                    if self.bookmark_manager.delete_bookmark(bm.id):
-                        removed += 1
+            removed = self.bookmark_manager.delete_bookmarks(
+                bm.id for group in selected for bm in list(group)[1:]
+            )
             if removed:
-                self.bookmark_manager.save_bookmarks()
                 self._refresh_all()
             self._set_status(f"Removed {removed} duplicates; restore available from Tools")
             self._toast(f"Removed {removed} duplicate bookmarks; safepoint ready", "success")
@@ -843,17 +905,13 @@ class ToolsActionsMixin:
                     "No changes made because a recovery safepoint could not be created.",
                     retryable=True,
                 )
-            removed = 0
+            extra_ids = []
             for group in selected:
                 ids = [int(bookmark_id) for bookmark_id in getattr(group, "bookmark_ids", [])]
                 canonical_id = int(getattr(group, "canonical_id", ids[0]))
-                for bookmark_id in ids:
-                    if bookmark_id == canonical_id:
-                        continue
-                    if self.bookmark_manager.delete_bookmark(bookmark_id):
-                        removed += 1
+                extra_ids.extend(bookmark_id for bookmark_id in ids if bookmark_id != canonical_id)
+            removed = self.bookmark_manager.delete_bookmarks(extra_ids)
             if removed:
-                self.bookmark_manager.save_bookmarks()
                 self._refresh_all()
             self._set_status(f"Smart duplicates: removed {removed}; restore available from Tools")
             self._toast(f"Removed {removed} smart duplicate bookmark(s); safepoint ready", "success")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from operator import itemgetter
 from pathlib import Path
 import sys
 from typing import List
@@ -818,7 +819,7 @@ Examples:
         counts = self.bookmark_manager.get_category_counts()
 
         print(f"\nCategories ({len(counts)}):")
-        for cat, count in sorted(counts.items(), key=lambda x: -x[1]):
+        for cat, count in sorted(counts.items(), key=itemgetter(1), reverse=True):
             icon = get_category_icon(cat)
             print(f"  {icon} {cat}: {count}")
 
@@ -827,7 +828,7 @@ Examples:
         counts = self.bookmark_manager.get_tag_counts()
 
         print(f"\nTags ({len(counts)}):")
-        for tag, count in sorted(counts.items(), key=lambda x: -x[1])[:30]:
+        for tag, count in sorted(counts.items(), key=itemgetter(1), reverse=True)[:30]:
             print(f"  #{tag}: {count}")
 
     def _cmd_stats(self, ns: argparse.Namespace):
@@ -855,6 +856,7 @@ Top Domains:
 
     def _cmd_check(self, ns: argparse.Namespace):
         """Check for broken links (multi-threaded)"""
+        from bookmark_organizer_pro.link_checker import probe_url
         from bookmark_organizer_pro.services.egress import public_egress as requests
         from concurrent.futures import ThreadPoolExecutor, as_completed
         bookmarks = self.bookmark_manager.get_all_bookmarks()
@@ -866,12 +868,11 @@ Top Domains:
             try:
                 if not URLUtilities._is_safe_url(bm.url):
                     return bm.id, 0, False
-                response = requests.head(
-                    bm.url, timeout=5, allow_redirects=False,
+                response = probe_url(
+                    requests, bm.url, timeout=5,
                     headers={"User-Agent": "BookmarkOrganizerPro/6.2 LinkChecker"},
                 )
                 status = response.status_code
-                response.close()
                 return bm.id, status, status < 400
             except Exception:
                 return bm.id, 0, False
@@ -1338,7 +1339,11 @@ Top Domains:
             return bool(metadata.get("title") or metadata.get("description")), "metadata refreshed"
         if record.job_type == "link_check":
             from bookmark_organizer_pro.link_checker import LinkChecker
-            valid, status = LinkChecker()._check_url(bookmark)
+            checker = LinkChecker()
+            try:
+                valid, status = checker.check_url(bookmark)
+            finally:
+                checker.close()
             bookmark.is_valid = valid
             bookmark.http_status = status
             self.bookmark_manager.save_bookmarks()
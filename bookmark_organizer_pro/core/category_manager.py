@@ -150,8 +150,25 @@ class CategoryManager:
         # iteration" while one mutates and the other reads. Reentrant because
         # mutators call save/rebuild which also acquire it.
         self._lock = threading.RLock()
+        # Bumped on every persisted or pattern-affecting change. External
+        # callers that edit ``categories`` directly always follow up with
+        # save_categories(), which invalidates the derived caches too.
+        self._version = 0
+        self._tree_cache: Optional[List[Tuple[Category, int]]] = None
+        self._sorted_cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
         self._load_categories()
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter that changes whenever the category set may have."""
+        return self._version
+
+    def _invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._tree_cache = None
+            self._sorted_cache = None
+
     def _load_categories(self):
         """Load categories from disk, or initialize defaults."""
         if self.filepath.exists():
@@ -229,12 +246,14 @@ class CategoryManager:
 
     def _rebuild_patterns(self):
         """Recompile the PatternEngine from current categories."""
+        self._invalidate()
         with self._lock:
             patterns_dict = {cat.full_path: _clean_patterns(cat.patterns) for cat in self.categories.values()}
         self.pattern_engine = PatternEngine(patterns_dict)
 
     def save_categories(self):
         """Persist categories to disk."""
+        self._invalidate()
         try:
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
             with self._lock:
@@ -395,19 +414,40 @@ class CategoryManager:
         return descendants
 
     def get_sorted_categories(self) -> List[str]:
-        """Alphabetically sorted with 'Uncategorized' last."""
+        """Alphabetically sorted with 'Uncategorized' last.
+
+        The ordering is cached per category version (and size, so a direct
+        dict edit not yet followed by a save still shows up).
+        """
         with self._lock:
+            key = (self._version, len(self.categories))
+            cached = self._sorted_cache
+            if cached is not None and cached[0] == key:
+                return list(cached[1])
             names = list(self.categories.keys())
         uncategorized = [c for c in names if "Uncategorized" in c]
         regular = sorted([c for c in names if "Uncategorized" not in c])
-        return regular + uncategorized
+        ordered = regular + uncategorized
+        with self._lock:
+            if (self._version, len(self.categories)) == key:
+                self._sorted_cache = (key, ordered)
+        return list(ordered)
 
     def get_all_categories(self) -> List[str]:
         with self._lock:
             return list(self.categories.keys())
 
     def get_tree(self) -> List[Tuple[Category, int]]:
-        """Flat list of (category, depth) pairs in tree order."""
+        """Flat list of (category, depth) pairs in tree order.
+
+        The flattened tree is cached until the next category change.
+        """
+        with self._lock:
+            cached = self._tree_cache
+            version = self._version
+        if cached is not None:
+            return list(cached)
+
         result = []
 
         with self._lock:
@@ -429,7 +469,10 @@ class CategoryManager:
         for root in self.get_root_categories():
             visit(root, 0)
 
-        return result
+        with self._lock:
+            if self._version == version:
+                self._tree_cache = result
+        return list(result)
 
     def merge_categories(self, source: str, target: str) -> bool:
         """Merge source into target: move children, combine patterns, delete source."""
@@ -1,9 +1,12 @@
 """Background link checker with threading, redirect detection, and per-domain rate limiting."""
 
+import contextlib
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from itertools import chain, zip_longest
 from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
@@ -12,13 +15,133 @@ from .models import Bookmark
 from .url_utils import URLUtilities
 
 _USER_AGENT = f"BookmarkOrganizerPro/{APP_VERSION} LinkChecker"
+_NO_BOOKMARK = object()
+_REDIRECT_KEYS = ("redirect_url", "redirect_count", "redirect_chain")
+# Transport failures in a row (unreachable, timeout, TLS failure) after which
+# a host is treated as down for the rest of the run.
+_DEAD_HOST_FAILURES = 3
+_HEAD_REFUSED_STATUSES = (403, 405, 501)
+_PROGRESS_INTERVAL_SECONDS = 1 / 30
+# Default run budget: a fixed floor plus a typical per-check cost for the
+# longest queue, either per worker or on the busiest (rate-limited) host.
+_RUN_BUDGET_FLOOR_SECONDS = 120.0
+_RUN_BUDGET_PER_CHECK_SECONDS = 2.0
+# How long a stored result is trusted before the URL is fetched again.
+_RECHECK_OK_AFTER_SECONDS = 24 * 3600
+_RECHECK_FAILED_AFTER_SECONDS = 3600
+
+
+def probe_url(client, url: str, *, timeout: float = 10,
+              headers: Optional[Dict[str, str]] = None,
+              before_get: Optional[Callable[[], None]] = None):
+    """Ask ``url`` for its status without downloading the body.
+
+    Sends HEAD; servers that refuse HEAD get a streamed GET for a single byte
+    instead. The response is closed before it is returned, so its connection
+    goes back to the pool; status and headers stay readable. ``before_get``
+    runs before the fallback request (used for per-host pacing).
+    """
+    response = client.head(url, timeout=timeout, allow_redirects=False, headers=headers)
+    response.close()
+    if response.status_code in _HEAD_REFUSED_STATUSES:
+        if before_get is not None:
+            before_get()
+        response = client.get(
+            url, timeout=timeout, allow_redirects=False, stream=True,
+            headers={**(headers or {}), 'Range': 'bytes=0-0'},
+        )
+        response.close()
+    return response
+
+
+def group_bookmarks_by_url(bookmarks: List[Bookmark]) -> Dict[str, List[Bookmark]]:
+    """Group bookmarks sharing a URL so each distinct URL is fetched once."""
+    groups: Dict[str, List[Bookmark]] = {}
+    for bookmark in bookmarks:
+        groups.setdefault(bookmark.url, []).append(bookmark)
+    return groups
+
+
+def has_fresh_result(group: List[Bookmark], now: datetime) -> bool:
+    """Whether every bookmark in ``group`` carries a recent enough check result.
+
+    Working links are trusted for a day, failures for an hour, so a repeat
+    run only refetches URLs whose stored result has gone stale.
+    """
+    for bookmark in group:
+        checked = Bookmark._parse_iso_naive(bookmark.last_checked) if bookmark.last_checked else None
+        if checked is None:
+            return False
+        ok = bookmark.is_valid and 0 < bookmark.http_status < 400
+        limit = _RECHECK_OK_AFTER_SECONDS if ok else _RECHECK_FAILED_AFTER_SECONDS
+        if not 0 <= (now - checked).total_seconds() < limit:
+            return False
+    return True
+
+
+def share_redirect_metadata(group: List[Bookmark]) -> None:
+    """Copy the checked bookmark's redirect fields onto its URL duplicates."""
+    checked = group[0].custom_data
+    redirect = {key: checked[key] for key in _REDIRECT_KEYS if key in checked}
+    for duplicate in group[1:]:
+        for key in _REDIRECT_KEYS:
+            duplicate.custom_data.pop(key, None)
+        duplicate.custom_data.update(redirect)
+
+
+def interleave_by_host(bookmarks: List[Bookmark]) -> List[Bookmark]:
+    """Order bookmarks round-robin across hosts, keeping each host's order.
+
+    Checks are rate limited per host, so a run of same-host bookmarks would
+    park every worker on that host's lock while other hosts sit idle.
+    """
+    by_host: Dict[str, List[Bookmark]] = {}
+    for bookmark in bookmarks:
+        try:
+            host = urlparse(bookmark.url).hostname or ""
+        except Exception:
+            host = ""
+        by_host.setdefault(host, []).append(bookmark)
+    if len(by_host) < 2:
+        return list(bookmarks)
+    rounds = zip_longest(*by_host.values(), fillvalue=_NO_BOOKMARK)
+    return [bookmark for bookmark in chain.from_iterable(rounds) if bookmark is not _NO_BOOKMARK]
+
+
+class HostSlots:
+    """Cap how many requests run against any one host at the same time.
+
+    A wide worker pool would otherwise put every worker on the same host
+    whenever the library is dominated by one site, which provokes 429s and
+    403s that read as broken links.
+    """
+
+    def __init__(self, per_host: int = 2):
+        self.per_host = max(1, int(per_host))
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextlib.contextmanager
+    def hold(self, url: str):
+        """Block until ``url``'s host has a free slot, and keep it for the block."""
+        try:
+            host = urlparse(url).hostname or ""
+        except Exception:
+            host = ""
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self.per_host)
+        with slot:
+            yield
 
 
 class LinkChecker:
     """Background link checker with threading and per-domain rate limiting."""
 
     def __init__(self, callback: Callable = None, max_workers: int = 10,
-                 job_ledger=None):
+                 job_ledger=None, time_budget: Optional[float] = None,
+                 reuse_recent: bool = False):
         from .services.job_ledger import JobLedger
 
         self.callback = callback
@@ -26,15 +149,87 @@ class LinkChecker:
             self.max_workers = max(1, min(32, int(max_workers)))
         except (TypeError, ValueError):
             self.max_workers = 10
-        self._executor: Optional[ThreadPoolExecutor] = None
+        # The worker pool and keep-alive client are created on first use, so
+        # a checker used for a single URL never starts threads.
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._http = None
+        # Set by stop()/close(); cleared when a new run or check starts, so
+        # probes abandoned by the old run cannot open a client nobody closes.
+        self._closed = False
+        self._futures: Dict = {}
+        # Bumped when a run ends; checks submitted under an older value were
+        # abandoned and must leave their bookmark alone. Pool threads record
+        # the value their current check was submitted under.
+        self._generation = 0
+        self._submitted = threading.local()
         self._running = False
         self._checked = 0
         self._total = 0
+        self._timed_out = False
+        # Seconds one run may take before unfinished checks are abandoned;
+        # None derives a budget from the run's size.
+        self.time_budget = time_budget
+        # Opt-in: skip URLs whose bookmarks already hold a fresh result, for
+        # repeat background runs. Explicit checks always refetch.
+        self.reuse_recent = reuse_recent
         self._lock = threading.Lock()
-        self._domain_locks: Dict[str, threading.Lock] = {}
         self._domain_last_request: Dict[str, float] = {}
+        self._host_failures: Dict[str, int] = {}
         self.job_ledger = job_ledger or JobLedger()
 
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """One pool kept warm across runs until close()."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="linkcheck",
+                )
+            return self._pool
+
+    @property
+    def _client(self):
+        """Dedicated keep-alive client, reopened by the next run after stop().
+
+        The shared client only keeps ten host pools warm, far fewer than the
+        hosts one library check touches.
+        """
+        from .services.egress import BoundedEgressClient
+
+        with self._lock:
+            if self._http is None:
+                if self._closed:
+                    raise RuntimeError("link checker was stopped")
+                self._http = BoundedEgressClient(
+                    pool_connections=64, pool_maxsize=max(20, self.max_workers),
+                )
+                self._http.session.headers["User-Agent"] = _USER_AGENT
+            return self._http
+
+    def _reopen(self):
+        with self._lock:
+            self._closed = False
+
+    def submit_check(self, bookmark: Bookmark) -> Future:
+        """Queue one check of ``bookmark`` on the checker's worker pool.
+
+        The future resolves to ``(is_valid, status_code)``.
+        """
+        self._reopen()
+        return self._executor.submit(self._check_submitted, bookmark, self._generation)
+
+    def _check_submitted(self, bookmark: Bookmark, generation: int) -> Tuple[bool, int]:
+        self._submitted.generation = generation
+        try:
+            return self._check_url(bookmark)
+        finally:
+            self._submitted.generation = None
+
+    def check_url(self, bookmark: Bookmark) -> Tuple[bool, int]:
+        """Check ``bookmark`` on the calling thread; returns (is_valid, status_code)."""
+        self._reopen()
+        return self._check_url(bookmark)
+
     def check_links(self, bookmarks: List[Bookmark],
                    progress_callback: Callable = None):
         """Start checking links in background"""
@@ -45,8 +240,9 @@ class LinkChecker:
         self._running = True
         self._checked = 0
         self._total = len(bookmarks)
-        self._domain_locks.clear()
-        self._domain_last_request.clear()
+        self._timed_out = False
+        self.reset_host_state()
+        self._reopen()
 
         thread = threading.Thread(
             target=self._worker,
@@ -57,39 +253,119 @@ class LinkChecker:
 
     def _worker(self, bookmarks: List[Bookmark], progress_callback: Callable):
         """Worker thread"""
+        # Duplicate URLs (common after imports) are fetched once and the result
+        # is fanned back out to every bookmark that shares the URL.
+        groups = group_bookmarks_by_url(bookmarks)
+        if self.reuse_recent:
+            started = datetime.now()
+            fresh = [url for url, group in groups.items() if has_fresh_result(group, started)]
+            for url in fresh:
+                self._checked += len(groups.pop(url))
+            if fresh and progress_callback:
+                progress_callback(self._checked, self._total, bookmarks[-1])
+        firsts = interleave_by_host([group[0] for group in groups.values()])
+        deadline = time.monotonic() + self._run_budget(firsts)
         try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                self._executor = executor
-                futures = {
-                    executor.submit(self._check_url, bm): bm
-                    for bm in bookmarks
-                }
-
-                for future in as_completed(futures):
+            futures = {self.submit_check(bm): groups[bm.url] for bm in firsts}
+            self._futures = futures
+
+            # Results are applied on this thread only, so the counter needs
+            # no lock; progress is reported at most ~30 times per second.
+            last_report = 0.0
+            # last_checked only needs second precision, so one formatted
+            # timestamp is shared by every result within the same second.
+            stamped_at, stamp = -1.0, ""
+            group = None
+            try:
+                for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
                     if not self._running:
                         break
 
-                    bookmark = futures[future]
-                    with self._lock:
-                        try:
-                            is_valid, status_code = future.result()
-                            bookmark.is_valid = is_valid
-                            bookmark.http_status = status_code
-                            bookmark.last_checked = datetime.now().isoformat()
-                        except Exception:
-                            bookmark.is_valid = False
-                            bookmark.http_status = 0
-                        self._checked += 1
-                        checked = self._checked
-                        total = self._total
+                    group = futures[future]
+                    try:
+                        is_valid, status_code = future.result()
+                        now = time.monotonic()
+                        if now - stamped_at >= 1.0:
+                            stamped_at, stamp = now, datetime.now().isoformat()
+                        checked_at = stamp
+                    except Exception:
+                        is_valid, status_code, checked_at = False, 0, None
+                    for bookmark in group:
+                        bookmark.is_valid = is_valid
+                        bookmark.http_status = status_code
+                        if checked_at:
+                            bookmark.last_checked = checked_at
+                    if len(group) > 1:
+                        with self._lock:
+                            share_redirect_metadata(group)
+                    self._checked += len(group)
                     if progress_callback:
-                        progress_callback(checked, total, bookmark)
+                        now = time.monotonic()
+                        if self._checked >= self._total or now - last_report >= _PROGRESS_INTERVAL_SECONDS:
+                            last_report = now
+                            progress_callback(self._checked, self._total, group[-1])
+            except FuturesTimeoutError:
+                # Out of budget: bookmarks still pending keep their previous
+                # check results rather than holding the run open.
+                self._timed_out = True
+                if progress_callback and group is not None:
+                    progress_callback(self._checked, self._total, group[-1])
         finally:
+            # Drop checks that never started. Abandoned in-flight requests are
+            # bounded by their own timeout and no longer write any result.
+            with self._lock:
+                self._generation += 1
+            self._cancel_pending()
+            self._futures = {}
             self._running = False
-            self._executor = None
             if self.callback:
                 self.callback()
 
+    def _run_budget(self, bookmarks: List[Bookmark]) -> float:
+        """Seconds one run may take, explicit or derived from its size."""
+        if self.time_budget is not None:
+            return max(0.0, float(self.time_budget))
+        per_host: Dict[str, int] = {}
+        for bookmark in bookmarks:
+            host = self._host_of(bookmark.url)
+            per_host[host] = per_host.get(host, 0) + 1
+        longest = max(-(-len(bookmarks) // self.max_workers), max(per_host.values(), default=0))
+        return _RUN_BUDGET_FLOOR_SECONDS + _RUN_BUDGET_PER_CHECK_SECONDS * longest
+
+    def reset_host_state(self):
+        """Forget per-host pacing and dead-host tracking before a new scan."""
+        with self._lock:
+            self._domain_last_request.clear()
+            self._host_failures.clear()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        try:
+            return urlparse(url).hostname or ""
+        except Exception:
+            return ""
+
+    def _is_dead_host(self, url: str) -> bool:
+        host = self._host_of(url)
+        with self._lock:
+            return bool(host) and self._host_failures.get(host, 0) >= _DEAD_HOST_FAILURES
+
+    def _record_host_outcome(self, url: str, answered: bool):
+        """Count hosts that keep failing without any HTTP response.
+
+        Only the transport decides: any HTTP answer (a real 408 included)
+        proves the host is up, and URLs refused before a request was sent
+        say nothing about the host at all.
+        """
+        host = self._host_of(url)
+        if not host:
+            return
+        with self._lock:
+            if answered:
+                self._host_failures.pop(host, None)
+            else:
+                self._host_failures[host] = self._host_failures.get(host, 0) + 1
+
     def _rate_limit(self, url: str):
         """Per-domain rate limiting: max 1 request/second/domain."""
         try:
@@ -98,14 +374,15 @@ class LinkChecker:
             domain = ""
         if not domain:
             return
-        # setdefault is atomic in CPython, avoiding the defaultdict race
-        lock = self._domain_locks.setdefault(domain, threading.Lock())
-        with lock:
-            last = self._domain_last_request.get(domain, 0)
-            elapsed = time.monotonic() - last
-            if elapsed < 1.0:
-                time.sleep(1.0 - elapsed)
-            self._domain_last_request[domain] = time.monotonic()
+        # Reserve the host's next one-second slot under the shared lock, then
+        # sleep outside it. Workers queued on one host each wake once at their
+        # own slot instead of convoying through a per-host lock.
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._domain_last_request.get(domain, now - 1.0) + 1.0)
+            self._domain_last_request[domain] = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def _check_url(self, bookmark: Bookmark) -> Tuple[bool, int]:
         job = self.job_ledger.start(
@@ -121,11 +398,16 @@ class LinkChecker:
 
     def _perform_check_url(self, bookmark: Bookmark) -> Tuple[bool, int]:
         """Check a single URL. Detects redirects; returns (is_valid, status_code).
-        Redirect metadata is stored on bookmark.custom_data under the lock."""
+        Redirect metadata is stored on bookmark.custom_data under the lock.
+        URLs on a host that already failed repeatedly without answering are
+        reported unreachable immediately instead of waiting out another timeout."""
+        if self._is_dead_host(bookmark.url):
+            return False, 0
+        generation = getattr(self._submitted, "generation", None)
+        if generation is None:
+            generation = self._generation
+        current_url = bookmark.url
         try:
-            from .services.egress import public_egress as requests
-            headers = {'User-Agent': _USER_AGENT}
-            current_url = bookmark.url
             redirects = []
             response = None
 
@@ -135,23 +417,14 @@ class LinkChecker:
                     return False, 0
 
                 self._rate_limit(current_url)
-
-                response = requests.head(
-                    current_url, timeout=10,
-                    allow_redirects=False, headers=headers,
+                response = probe_url(
+                    self._client, current_url, timeout=10,
+                    before_get=lambda url=current_url: self._rate_limit(url),
                 )
-
-                if response.status_code in (405, 403):
-                    response.close()
-                    self._rate_limit(current_url)
-                    response = requests.get(
-                        current_url, timeout=10,
-                        allow_redirects=False, stream=True, headers=headers,
-                    )
+                self._record_host_outcome(current_url, answered=True)
 
                 if response.status_code in (301, 302, 303, 307, 308):
                     location = response.headers.get('Location', '')
-                    response.close()
                     if not location:
                         break
                     next_url = urljoin(current_url, location)
@@ -166,18 +439,18 @@ class LinkChecker:
                 break
 
             status_code = response.status_code if response is not None else 0
-            if response is not None:
-                response.close()
 
             if status_code in (301, 302, 303, 307, 308):
                 return False, status_code
 
             with self._lock:
-                if redirects and current_url != bookmark.url:
+                # A run that abandoned this check has already moved on.
+                current = generation == self._generation
+                if current and redirects and current_url != bookmark.url:
                     bookmark.custom_data['redirect_url'] = current_url
                     bookmark.custom_data['redirect_count'] = len(redirects)
                     bookmark.custom_data['redirect_chain'] = ' -> '.join(redirects[:5])
-                elif 'redirect_url' in bookmark.custom_data:
+                elif current and 'redirect_url' in bookmark.custom_data:
                     bookmark.custom_data.pop('redirect_url', None)
                     bookmark.custom_data.pop('redirect_count', None)
                     bookmark.custom_data.pop('redirect_chain', None)
@@ -186,10 +459,13 @@ class LinkChecker:
         except Exception as e:
             exc_type = type(e).__name__
             if 'Timeout' in exc_type:
+                self._record_host_outcome(current_url, answered=False)
                 return False, 408
             elif 'SSLError' in exc_type:
+                self._record_host_outcome(current_url, answered=False)
                 return False, 495
             elif 'ConnectionError' in exc_type:
+                self._record_host_outcome(current_url, answered=False)
                 return False, 0
             return False, 0
 
@@ -212,11 +488,30 @@ class LinkChecker:
         bookmark.modified_at = datetime.now().isoformat()
         return True
 
+    def _cancel_pending(self):
+        for future in list(self._futures):
+            future.cancel()
+
     def stop(self):
-        """Stop the checker"""
+        """Stop the current run; the checker can run again afterwards.
+
+        Closes the keep-alive client; the next run opens a fresh one.
+        """
         self._running = False
-        if self._executor:
-            self._executor.shutdown(wait=False)
+        self._cancel_pending()
+        with self._lock:
+            self._closed = True
+            client, self._http = self._http, None
+        if client is not None:
+            client.close()
+
+    def close(self):
+        """Stop and release the worker threads and connections."""
+        self.stop()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     @property
     def is_running(self) -> bool:
@@ -225,3 +520,8 @@ class LinkChecker:
     @property
     def progress(self) -> Tuple[int, int]:
         return self._checked, self._total
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the last run stopped at its time budget with checks pending."""
+        return self._timed_out
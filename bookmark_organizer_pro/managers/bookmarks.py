@@ -5,16 +5,21 @@ from __future__ import annotations
 import contextlib
 import copy
 import csv
+import heapq
 import html as html_module
 import json
 import os
 import tempfile
 import threading
-from collections import OrderedDict
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from itertools import compress
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     from bs4 import BeautifulSoup
@@ -25,7 +30,7 @@ from bookmark_organizer_pro.constants import APP_VERSION, MASTER_BOOKMARKS_FILE
 from bookmark_organizer_pro.core import CategoryManager, SQLiteStorageManager, StorageManager
 from bookmark_organizer_pro.logging_config import log
 from bookmark_organizer_pro.models import Bookmark
-from bookmark_organizer_pro.search import SearchEngine
+from bookmark_organizer_pro.search import SearchEngine, SearchQuery
 from bookmark_organizer_pro.services.extraction_templates import (
     format_structured_value,
     structured_metadata_fields,
@@ -46,6 +51,40 @@ from bookmark_organizer_pro.utils.runtime import csv_safe_cell as _csv_safe_cell
 from .tags import TagManager
 
 
+def _created_datetime(value: str) -> Optional[datetime]:
+    """Parse a stored ``created_at`` into a naive datetime, or ``None``."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class _LibraryColumns:
+    """Hot filter fields of one library snapshot, stored column-wise.
+
+    Every column is aligned with ``bookmarks``; the flag columns are byte
+    masks so filters run as a single ``itertools.compress`` pass.
+    """
+
+    bookmarks: Tuple[Bookmark, ...]
+    pinned: bytes
+    archived: bytes
+    broken: bytes
+    created: Tuple[Optional[datetime], ...]
+
+    @classmethod
+    def build(cls, bookmarks) -> "_LibraryColumns":
+        bookmarks = tuple(bookmarks)
+        return cls(
+            bookmarks=bookmarks,
+            pinned=bytes(bool(bm.is_pinned) for bm in bookmarks),
+            archived=bytes(bool(bm.is_archived) for bm in bookmarks),
+            broken=bytes(not bm.is_valid for bm in bookmarks),
+            created=tuple(_created_datetime(bm.created_at) for bm in bookmarks),
+        )
+
+
 class BookmarkManager:
     """
         Central manager for all bookmark operations.
@@ -82,6 +121,8 @@ class BookmarkManager:
         """
     
     SQLITE_SUFFIXES = {".sqlite", ".sqlite3", ".db"}
+    # Recent (query, category) results kept until the library changes.
+    SEARCH_RESULT_CACHE_SIZE = 32
 
     def __init__(self, category_manager: CategoryManager,
                  tag_manager: TagManager,
@@ -98,7 +139,13 @@ class BookmarkManager:
         self._batch_depth = 0
         self._batch_dirty = False
         self._batch_failed = False
+        # bookmark id -> visit times recorded with save=False, not yet persisted
+        self._pending_visits: Dict[int, List[str]] = {}
         self.search_engine = SearchEngine()
+        # (category/size/revision key, bookmark dict, query terms, matches)
+        self._last_search: Optional[tuple] = None
+        # name -> (size/revision key, bookmark dict, derived value)
+        self._view_cache: Dict[str, tuple] = {}
         self._load_bookmarks()
 
     @classmethod
@@ -155,10 +202,27 @@ class BookmarkManager:
                 self._assign_unique_id(bm)
                 self.bookmarks[bm.id] = bm
             self._committed_bookmarks = copy.deepcopy(self.bookmarks)
+            self._reapply_pending_visits()
 
     def _restore_committed_state(self) -> None:
         """Restore the last successfully persisted in-memory representation."""
         self.bookmarks = copy.deepcopy(self._committed_bookmarks)
+        self._reapply_pending_visits()
+
+    def _reapply_pending_visits(self) -> None:
+        """Carry unsaved visits over onto freshly loaded or restored bookmarks."""
+        pending = getattr(self, "_pending_visits", None)
+        if not pending:
+            return
+        for bookmark_id, visits in list(pending.items()):
+            bm = self.bookmarks.get(bookmark_id)
+            if bm is None:
+                del pending[bookmark_id]
+                continue
+            bm.visit_count += len(visits)
+            if not bm.last_visited or visits[-1] > bm.last_visited:
+                bm.last_visited = visits[-1]
+            bm.modified_at = max(bm.modified_at or "", visits[-1])
 
     def _mapping_from_snapshot(self, snapshot: List[Bookmark]) -> Dict[int, Bookmark]:
         """Validate stable bookmark identity and rebuild an ordered snapshot map."""
@@ -178,6 +242,8 @@ class BookmarkManager:
         self.bookmarks = mapping
         self._storage_revision = revision
         self._committed_bookmarks = copy.deepcopy(mapping)
+        if getattr(self, "_pending_visits", None):
+            self._pending_visits.clear()
         if hasattr(self, "_watch_revision"):
             self._watch_revision = revision
         if hasattr(self, "_watch_mtime"):
@@ -477,6 +543,39 @@ class BookmarkManager:
                 self._save_snapshot(snapshot)
         return bm
     
+    def record_visit(self, bookmark_id: int, save: bool = True) -> Optional[Bookmark]:
+        """Count one visit to a bookmark in place.
+
+        With save=False the visit is kept pending until save_pending_visits()
+        (or any other successful save); reloads in the meantime keep it.
+        """
+        if save and self._batch_depth == 0:
+            self._sync_before_write()
+        bookmark_id = self._coerce_bookmark_id(bookmark_id)
+        if bookmark_id is None:
+            return None
+        with self._lock:
+            bm = self.bookmarks.get(bookmark_id)
+            if bm is None:
+                return None
+            bm.record_visit()
+            if save:
+                snapshot = list(self.bookmarks.values())
+                self._save_snapshot(snapshot)
+            else:
+                self._pending_visits.setdefault(bookmark_id, []).append(bm.last_visited)
+        return bm
+
+    def save_pending_visits(self) -> bool:
+        """Persist visits deferred by record_visit(save=False) on the latest revision."""
+        with self._lock:
+            if not self._pending_visits:
+                return False
+            if self._batch_depth == 0:
+                self._sync_before_write()
+            self.save_bookmarks()
+        return True
+
     def delete_bookmark(self, bookmark_id: int) -> bool:
         """Delete a bookmark"""
         if self._batch_depth == 0:
@@ -491,6 +590,22 @@ class BookmarkManager:
                 self._save_snapshot(snapshot)
                 return True
         return False
+
+    def delete_bookmarks(self, bookmark_ids) -> int:
+        """Delete several bookmarks with one save; returns how many were removed."""
+        if self._batch_depth == 0:
+            self._sync_before_write()
+        ids = {self._coerce_bookmark_id(bookmark_id) for bookmark_id in bookmark_ids}
+        ids.discard(None)
+        with self._lock:
+            removed = 0
+            for bookmark_id in ids:
+                if self.bookmarks.pop(bookmark_id, None) is not None:
+                    removed += 1
+            if removed:
+                snapshot = list(self.bookmarks.values())
+                self._save_snapshot(snapshot)
+        return removed
     
     def get_bookmark(self, bookmark_id: int) -> Optional[Bookmark]:
         """Get a bookmark by ID"""
@@ -638,29 +753,46 @@ class BookmarkManager:
         """Get all bookmarks"""
         return self._iter_snapshot()
 
-    def get_pinned_bookmarks(self) -> List[Bookmark]:
-        """Get pinned bookmarks"""
-        return [bm for bm in self._iter_snapshot() if bm.is_pinned]
+    def _library_columns(self) -> _LibraryColumns:
+        """Column-wise view of the flag filters in library-list order.
 
-    def get_archived_bookmarks(self) -> List[Bookmark]:
-        """Get archived bookmarks"""
-        return [bm for bm in self._iter_snapshot() if bm.is_archived]
+        Cached between library changes, like the sorted list it is built from.
+        """
+        return self._cached_view(
+            "columns", lambda: _LibraryColumns.build(self._sorted_view())
+        )
 
-    def get_recent_bookmarks(self, days: int = 7) -> List[Bookmark]:
-        """Get recently added bookmarks"""
+    @staticmethod
+    def _in_category(bookmarks: Iterable[Bookmark], category: Optional[str]) -> List[Bookmark]:
+        if not category:
+            return list(bookmarks)
+        return [
+            bm for bm in bookmarks
+            if bm.category == category or bm.parent_category == category
+        ]
+
+    def get_pinned_bookmarks(self, category: str = None) -> List[Bookmark]:
+        """Get pinned bookmarks in library-list order"""
+        columns = self._library_columns()
+        return self._in_category(compress(columns.bookmarks, columns.pinned), category)
+
+    def get_archived_bookmarks(self, category: str = None) -> List[Bookmark]:
+        """Get archived bookmarks in library-list order"""
+        columns = self._library_columns()
+        return self._in_category(compress(columns.bookmarks, columns.archived), category)
+
+    def get_recent_bookmarks(self, days: int = 7, category: str = None) -> List[Bookmark]:
+        """Get recently added bookmarks, newest first"""
         try:
             days = max(0, int(days))
         except (TypeError, ValueError):
             days = 7
         cutoff = datetime.now() - timedelta(days=days)
-        results = []
-        for bm in self._iter_snapshot():
-            try:
-                created = datetime.fromisoformat(bm.created_at.replace('Z', '+00:00'))
-                if created.replace(tzinfo=None) > cutoff:
-                    results.append(bm)
-            except Exception:
-                pass
+        columns = self._library_columns()
+        results = self._in_category((
+            bm for bm, created in zip(columns.bookmarks, columns.created)
+            if created is not None and created > cutoff
+        ), category)
         return sorted(results, key=lambda x: x.created_at, reverse=True)
 
     def get_stale_bookmarks(self, days: int = 90) -> List[Bookmark]:
@@ -683,13 +815,66 @@ class BookmarkManager:
             reverse=True,
         )[:limit]
 
+    def invalidate_views(self) -> None:
+        """Drop cached views after bookmarks were edited in place without a save."""
+        with self._lock:
+            self._view_cache = {}
+            self._last_search = None
+
+    def _cached_view(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return ``build()``, reused until the library changes.
+
+        A change is a new bookmark dict, size or storage revision, which every
+        save, add/delete and reload produces. Open batches mutate without
+        saving, so they always rebuild. ``build`` runs under the lock.
+        """
+        with self._lock:
+            key = (len(self.bookmarks), getattr(self, "_storage_revision", 0))
+            cache = self.__dict__.setdefault("_view_cache", {})
+            cached = cache.get(name)
+            if (
+                cached is not None and cached[0] == key
+                and cached[1] is self.bookmarks and not self._batch_depth
+            ):
+                return cached[2]
+            value = build()
+            if self._batch_depth:
+                cache.pop(name, None)
+            else:
+                cache[name] = (key, self.bookmarks, value)
+            return value
+
     def get_category_counts(self) -> Dict[str, int]:
-        """Get bookmark count per category"""
+        """Get bookmark count per category.
+
+        The tally over all bookmarks is cached between library changes, so
+        repeated sidebar refreshes only merge it with the category list.
+        """
+        tally = self._cached_view(
+            "category_tally",
+            lambda: Counter(bm.category for bm in self.bookmarks.values()),
+        )
         counts = {cat: 0 for cat in self.category_manager.categories}
-        for bm in self._iter_snapshot():
-            counts[bm.category] = counts.get(bm.category, 0) + 1
+        counts.update(tally)
         return counts
 
+    def get_sorted_bookmarks(self, category: str = None) -> List[Bookmark]:
+        """Bookmarks pinned first, then by title, in library-list order.
+
+        The ordering is cached between library changes; a category filter
+        keeps it, so callers never need to sort again.
+        """
+        return self._in_category(self._sorted_view(), category)
+
+    def _sorted_view(self) -> List[Bookmark]:
+        return self._cached_view(
+            "sorted",
+            lambda: sorted(
+                self.bookmarks.values(),
+                key=lambda bm: (not bm.is_pinned, bm.title.lower()),
+            ),
+        )
+
     def get_tag_counts(self) -> Dict[str, int]:
         """Get bookmark count per tag"""
         counts: Dict[str, int] = {}
@@ -699,15 +884,102 @@ class BookmarkManager:
         return counts
     
     def search_bookmarks(self, query: str, category: str = None) -> List[Bookmark]:
-        """Search bookmarks with advanced query"""
-        if category:
+        """Search bookmarks with advanced query.
+
+        Search-as-you-type mostly extends the previous query. When both are
+        plain ANDed words and every earlier word is contained in a new one,
+        the new matches are a subset of the old, so only the previous
+        matches are scanned while the library itself is unchanged.
+
+        Results for the last ``SEARCH_RESULT_CACHE_SIZE`` queries are kept
+        until the library changes, so revisiting a query (backspacing,
+        switching filters back) skips the search entirely. Queries whose
+        matches move with the clock (is:recent, is:stale) are not kept, and
+        the rest expire at midnight since ranking favours younger bookmarks.
+        """
+        parsed = SearchQuery(query)
+        cache_key = (query, category, date.today())
+        cacheable = not parsed.time_relative
+        with self._lock:
+            results_cache = self._cached_view("search_results", OrderedDict)
+            hit = results_cache.get(cache_key) if cacheable else None
+            if hit is not None:
+                results_cache.move_to_end(cache_key)
+                self.search_engine.last_diagnostics = []
+                return list(hit)
+        terms = parsed.plain_terms
+        with self._lock:
+            library = self.bookmarks
+            key = (category, len(library), getattr(self, "_storage_revision", 0))
+            narrowable = bool(terms) and self._batch_depth == 0
+        previous = getattr(self, "_last_search", None)
+        if (
+            narrowable and previous is not None
+            and previous[0] == key and previous[1] is library
+            and all(any(old in new for new in terms) for old in previous[2])
+        ):
+            bookmarks = previous[3]
+        elif category:
             bookmarks = self.get_bookmarks_by_category(category)
+        elif narrowable:
+            bookmarks = self._corpus_candidates(max(terms, key=len))
         else:
             bookmarks = self.get_all_bookmarks()
-        
-        results = self.search_engine.search(bookmarks, query)
-        return [bm for bm, score in results]
+
+        results = [bm for bm, score in self.search_engine.search(bookmarks, query)]
+        self._last_search = None
+        if narrowable:
+            matched = {id(bm) for bm in results}
+            self._last_search = (
+                key, library, terms, [bm for bm in bookmarks if id(bm) in matched],
+            )
+        # Diagnosed queries (bad syntax, regex timeouts) are not cached.
+        if cacheable and not self.search_engine.last_diagnostics:
+            with self._lock:
+                results_cache[cache_key] = tuple(results)
+                if len(results_cache) > self.SEARCH_RESULT_CACHE_SIZE:
+                    results_cache.popitem(last=False)
+        return results
     
+    def _search_corpus(self) -> Tuple[Tuple[Bookmark, ...], List[int], str]:
+        """Every bookmark's search blob joined into one string.
+
+        Returns ``(bookmarks, starts, corpus)`` where ``starts[i]`` is the
+        offset of ``bookmarks[i]``'s blob; cached between library changes.
+        """
+        def build():
+            bookmarks = tuple(self.bookmarks.values())
+            starts, parts, offset = [], [], 0
+            for bm in bookmarks:
+                text = bm.search_blob()[0]
+                starts.append(offset)
+                parts.append(text)
+                offset += len(text) + 1
+            return bookmarks, starts, "\0".join(parts)
+
+        return self._cached_view("search_corpus", build)
+
+    def _corpus_candidates(self, term: str) -> List[Bookmark]:
+        """Bookmarks, in library order, whose search blob may contain ``term``.
+
+        One ``str.find`` walk over the joined corpus replaces a Python-level
+        loop over every bookmark; after each hit the scan resumes at the next
+        blob. A hit straddling two blobs only adds a candidate, which the
+        full query check then rejects.
+        """
+        bookmarks, starts, corpus = self._search_corpus()
+        found = []
+        find = corpus.find
+        last = len(starts) - 1
+        pos = find(term) if term else -1
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            found.append(bookmarks[index])
+            if index == last:
+                break
+            pos = find(term, starts[index + 1])
+        return found
+
     def find_duplicates(self) -> Dict[str, List[Bookmark]]:
         """Find duplicate bookmarks using normalized URLs.
 
@@ -772,7 +1044,7 @@ class BookmarkManager:
     def get_health_scores(self) -> List[Tuple[Bookmark, int]]:
         """Get health scores for all bookmarks, sorted worst-first."""
         scored = [(bm, calculate_health_score(bm)) for bm in self._iter_snapshot()]
-        return sorted(scored, key=lambda x: x[1])
+        return sorted(scored, key=itemgetter(1))
 
     def fetch_metadata_for_bookmark(self, bookmark_id: int) -> bool:
         """Fetch and update title/description/favicon from the live URL.
@@ -1007,9 +1279,10 @@ class BookmarkManager:
                 ReadLaterQueue.enqueue(bm, all_bookmarks=self.bookmarks.values())
             return self.add_bookmark(bm)
 
-    def find_broken_links(self) -> List[Bookmark]:
-        """Get bookmarks marked as broken"""
-        return [bm for bm in self._iter_snapshot() if not bm.is_valid]
+    def find_broken_links(self, category: str = None) -> List[Bookmark]:
+        """Get bookmarks marked as broken, in library-list order"""
+        columns = self._library_columns()
+        return self._in_category(compress(columns.bookmarks, columns.broken), category)
 
     def find_by_url(self, url: str) -> Optional[Bookmark]:
         """Find a bookmark by its URL"""
@@ -1037,7 +1310,7 @@ class BookmarkManager:
             domain = bm.domain
             if domain:
                 domain_counts[domain] = domain_counts.get(domain, 0) + 1
-        return sorted(domain_counts.items(), key=lambda x: -x[1])
+        return sorted(domain_counts.items(), key=itemgetter(1), reverse=True)
     
     def clean_tracking_params(self) -> int:
         """Clean tracking parameters from all URLs"""
@@ -1271,6 +1544,10 @@ class BookmarkManager:
         duplicate_candidates: Dict[str, List[Bookmark]] = {}
         age_dist = {"<7 days": 0, "7-30 days": 0, "1-6 months": 0, ">6 months": 0}
         pinned = archived = stale = broken = with_notes = with_tags = 0
+        # One clock read and one timestamp parse per bookmark, instead of the
+        # age_days/is_stale properties each re-parsing and re-reading the clock.
+        parse_iso = Bookmark._parse_iso_naive
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         for bm in snapshot:
             category_counts[bm.category] = category_counts.get(bm.category, 0) + 1
@@ -1282,7 +1559,8 @@ class BookmarkManager:
                 domain_counts[domain] = domain_counts.get(domain, 0) + 1
             duplicate_candidates.setdefault(normalize_url(bm.url), []).append(bm)
 
-            age = bm.age_days
+            created = parse_iso(bm.created_at)
+            age = max(0, (now - created).days) if created is not None else 0
             if age < 7:
                 age_dist["<7 days"] += 1
             elif age < 30:
@@ -1294,20 +1572,24 @@ class BookmarkManager:
 
             pinned += bool(bm.is_pinned)
             archived += bool(bm.is_archived)
-            stale += age > 90 or bm.is_stale
+            if age > 90:
+                stale += 1
+            elif bm.last_visited:
+                visited = parse_iso(bm.last_visited)
+                stale += visited is None or (now - visited).days > 90
             broken += not bm.is_valid
             with_notes += bool(bm.notes)
             with_tags += bool(bm.tags)
 
         duplicates = [bms for bms in duplicate_candidates.values() if len(bms) > 1]
-        domain_stats = sorted(domain_counts.items(), key=lambda item: -item[1])[:10]
+        domain_stats = heapq.nlargest(10, domain_counts.items(), key=itemgetter(1))
         
         return {
             "total_bookmarks": total,
             "total_categories": len(self.category_manager.categories),
             "total_tags": len(tag_counts),
             "category_counts": category_counts,
-            "tag_counts": dict(sorted(tag_counts.items(), key=lambda x: -x[1])[:20]),
+            "tag_counts": dict(heapq.nlargest(20, tag_counts.items(), key=itemgetter(1))),
             "top_domains": domain_stats,
             "duplicate_groups": len(duplicates),
             "duplicate_bookmarks": sum(len(bms) - 1 for bms in duplicates),
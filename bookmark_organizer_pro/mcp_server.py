@@ -34,11 +34,13 @@ Tools exposed:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import importlib
 import json
 import sys
 import threading
 from datetime import date
+from operator import itemgetter
 from urllib.parse import urlsplit
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -716,7 +718,7 @@ def t_list_tags(limit: int = 100) -> List[Dict]:
     limit = _clamp_limit(limit, 100)
     s = _services()
     counts = s.bookmark_manager.get_tag_counts()
-    items = sorted(counts.items(), key=lambda x: -x[1])[:limit]
+    items = heapq.nlargest(limit, counts.items(), key=itemgetter(1))
     return [{"tag": t, "count": c} for t, c in items]
 
 
@@ -3,7 +3,7 @@
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 
@@ -30,8 +30,33 @@ def _clean_tag_list(value) -> List[str]:
     return cleaned
 
 
-@dataclass
-class Bookmark:
+def char_mask(text: str) -> int:
+    """64-bit mask with bit ``ord(c) % 64`` set for every character of ``text``.
+
+    A string can only contain ``text`` when its mask covers this one, which
+    makes the mask a cheap reject before a substring scan.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+class _BookmarkMemo:
+    """Slots for the per-bookmark memo caches.
+
+    They sit on a base class because a ``slots=True`` dataclass only creates
+    slots for its fields. The caches are not fields, so they never reach
+    ``to_dict``, equality or ``repr``. ``__dict__`` keeps the ad-hoc
+    attributes some services attach (e.g. ``local_archive_path``) working;
+    it is only allocated for bookmarks that receive one.
+    """
+
+    __slots__ = ("_domain", "_row_cache", "_search_blob", "__dict__")
+
+
+@dataclass(slots=True)
+class Bookmark(_BookmarkMemo):
     """A single bookmark with all metadata.
 
     Attributes:
@@ -117,11 +142,57 @@ class Bookmark:
 
     @property
     def domain(self) -> str:
+        """Lowercase host without ``www.``, parsed once per URL value."""
+        cached = getattr(self, "_domain", None)
+        if cached is not None and cached[0] == self.url:
+            return cached[1]
         try:
             hostname = urlparse(self.url).hostname or ""
-            return hostname.lower().removeprefix("www.")
+            domain = hostname.lower().removeprefix("www.")
         except Exception:
-            return ""
+            domain = ""
+        self._domain = (self.url, domain)
+        return domain
+
+    def row_cache(self, build: Callable[..., tuple], *context) -> tuple:
+        """Return ``build(self, *context)``, memoized until a displayed field changes.
+
+        The cache key is a snapshot of the fields list views render rather
+        than a setattr hook, so in-place tag edits invalidate it too. The
+        cache lives in a slot outside the dataclass fields and is never
+        serialized.
+        """
+        key = (
+            self.url, self.title, self.description, self.notes, self.category,
+            tuple(self.tags), tuple(self.ai_tags), self.created_at,
+            self.is_valid, self.read_later, self.visit_count, self.is_pinned,
+            self.is_archived, build, context,
+        )
+        cached = getattr(self, "_row_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build(self, *context)
+        self._row_cache = (key, value)
+        return value
+
+    def search_blob(self) -> Tuple[str, int]:
+        """Return the lowercased searchable text and its :func:`char_mask`.
+
+        Memoized like :meth:`row_cache`: the key snapshots the searched
+        fields, so repeated queries skip rebuilding and lowercasing the text
+        until one of them changes.
+        """
+        key = (
+            self.title, self.url, self.notes, self.description, self.category,
+            self.parent_category, tuple(self.tags), tuple(self.ai_tags),
+        )
+        cached = getattr(self, "_search_blob", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = " ".join((*key[:6], " ".join(key[6]), " ".join(key[7]))).lower()
+        value = (text, char_mask(text))
+        self._search_blob = (key, value)
+        return value
 
     @property
     def display_title(self) -> str:
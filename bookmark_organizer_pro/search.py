@@ -1,15 +1,17 @@
 """Search engine with advanced query parsing and fuzzy matching."""
 
+import operator
 import re as stdlib_re
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import regex as safe_regex
 
 from .models import Bookmark
+from .models.bookmark import char_mask
 
 
 MAX_REGEX_PATTERN_LENGTH = 250
@@ -17,6 +19,17 @@ MAX_REGEX_SEARCH_TEXT = 20_000
 REGEX_MATCH_TIMEOUT_SECONDS = 0.02
 REGEX_QUERY_BUDGET_SECONDS = 0.5
 SAVED_SEARCH_SCHEMA_VERSION = 2
+_VISIT_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def _all_tags(bookmark: Bookmark) -> List[str]:
+    return list(bookmark.tags) + list(getattr(bookmark, "ai_tags", []))
 
 
 @dataclass(frozen=True)
@@ -146,6 +159,10 @@ class SearchQuery:
         self._regex_patterns: Dict[Tuple[int, int], Any] = {}
         self._evaluation_deadline: Optional[float] = None
         self._runtime_error_codes: set[str] = set()
+        self._predicates: Optional[Tuple[Tuple[Callable[[Bookmark], bool], ...], ...]] = None
+        self._recent_cutoff = datetime.min
+        self._lowered_for: Optional[Bookmark] = None
+        self._lowered: Tuple[str, int] = ("", 0)
 
         if self.raw_query:
             self._parse(self.raw_query)
@@ -154,6 +171,25 @@ class SearchQuery:
     def valid(self) -> bool:
         return not self.diagnostics
 
+    @property
+    def plain_terms(self) -> Optional[Tuple[str, ...]]:
+        """Lowercased terms of a query made only of ANDed words, else None."""
+        if not self.valid or len(self.ast.groups) != 1:
+            return None
+        group = self.ast.groups[0]
+        if any(clause.kind != "term" or clause.negated for clause in group):
+            return None
+        return tuple(str(clause.value).lower() for clause in group)
+
+    @property
+    def time_relative(self) -> bool:
+        """Whether matches depend on the current time (is:recent, is:stale)."""
+        return any(
+            clause.kind == "is" and clause.value in {"recent", "stale"}
+            for group in self.ast.groups
+            for clause in group
+        )
+
     @staticmethod
     def _safe_compile_regex(pattern: str) -> Any:
         try:
@@ -501,6 +537,9 @@ class SearchQuery:
         ]
         self._runtime_error_codes.clear()
         self._evaluation_deadline = time.monotonic() + REGEX_QUERY_BUDGET_SECONDS
+        self._recent_cutoff = (
+            datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=7)
+        )
 
     def _runtime_error(self, code: str, message: str, clause: SearchClause) -> None:
         if code in self._runtime_error_codes:
@@ -533,96 +572,130 @@ class SearchQuery:
         except (AttributeError, TypeError, ValueError):
             return None
 
-    def _matches_clause(self, clause: SearchClause, bookmark: Bookmark) -> bool:
+    def _lowered_text(self, bookmark: Bookmark) -> Tuple[str, int]:
+        """Lowercased searchable text and character mask for one match."""
+        if bookmark is not self._lowered_for:
+            self._lowered_for = bookmark
+            self._lowered = bookmark.search_blob()
+        return self._lowered
+
+    def _compile_clause(self, clause: SearchClause) -> Callable[[Bookmark], bool]:
+        """Specialize one clause into a predicate with its constants bound."""
         value = clause.value
         value_lower = str(value).lower()
-        all_tags = list(bookmark.tags) + list(getattr(bookmark, "ai_tags", []))
-
-        if clause.kind == "term":
-            matched = value_lower in self._searchable_text(bookmark).lower()
-        elif clause.kind == "domain":
-            domain = bookmark.domain.lower()
-            matched = domain == value_lower or domain.endswith("." + value_lower)
-        elif clause.kind == "tag":
+        kind = clause.kind
+
+        if kind == "regex":
+            # Budget and timeout failures fail closed even when negated.
+            return lambda bookmark: self._matches_regex(clause, bookmark)
+        if kind == "term":
+            term_mask = char_mask(value_lower)
+
+            def test(bookmark):
+                text, mask = self._lowered_text(bookmark)
+                return mask & term_mask == term_mask and value_lower in text
+        elif kind == "domain":
+            suffix = "." + value_lower
+
+            def test(bookmark):
+                domain = bookmark.domain.lower()
+                return domain == value_lower or domain.endswith(suffix)
+        elif kind == "tag":
             prefix = value_lower + "/"
-            matched = any(
-                tag.lower() == value_lower or tag.lower().startswith(prefix)
-                for tag in all_tags
-            )
-        elif clause.kind == "category":
-            matched = (
-                value_lower in bookmark.category.lower()
-                or value_lower in bookmark.parent_category.lower()
-            )
-        elif clause.kind == "title":
-            matched = value_lower in bookmark.title.lower()
-        elif clause.kind == "url":
-            matched = value_lower in bookmark.url.lower()
-        elif clause.kind == "content":
-            body = _load_extracted_text(bookmark.id)
-            matched = bool(body) and value_lower in body.lower()
-        elif clause.kind in {"after", "before"}:
-            created = self._bookmark_created_at(bookmark)
-            matched = created is not None and (
-                created >= value if clause.kind == "after" else created <= value
-            )
-        elif clause.kind == "has":
-            matched = (
-                bool(bookmark.notes)
-                if value == "notes"
-                else bool(all_tags)
-            )
-        elif clause.kind == "is":
+
+            def test(bookmark):
+                return any(
+                    tag == value_lower or tag.startswith(prefix)
+                    for tag in map(str.lower, _all_tags(bookmark))
+                )
+        elif kind == "category":
+            def test(bookmark):
+                return (
+                    value_lower in bookmark.category.lower()
+                    or value_lower in bookmark.parent_category.lower()
+                )
+        elif kind == "title":
+            def test(bookmark):
+                return value_lower in bookmark.title.lower()
+        elif kind == "url":
+            def test(bookmark):
+                return value_lower in bookmark.url.lower()
+        elif kind == "content":
+            def test(bookmark):
+                body = _load_extracted_text(bookmark.id)
+                return bool(body) and value_lower in body.lower()
+        elif kind == "after":
+            def test(bookmark):
+                created = self._bookmark_created_at(bookmark)
+                return created is not None and created >= value
+        elif kind == "before":
+            def test(bookmark):
+                created = self._bookmark_created_at(bookmark)
+                return created is not None and created <= value
+        elif kind == "has":
+            if value == "notes":
+                def test(bookmark):
+                    return bool(bookmark.notes)
+            else:
+                def test(bookmark):
+                    return bool(_all_tags(bookmark))
+        elif kind == "is":
             if value == "pinned":
-                matched = bookmark.is_pinned
+                def test(bookmark):
+                    return bookmark.is_pinned
             elif value == "archived":
-                matched = bookmark.is_archived
+                def test(bookmark):
+                    return bookmark.is_archived
             elif value == "broken":
-                matched = not bookmark.is_valid
+                def test(bookmark):
+                    return not bookmark.is_valid
             elif value == "stale":
-                matched = bookmark.is_stale
+                def test(bookmark):
+                    return bookmark.is_stale
             elif value == "untagged":
-                matched = not all_tags
+                def test(bookmark):
+                    return not _all_tags(bookmark)
             else:
-                created = self._bookmark_created_at(bookmark)
-                now = datetime.now(timezone.utc).replace(tzinfo=None)
-                matched = created is not None and created >= now - timedelta(days=7)
-        elif clause.kind == "visits":
-            count = bookmark.visit_count
-            matched = {
-                ">": count > value,
-                ">=": count >= value,
-                "=": count == value,
-                "<": count < value,
-                "<=": count <= value,
-            }[clause.operator]
-        elif clause.kind == "regex":
-            if (
-                self._evaluation_deadline is not None
-                and time.monotonic() >= self._evaluation_deadline
-            ):
-                self._runtime_error(
-                    "regex_runtime_budget",
-                    "Regular-expression search exceeded its total time budget.",
-                    clause,
-                )
-                return False
-            compiled = self._regex_patterns[(clause.start, clause.end)]
-            searchable = self._searchable_text(bookmark)[:MAX_REGEX_SEARCH_TEXT]
-            try:
-                matched = bool(
-                    compiled.search(searchable, timeout=REGEX_MATCH_TIMEOUT_SECONDS)
-                )
-            except (TimeoutError, RecursionError, MemoryError):
-                self._runtime_error(
-                    "regex_runtime_timeout",
-                    "Regular-expression evaluation exceeded its time budget.",
-                    clause,
-                )
-                return False
+                def test(bookmark):
+                    created = self._bookmark_created_at(bookmark)
+                    return created is not None and created >= self._recent_cutoff
+        elif kind == "visits":
+            compare = _VISIT_OPERATORS[clause.operator]
+
+            def test(bookmark):
+                return compare(bookmark.visit_count, value)
         else:  # pragma: no cover - parser constrains kinds
-            matched = False
+            def test(bookmark):
+                return False
 
+        if clause.negated:
+            return lambda bookmark: not test(bookmark)
+        return test
+
+    def _matches_regex(self, clause: SearchClause, bookmark: Bookmark) -> bool:
+        if (
+            self._evaluation_deadline is not None
+            and time.monotonic() >= self._evaluation_deadline
+        ):
+            self._runtime_error(
+                "regex_runtime_budget",
+                "Regular-expression search exceeded its total time budget.",
+                clause,
+            )
+            return False
+        compiled = self._regex_patterns[(clause.start, clause.end)]
+        searchable = self._searchable_text(bookmark)[:MAX_REGEX_SEARCH_TEXT]
+        try:
+            matched = bool(
+                compiled.search(searchable, timeout=REGEX_MATCH_TIMEOUT_SECONDS)
+            )
+        except (TimeoutError, RecursionError, MemoryError):
+            self._runtime_error(
+                "regex_runtime_timeout",
+                "Regular-expression evaluation exceeded its time budget.",
+                clause,
+            )
+            return False
         return not matched if clause.negated else matched
 
     def matches(self, bookmark: Bookmark) -> bool:
@@ -631,9 +704,15 @@ class SearchQuery:
             return False
         if self._evaluation_deadline is None:
             self.begin_evaluation()
+        if self._predicates is None:
+            self._predicates = tuple(
+                tuple(self._compile_clause(clause) for clause in group)
+                for group in self.ast.groups
+            )
+        self._lowered_for = None
         matched = any(
-            all(self._matches_clause(clause, bookmark) for clause in group)
-            for group in self.ast.groups
+            all(test(bookmark) for test in group)
+            for group in self._predicates
         )
         return matched and self.valid
 
@@ -675,7 +754,7 @@ class SearchEngine:
                 self.last_diagnostics = list(parsed.diagnostics)
                 return []
 
-        results.sort(key=lambda x: x[1], reverse=True)
+        results.sort(key=operator.itemgetter(1), reverse=True)
         self.last_diagnostics = list(parsed.diagnostics)
         return results
 
@@ -972,7 +1051,7 @@ class FuzzySearchEngine:
                 if matches:
                     results.append((bm, score * 0.8))
 
-        results.sort(key=lambda x: x[1], reverse=True)
+        results.sort(key=operator.itemgetter(1), reverse=True)
         return results
 
     def get_suggestions(self, partial: str, bookmarks: List[Bookmark], limit: int = 5) -> List[str]:
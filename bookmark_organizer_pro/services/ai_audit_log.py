@@ -29,6 +29,7 @@ from __future__ import annotations
 import json
 import threading
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 from bookmark_organizer_pro.constants import LOGS_DIR
@@ -470,7 +471,7 @@ def get_audit_stats() -> Dict[str, Any]:
         "total": len(entries),
         "by_action": actions,
         "by_provider": providers,
-        "top_categories": dict(sorted(categories_changed.items(), key=lambda x: -x[1])[:20]),
+        "top_categories": dict(sorted(categories_changed.items(), key=itemgetter(1), reverse=True)[:20]),
         "first": entries[0].get("timestamp", "") if entries else "",
         "last": entries[-1].get("timestamp", "") if entries else "",
     }
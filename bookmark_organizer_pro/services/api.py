@@ -17,6 +17,7 @@ import time
 import urllib.parse
 from dataclasses import asdict
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -768,7 +769,7 @@ class BookmarkAPI:
                         "count": len(counts),
                         "tags": [
                             {"name": name, "count": count}
-                            for name, count in sorted(counts.items(), key=lambda x: -x[1])
+                            for name, count in sorted(counts.items(), key=itemgetter(1), reverse=True)
                         ]
                     })
                 
@@ -18,7 +18,11 @@ from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional
 
 from bookmark_organizer_pro.constants import DEAD_LINKS_FILE
-from bookmark_organizer_pro.link_checker import LinkChecker
+from bookmark_organizer_pro.link_checker import (
+    LinkChecker,
+    group_bookmarks_by_url,
+    share_redirect_metadata,
+)
 from bookmark_organizer_pro.logging_config import log
 from bookmark_organizer_pro.models import Bookmark
 
@@ -65,7 +69,7 @@ class DeadLinkScanner:
     # ---- single scan -------------------------------------------------------
     def scan_now(self, progress_callback: Optional[Callable[[ScanProgress], None]] = None,
                  only_unchecked_for_hours: int = 0) -> List[DeadLinkRecord]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
         bookmarks = list(self.get_bookmarks())
         if only_unchecked_for_hours > 0:
             cutoff = datetime.now() - timedelta(hours=only_unchecked_for_hours)
@@ -83,20 +87,29 @@ class DeadLinkScanner:
             return records
 
         now = datetime.now().isoformat()
-        with ThreadPoolExecutor(max_workers=self.checker.max_workers) as ex:
-            futures = {ex.submit(self.checker._check_url, bm): bm for bm in bookmarks}
-            for fut in as_completed(futures):
-                bm = futures[fut]
-                try:
-                    is_valid, status_code = fut.result()
-                except Exception as exc:
-                    is_valid, status_code = False, 0
-                    log.debug(f"check failed for {bm.url}: {exc}")
-                with self._lock:
+        self.checker.reset_host_state()
+        groups = group_bookmarks_by_url(bookmarks)
+        # Periodic scans reuse the checker's long-lived worker pool.
+        futures = {
+            self.checker.submit_check(group[0]): group
+            for group in groups.values()
+        }
+        for fut in as_completed(futures):
+            group = futures[fut]
+            try:
+                is_valid, status_code = fut.result()
+            except Exception as exc:
+                is_valid, status_code = False, 0
+                log.debug(f"check failed for {group[0].url}: {exc}")
+            with self._lock:
+                for bm in group:
                     bm.last_checked = now
                     bm.is_valid = is_valid
                     bm.http_status = status_code
-                    redirect = str(bm.custom_data.get("redirect_url", "") or "")
+                if len(group) > 1:
+                    share_redirect_metadata(group)
+                redirect = str(group[0].custom_data.get("redirect_url", "") or "")
+            for bm in group:
                 progress.done += 1
                 if not is_valid:
                     progress.broken += 1
@@ -112,11 +125,11 @@ class DeadLinkScanner:
                         error="redirect", redirect_to=redirect,
                         detected_at=now,
                     ))
-                if progress_callback:
-                    try:
-                        progress_callback(progress)
-                    except Exception:
-                        pass
+            if progress_callback:
+                try:
+                    progress_callback(progress)
+                except Exception:
+                    pass
 
         with self._lock:
             self._last_scan = datetime.now()
@@ -144,6 +157,7 @@ class DeadLinkScanner:
         if self._thread is not None:
             self._thread.join(timeout=5)
             self._thread = None
+        self.checker.close()
 
     def _loop(self, interval_hours: int):
         wait_seconds = max(60, interval_hours * 3600)
@@ -73,11 +73,20 @@ class BoundedEgressClient:
         {"authorization", "proxy-authorization", "cookie"}
     )
 
-    def __init__(self, policy: EgressPolicy | None = None, *, session=None):
+    def __init__(
+        self,
+        policy: EgressPolicy | None = None,
+        *,
+        session=None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+    ):
         self.policy = policy or EgressPolicy()
         self.session = session or _requests.Session()
         self.session.trust_env = False
-        adapter = _PinnedDNSAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        adapter = _PinnedDNSAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -200,5 +209,9 @@ class BoundedEgressClient:
     def post(self, url: str, **kwargs):
         return self.request("POST", url, **kwargs)
 
+    def close(self) -> None:
+        """Release pooled keep-alive connections; later requests reconnect."""
+        self.session.close()
+
 
 public_egress = BoundedEgressClient()
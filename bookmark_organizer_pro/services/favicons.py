@@ -9,9 +9,10 @@ import re
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from bookmark_organizer_pro.constants import APP_DIR, DATA_DIR, SETTINGS_FILE
@@ -94,6 +95,21 @@ def save_favicon_policy(
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def _normalized_domain(domain: str) -> str:
+    """Normalize one domain; list refreshes look up the same few hosts repeatedly."""
+    raw = domain.strip().lower()
+    if not raw:
+        return ""
+    parsed = urlparse(raw if "://" in raw else f"//{raw}")
+    hostname = (parsed.hostname or raw).strip(".").lower()
+    if not hostname or len(hostname) > 253:
+        return ""
+    if not re.match(r"^[a-z0-9.-]+$", hostname):
+        return ""
+    return hostname
+
+
 class HighSpeedFaviconManager:
     """
     Ultra-fast favicon manager with:
@@ -280,16 +296,7 @@ class HighSpeedFaviconManager:
 
     def _normalize_domain(self, domain: str) -> str:
         """Normalize a user/bookmark domain for cache keys and requests."""
-        raw = (domain or "").strip().lower()
-        if not raw:
-            return ""
-        parsed = urlparse(raw if "://" in raw else f"//{raw}")
-        hostname = (parsed.hostname or raw).strip(".").lower()
-        if not hostname or len(hostname) > 253:
-            return ""
-        if not re.match(r"^[a-z0-9.-]+$", hostname):
-            return ""
-        return hostname
+        return _normalized_domain(str(domain or ""))
     
     def get_cached(self, domain: str) -> Optional[str]:
         """Get cached favicon path (instant, non-blocking). Returns None for failed domains."""
@@ -363,8 +370,38 @@ class HighSpeedFaviconManager:
             return
         if not should_submit:
             return
-        
-        # Submit to thread pool
+        self._submit_download(domain, bookmark_id, cancel_event)
+
+    def prefetch(self, items: Iterable[Tuple[str, int]]) -> int:
+        """Queue downloads for a batch of ``(domain, bookmark_id)`` pairs.
+
+        Cached, pending, and previously failed domains are filtered under one
+        lock acquisition and every miss is submitted together, so a viewport
+        of rows costs one pass instead of a lock round-trip per row. Returns
+        the number of downloads started.
+        """
+        wanted: Dict[str, int] = {}
+        for domain, bookmark_id in items:
+            domain = self._normalize_domain(domain)
+            if domain and domain not in wanted:
+                wanted[domain] = bookmark_id
+        with self._lock:
+            if not self._enabled:
+                return 0
+            cancel_event = self._cancel_event
+            cache, pending, failed = self._cache, self._pending, self._failed_domains
+            batch = [
+                (domain, bookmark_id) for domain, bookmark_id in wanted.items()
+                if domain not in cache and domain not in pending and domain not in failed
+            ]
+            self._pending.update(domain for domain, _bookmark_id in batch)
+            self._total_queued += len(batch)
+        for domain, bookmark_id in batch:
+            self._submit_download(domain, bookmark_id, cancel_event)
+        return len(batch)
+
+    def _submit_download(self, domain: str, bookmark_id: int, cancel_event: threading.Event):
+        """Hand one claimed domain to the thread pool."""
         future = self._executor.submit(
             self._download_favicon,
             domain,
@@ -538,19 +575,7 @@ class HighSpeedFaviconManager:
         """Queue all bookmarks for favicon download - skips failed domains"""
         if not self.enabled:
             return
-        domains_seen = set()
-        
-        for bm in bookmarks:
-            domain = self._normalize_domain(getattr(bm, "domain", ""))
-            if not domain:
-                continue
-            # Skip if already cached, pending, or previously failed
-            if domain not in domains_seen and domain not in self._cache:
-                # Skip failed domains on startup
-                if domain in self._failed_domains:
-                    continue
-                domains_seen.add(domain)
-                self.download_async(domain, bm.id)
+        self.prefetch((getattr(bm, "domain", ""), bm.id) for bm in bookmarks)
     
     def redownload_all_favicons(self, bookmarks: List, callback: Callable = None,
                                 progress_callback: Callable = None):
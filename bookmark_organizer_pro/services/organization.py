@@ -7,6 +7,7 @@ import os
 import re
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -442,7 +443,7 @@ class FrequentlyUsedManager:
                 if rank_change > 0:
                     trending.append((bm, rank_change))
         
-        trending.sort(key=lambda x: x[1], reverse=True)
+        trending.sort(key=itemgetter(1), reverse=True)
         return [bm for bm, _ in trending[:limit]]
 
 
@@ -16,6 +16,7 @@ import math
 import threading
 import uuid
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
@@ -772,4 +773,4 @@ def reciprocal_rank_fusion(rankings: List[List[int]], k: int = 60) -> List[Tuple
             except (TypeError, ValueError):
                 continue
             scores[bid] = scores.get(bid, 0.0) + 1.0 / (k + rank + 1)
-    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    return sorted(scores.items(), key=itemgetter(1), reverse=True)
@@ -41,6 +41,10 @@ def _bookmark_label(bookmark: Bookmark, action: str) -> str:
     return f"{action} #{bookmark.id}: {title} - {url}"
 
 
+def _group_items_text(items: Iterable[str]) -> str:
+    return "\n".join(format_message('- {value_0}', value_0=item) for item in items)
+
+
 def build_url_duplicate_review_groups(dupes: Mapping[str, Sequence[Bookmark]]) -> List[CleanupReviewGroup]:
     """Build review groups from BookmarkManager.find_duplicates output."""
     groups: List[CleanupReviewGroup] = []
@@ -257,10 +261,12 @@ class CleanupReviewDialog(tk.Toplevel):
             wraplength=780,
             justify=tk.LEFT,
         ).pack(anchor="w", pady=(4, 8))
-        for item in group.items:
+        # One label for the whole item list: large duplicate reviews would
+        # otherwise allocate a Tk widget per bookmark line.
+        if group.items:
             tk.Label(
                 card,
-                text=format_message('- {value_0}', value_0=item),
+                text=_group_items_text(group.items),
                 bg=theme.bg_secondary,
                 fg=theme.text_muted,
                 font=FONTS.tiny(),
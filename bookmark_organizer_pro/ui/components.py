@@ -232,6 +232,8 @@ class DragDropImportArea(tk.Frame, ThemedWidget):
         self.bind("<FocusIn>", self._on_enter)
         self.bind("<FocusOut>", self._on_leave)
         route_pointer_to_control(self, self.icon_label, self.main_label, self.formats_label)
+        # Widgets recoloured on hover; the compact row appends its own once built.
+        self._surface_widgets = [self, self.icon_label, self.main_label, self.formats_label]
         
         # Visual feedback on hover
         self.bind("<Enter>", self._on_enter)
@@ -251,10 +253,7 @@ class DragDropImportArea(tk.Frame, ThemedWidget):
 
     def _apply_surface(self, bg: str):
         """Keep the import affordance visually unified across child widgets."""
-        widgets = [self, self.icon_label, self.main_label, self.formats_label]
-        if self.compact_row:
-            widgets.extend([self.compact_row, self.compact_title_label, self.compact_detail_label])
-        for widget in widgets:
+        for widget in self._surface_widgets:
             try:
                 widget.configure(bg=bg)
             except Exception:
@@ -370,9 +369,11 @@ class DragDropImportArea(tk.Frame, ThemedWidget):
                     style="primary", padx=12, pady=6, font=FONTS.tiny(bold=True)
                 )
                 self.compact_action.pack(side=tk.RIGHT, padx=(8, 0))
-                for widget in (self.compact_row, copy, self.compact_title_label, self.compact_detail_label):
+                compact_widgets = (self.compact_row, copy, self.compact_title_label, self.compact_detail_label)
+                for widget in compact_widgets:
                     widget.bind("<Enter>", self._on_enter)
                     widget.bind("<Leave>", self._on_leave)
+                self._surface_widgets.extend(compact_widgets)
                 route_pointer_to_control(
                     self,
                     self.compact_row,
@@ -493,6 +494,7 @@ class ScrollableFrame(tk.Frame):
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind events
+        self._scroll_region = None
         self.inner.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
@@ -507,8 +509,15 @@ class ScrollableFrame(tk.Frame):
             self.canvas.bind(key, self._on_key_scroll)
 
     def _on_frame_configure(self, event):
-        """Update scroll region when inner frame changes"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        """Update scroll region when inner frame changes.
+
+        The inner frame is the canvas's only item and sits at the origin, so
+        its new size is the scroll region; no ``bbox("all")`` walk needed.
+        """
+        region = (0, 0, event.width, event.height)
+        if region != self._scroll_region:
+            self._scroll_region = region
+            self.canvas.configure(scrollregion=region)
 
     def _on_canvas_configure(self, event):
         """Update inner frame width when canvas resizes"""
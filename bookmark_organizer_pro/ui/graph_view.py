@@ -75,6 +75,9 @@ def _node_colors():
 class GraphViewDialog(tk.Toplevel):
     """Render bookmark relationships on a Tk canvas."""
 
+    # Pointer travel in pixels before a press on empty canvas starts panning.
+    PAN_THRESHOLD = 5
+
     def __init__(
         self,
         parent,
@@ -96,6 +99,8 @@ class GraphViewDialog(tk.Toplevel):
         )
         self.node_lookup: Dict[str, GraphNode] = {node.id: node for node in self.graph.nodes}
         self.selected_node_id: str | None = None
+        self._pan_origin: tuple[int, int] | None = None
+        self._panning = False
 
         self.title(_("Bookmark Graph"))
         self.minsize(820, 560)
@@ -308,13 +313,23 @@ class GraphViewDialog(tk.Toplevel):
     def _on_canvas_press(self, event) -> None:
         node_id = self._node_id_from_event(event)
         if node_id:
+            self._pan_origin = None
             self._select_node(node_id)
             return
-        self.canvas.scan_mark(event.x, event.y)
+        # Panning starts lazily in _on_canvas_drag, so plain clicks and
+        # motion over nodes skip the per-event canvas hit test.
+        self._pan_origin = (event.x, event.y)
+        self._panning = False
 
     def _on_canvas_drag(self, event) -> None:
-        if self._node_id_from_event(event):
+        origin = self._pan_origin
+        if origin is None:
             return
+        if not self._panning:
+            if max(abs(event.x - origin[0]), abs(event.y - origin[1])) < self.PAN_THRESHOLD:
+                return
+            self.canvas.scan_mark(*origin)
+            self._panning = True
         self.canvas.scan_dragto(event.x, event.y, gain=1)
 
     def _on_canvas_double_click(self, event) -> None:
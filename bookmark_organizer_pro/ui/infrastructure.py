@@ -65,6 +65,8 @@ class TkEventDispatcher:
         self.poll_interval_ms = max(1, int(poll_interval_ms))
         self.max_events_per_tick = max(1, int(max_events_per_tick))
         self._events: queue.Queue[_DispatchEvent] = queue.Queue()
+        self._latest: Dict[Any, _DispatchEvent] = {}
+        self._latest_lock = threading.Lock()
         self._closed = threading.Event()
         self._owner_thread = threading.get_ident()
         self._after_id = None
@@ -88,6 +90,23 @@ class TkEventDispatcher:
         )
         return not self.closed
 
+    def post_latest(self, key: Any, callback: Callable, *args, **kwargs) -> bool:
+        """Enqueue a callback that replaces any still-pending one under ``key``.
+
+        Progress-style updates use this so a fast worker leaves at most one
+        pending event per key for the next tick instead of one per item.
+        """
+        if self.closed:
+            return False
+        event = _DispatchEvent(
+            callback=callback,
+            args=tuple(args),
+            kwargs=tuple(kwargs.items()),
+        )
+        with self._latest_lock:
+            self._latest[key] = event
+        return not self.closed
+
     def _schedule(self) -> None:
         if self.closed:
             return
@@ -103,6 +122,12 @@ class TkEventDispatcher:
         if self.closed:
             self._discard_pending()
             return
+        with self._latest_lock:
+            latest, self._latest = self._latest, {}
+        for event in latest.values():
+            if self.closed:
+                break
+            self._run(event)
         for _index in range(self.max_events_per_tick):
             try:
                 event = self._events.get_nowait()
@@ -110,16 +135,22 @@ class TkEventDispatcher:
                 break
             if self.closed:
                 break
-            try:
-                event.callback(*event.args, **dict(event.kwargs))
-            except Exception:
-                log.warning("Tk event callback failed", exc_info=True)
+            self._run(event)
         if self.closed:
             self._discard_pending()
             return
         self._schedule()
 
+    @staticmethod
+    def _run(event: _DispatchEvent) -> None:
+        try:
+            event.callback(*event.args, **dict(event.kwargs))
+        except Exception:
+            log.warning("Tk event callback failed", exc_info=True)
+
     def _discard_pending(self) -> None:
+        with self._latest_lock:
+            self._latest.clear()
         while True:
             try:
                 self._events.get_nowait()
@@ -220,7 +251,7 @@ class NonBlockingTaskRunner:
                     results.append(None)
                 
                 if on_progress:
-                    self.dispatcher.post(on_progress, i + 1, total, item)
+                    self.dispatcher.post_latest((task_id, "progress"), on_progress, i + 1, total, item)
             
             if on_complete:
                 self.dispatcher.post(on_complete, results)
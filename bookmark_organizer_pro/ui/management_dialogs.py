@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from typing import Callable
@@ -20,8 +21,7 @@ from bookmark_organizer_pro.services.mcp_auth import (
 )
 
 from .foundation import FONTS, DesignTokens, pluralize
-from .tk_interactions import bind_scoped_mousewheel, make_keyboard_activatable
-from .widgets import ModernButton, Tooltip, apply_window_chrome, get_theme
+from .widgets import ModernButton, apply_window_chrome, get_theme
 from .window_geometry import apply_screen_aware_geometry
 
 
@@ -104,24 +104,48 @@ class CategoryManagementDialog(tk.Toplevel):
         )
         list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
         
-        # Scrollable list
-        canvas = tk.Canvas(list_frame, bg=theme.bg_primary, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
-        self.cat_list_frame = tk.Frame(canvas, bg=theme.bg_primary)
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # One native Treeview row per category; the canvas of per-category
+        # frames, labels and tooltips grew by seven widgets per collection.
+        self._cat_tree_frame = tree_frame = tk.Frame(list_frame, bg=theme.bg_primary)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.cat_tree = ttk.Treeview(
+            tree_frame,
+            columns=("name", "count"),
+            show="headings",
+            selectmode="browse",
+        )
+        self.cat_tree.heading("name", text=_("Category"), anchor=tk.W)
+        self.cat_tree.heading("count", text=_("Bookmarks"), anchor=tk.W)
+        self.cat_tree.column("name", width=300, minwidth=120, anchor=tk.W)
+        self.cat_tree.column("count", width=110, minwidth=80, anchor=tk.W)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.cat_tree.yview)
+        self.cat_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.cat_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.cat_tree.bind("<Double-1>", lambda e: self._edit_selected_category())
+        self.cat_tree.bind("<Return>", lambda e: self._edit_selected_category())
+        self.cat_tree.bind("<Delete>", lambda e: self._delete_selected_category())
+
+        self.cat_empty_label = tk.Label(
+            list_frame,
+            text=_("No categories yet. Create one above or import bookmarks to seed the list."),
+            bg=theme.bg_primary, fg=theme.text_secondary,
+            font=FONTS.body(), wraplength=460,
+            justify=tk.LEFT, padx=12, pady=18
+        )
 
-        _win = canvas.create_window((0, 0), window=self.cat_list_frame, anchor="nw")
-        self.cat_list_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        # Keep the inner frame as wide as the canvas so rows fill the width.
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig(_win, width=e.width))
+        self._cat_row_actions = row_actions = tk.Frame(list_frame, bg=theme.bg_primary)
+        row_actions.pack(fill=tk.X, padx=5, pady=(0, 8))
+        ModernButton(
+            row_actions, text=_("Rename selected"), command=self._edit_selected_category,
+            padx=12, pady=6, tooltip=_("Rename the selected category (Enter)")
+        ).pack(side=tk.LEFT)
+        ModernButton(
+            row_actions, text=_("Delete selected"), command=self._delete_selected_category,
+            style="danger", padx=12, pady=6,
+            tooltip=_("Delete the selected category (Delete)")
+        ).pack(side=tk.LEFT, padx=(8, 0))
 
-        self._wheel_binding = bind_scoped_mousewheel(
-            canvas, lambda units, _event: canvas.yview_scroll(units, "units")
-        )
-        
         self._populate_categories()
         
         footer = tk.Frame(self, bg=theme.bg_primary)
@@ -175,77 +199,64 @@ class CategoryManagementDialog(tk.Toplevel):
         if button is not None:
             button.set_state(state)
     
+    def _category_counts(self) -> Counter:
+        """Bookmarks per category, children included, in one library pass."""
+        counts: Counter = Counter()
+        for bm in self.bookmark_manager.get_all_bookmarks():
+            counts[bm.category] += 1
+            if bm.parent_category and bm.parent_category != bm.category:
+                counts[bm.parent_category] += 1
+        return counts
+
     def _populate_categories(self):
         """Populate the category list"""
-        theme = get_theme()
-        
-        # Clear existing
-        for widget in self.cat_list_frame.winfo_children():
-            widget.destroy()
-        
-        categories = self.category_manager.get_sorted_categories()
+        tree = self.cat_tree
+        tree.delete(*tree.get_children())
 
+        categories = [
+            name for name in self.category_manager.get_sorted_categories()
+            if self.category_manager.categories.get(name)
+        ]
         if not categories:
-            tk.Label(
-                self.cat_list_frame,
-                text=_("No categories yet. Create one above or import bookmarks to seed the list."),
-                bg=theme.bg_primary, fg=theme.text_secondary,
-                font=FONTS.body(), wraplength=460,
-                justify=tk.LEFT, padx=12, pady=18
-            ).pack(anchor="w", fill=tk.X)
+            self._cat_tree_frame.pack_forget()
+            self.cat_empty_label.pack(anchor="w", fill=tk.X, before=self._cat_row_actions)
             return
-        
+        self.cat_empty_label.pack_forget()
+        self._cat_tree_frame.pack(
+            fill=tk.BOTH, expand=True, padx=5, pady=5, before=self._cat_row_actions
+        )
+
+        counts = self._category_counts()
         for cat_name in categories:
-            cat = self.category_manager.categories.get(cat_name)
-            if not cat:
-                continue
-            
-            # Count bookmarks in this category
-            count = len(self.bookmark_manager.get_bookmarks_by_category(cat_name))
-            
-            row = tk.Frame(
-                self.cat_list_frame, bg=theme.bg_secondary,
-                highlightbackground=theme.border_muted,
-                highlightthickness=1
-            )
-            row.pack(fill=tk.X, pady=2, padx=5)
-            
-            # Icon and name
-            tk.Label(
-                row, text=format_message('{value_0} {value_1}', value_0=cat.icon, value_1=cat_name), bg=theme.bg_secondary,
-                fg=theme.text_primary, font=FONTS.body(bold=True), anchor="w"
-            ).pack(side=tk.LEFT, padx=(12, 8), pady=9)
-            
-            # Count badge
-            tk.Label(
-                row, text=pluralize(count, "bookmark"),
-                bg=theme.bg_secondary,
-                fg=theme.text_secondary, font=FONTS.small()
-            ).pack(side=tk.LEFT)
-            
-            # Buttons
-            btn_frame = tk.Frame(row, bg=theme.bg_secondary)
-            btn_frame.pack(side=tk.RIGHT, padx=5)
-            
-            # Edit button
-            edit_btn = tk.Label(
-                btn_frame, text=_("Rename"), bg=theme.bg_secondary,
-                fg=theme.text_secondary, font=FONTS.small(), cursor="hand2",
-                padx=4
-            )
-            edit_btn.pack(side=tk.LEFT, padx=5, pady=5)
-            make_keyboard_activatable(edit_btn, lambda n=cat_name: self._edit_category(n))
-            Tooltip(edit_btn, f"Rename {cat_name}")
-
-            # Delete button
-            del_btn = tk.Label(
-                btn_frame, text=_("Delete"), bg=theme.bg_secondary,
-                fg=theme.accent_error, font=FONTS.small(), cursor="hand2",
-                padx=4
+            cat = self.category_manager.categories[cat_name]
+            tree.insert(
+                "", tk.END, iid=cat_name,
+                values=(
+                    format_message('{value_0} {value_1}', value_0=cat.icon, value_1=cat_name),
+                    pluralize(counts[cat_name], "bookmark"),
+                ),
             )
-            del_btn.pack(side=tk.LEFT, padx=5, pady=5)
-            make_keyboard_activatable(del_btn, lambda n=cat_name: self._delete_category(n))
-            Tooltip(del_btn, f"Delete {cat_name}")
+        first = tree.get_children()[0]
+        tree.selection_set(first)
+        tree.focus(first)
+
+    def _selected_category(self):
+        selection = self.cat_tree.selection()
+        return selection[0] if selection else None
+
+    def _edit_selected_category(self):
+        name = self._selected_category()
+        if name is None:
+            self._set_status("Select a category to rename.")
+            return
+        self._edit_category(name)
+
+    def _delete_selected_category(self):
+        name = self._selected_category()
+        if name is None:
+            self._set_status("Select a category to delete.")
+            return
+        self._delete_category(name)
     
     def _add_category(self):
         """Add new category"""
@@ -614,39 +625,16 @@ class CredentialSecurityDialog(tk.Toplevel):
         _("90 days"): 7_776_000,
         _("1 year"): 31_536_000,
     }
+    # ttk styles are interpreter-global; remember what was last applied so
+    # reopening the dialog under the same theme and zoom skips the Tcl work.
+    _table_style_key = None
 
     def __init__(self, parent, credential_manager):
         super().__init__(parent)
         self.credential_manager = credential_manager
         self._rows: dict[str, dict] = {}
         self._theme = get_theme()
-        table_style = ttk.Style(self)
-        native_heading = table_style.theme_use() in {
-            "vista", "xpnative", "winnative", "aqua",
-        }
-        table_style.configure(
-            "Credential.Treeview",
-            background=self._theme.bg_secondary,
-            fieldbackground=self._theme.bg_secondary,
-            foreground=self._theme.text_primary,
-            bordercolor=self._theme.border_muted,
-            rowheight=30,
-            font=FONTS.small(),
-        )
-        table_style.map(
-            "Credential.Treeview",
-            background=[("selected", self._theme.selection)],
-            foreground=[("selected", self._theme.text_primary)],
-        )
-        table_style.configure(
-            "Credential.Treeview.Heading",
-            background=self._theme.bg_tertiary,
-            foreground=(
-                "#111827" if native_heading else self._theme.text_primary
-            ),
-            bordercolor=self._theme.border_muted,
-            font=FONTS.small(bold=True),
-        )
+        self._configure_table_style()
 
         self.title(_("Access Credentials"))
         self.configure(bg=self._theme.bg_primary)
@@ -862,6 +850,48 @@ class CredentialSecurityDialog(tk.Toplevel):
         self.bind("<Escape>", lambda _event: self.destroy())
         self._refresh()
 
+    def _configure_table_style(self):
+        table_style = ttk.Style(self)
+        native_heading = table_style.theme_use() in {
+            "vista", "xpnative", "winnative", "aqua",
+        }
+        key = (
+            id(self.tk),
+            table_style.theme_use(),
+            self._theme.bg_secondary,
+            self._theme.bg_tertiary,
+            self._theme.text_primary,
+            self._theme.border_muted,
+            self._theme.selection,
+            FONTS.small(),
+        )
+        if type(self)._table_style_key == key:
+            return
+        table_style.configure(
+            "Credential.Treeview",
+            background=self._theme.bg_secondary,
+            fieldbackground=self._theme.bg_secondary,
+            foreground=self._theme.text_primary,
+            bordercolor=self._theme.border_muted,
+            rowheight=30,
+            font=FONTS.small(),
+        )
+        table_style.map(
+            "Credential.Treeview",
+            background=[("selected", self._theme.selection)],
+            foreground=[("selected", self._theme.text_primary)],
+        )
+        table_style.configure(
+            "Credential.Treeview.Heading",
+            background=self._theme.bg_tertiary,
+            foreground=(
+                "#111827" if native_heading else self._theme.text_primary
+            ),
+            bordercolor=self._theme.border_muted,
+            font=FONTS.small(bold=True),
+        )
+        type(self)._table_style_key = key
+
     @staticmethod
     def _display_time(value: str, fallback: str = "—") -> str:
         text = str(value or "")
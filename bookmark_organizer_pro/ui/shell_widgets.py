@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tkinter as tk
+from dataclasses import dataclass
 from enum import Enum
 from typing import Callable, List, Tuple
 
@@ -17,6 +18,41 @@ from .widget_runtime import get_theme
 # =============================================================================
 # Command Palette
 # =============================================================================
+def _rank_commands(query: str, index) -> list:
+    """Return commands matching ``query`` best-first.
+
+    Prefix matches rank above matches at a word start, which rank above other
+    substring matches. Queries of three or more characters also accept the
+    letters in order with gaps ("exprt" finds "Export"), ranked last. Ties
+    keep the palette's own order.
+    """
+    ranked = []
+    for position, (name, cmd) in enumerate(index):
+        found = name.find(query)
+        if found == 0:
+            rank = 0
+        elif found > 0:
+            rank = 1 if name[found - 1] in " /-(" else 2
+        elif len(query) >= 3:
+            remaining = iter(name)
+            if not all(char in remaining for char in query):
+                continue
+            rank = 3
+        else:
+            continue
+        ranked.append((rank, position, cmd))
+    ranked.sort(key=lambda item: item[:2])
+    return [cmd for _rank, _position, cmd in ranked]
+
+
+@dataclass(frozen=True)
+class _CommandPaletteRow:
+    item: tk.Frame
+    accent: tk.Frame
+    name_label: tk.Label
+    shortcut_label: tk.Label
+
+
 class CommandPalette(tk.Toplevel, ThemedWidget):
     """
         Quick command palette (Ctrl+P).
@@ -36,10 +72,14 @@ class CommandPalette(tk.Toplevel, ThemedWidget):
             - Change Theme
             - Open Settings
         """
+
+    MAX_VISIBLE_COMMANDS = 10
+    FILTER_DEBOUNCE_MS = 40
     
     def __init__(self, parent, commands: List[Tuple[str, str, Callable]]):
         super().__init__(parent)
         self.commands = commands  # [(name, shortcut, callback), ...]
+        self._command_index = self._index_commands(commands)
         self.filtered_commands = commands.copy()
         self.selected_index = 0
         
@@ -81,6 +121,7 @@ class CommandPalette(tk.Toplevel, ThemedWidget):
         ).pack(fill=tk.X, pady=(3, 12))
         
         # Search entry
+        self._filter_after = None
         self.search_var = tk.StringVar()
         self.search_var.trace_add('write', self._filter)
         
@@ -102,6 +143,9 @@ class CommandPalette(tk.Toplevel, ThemedWidget):
         # Commands list
         self.list_frame = tk.Frame(shell, bg=theme.bg_secondary)
         self.list_frame.pack(fill=tk.BOTH, expand=True)
+        # Rows are created once and reconfigured on every keystroke.
+        self._rows: List[_CommandPaletteRow] = []
+        self._empty = None
         
         self._render_commands()
         
@@ -114,6 +158,15 @@ class CommandPalette(tk.Toplevel, ThemedWidget):
 
         self.grab_set()
 
+    def destroy(self):
+        self._cancel_filter()
+        super().destroy()
+
+    @staticmethod
+    def _index_commands(commands):
+        """Pair each command with its lowercased name, computed once per palette."""
+        return [(cmd[0].lower(), cmd) for cmd in commands]
+
     def _check_focus_lost(self):
         """Destroy only if focus actually left the palette (not to a child widget)."""
         try:
@@ -124,106 +177,156 @@ class CommandPalette(tk.Toplevel, ThemedWidget):
             self.destroy()
     
     def _filter(self, *args):
+        """Schedule a filter pass; a burst of keystrokes collapses into one."""
+        self._cancel_filter()
+        self._filter_after = self.after(self.FILTER_DEBOUNCE_MS, self._apply_filter)
+
+    def _cancel_filter(self):
+        if self._filter_after is not None:
+            try:
+                self.after_cancel(self._filter_after)
+            except (ValueError, tk.TclError):
+                pass
+            self._filter_after = None
+
+    def _flush_filter(self):
+        """Apply a pending filter now so navigation acts on the typed query."""
+        if self._filter_after is not None:
+            self._cancel_filter()
+            self._apply_filter()
+
+    def _apply_filter(self):
         """Filter commands based on search"""
+        self._filter_after = None
         query = self.search_var.get().lower()
         
         if query:
-            self.filtered_commands = [
-                cmd for cmd in self.commands
-                if query in cmd[0].lower()
-            ]
+            filtered = _rank_commands(query, self._command_index)
         else:
-            self.filtered_commands = self.commands.copy()
+            filtered = self.commands.copy()
+        if filtered == self.filtered_commands and self.selected_index == 0:
+            return  # e.g. a keystroke that narrows nothing; rows already match
         
+        self.filtered_commands = filtered
         self.selected_index = 0
         self._render_commands()
     
     def _render_commands(self):
-        """Render the commands list"""
+        """Render the commands list into the reusable row pool."""
         theme = get_theme()
-        
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
-
-        if not self.filtered_commands:
-            empty = tk.Frame(self.list_frame, bg=theme.bg_secondary)
-            empty.pack(fill=tk.BOTH, expand=True, pady=26)
-            tk.Label(
-                empty, text=_("No Matching Commands"),
-                bg=theme.bg_secondary, fg=theme.text_secondary,
-                font=FONTS.body(bold=True)
-            ).pack(fill=tk.X)
-            tk.Label(
-                empty, text=_("Try Add, Import, Export, Search, Theme, or Settings."),
-                bg=theme.bg_secondary, fg=theme.text_muted,
-                font=FONTS.small(), pady=6
-            ).pack(fill=tk.X)
+        visible = self.filtered_commands[:self.MAX_VISIBLE_COMMANDS]
+
+        if not visible:
+            for row in self._rows:
+                row.item.pack_forget()
+            if self._empty is None:
+                self._empty = self._create_empty_state(theme)
+            if not self._empty.winfo_manager():
+                self._empty.pack(fill=tk.BOTH, expand=True, pady=26)
             return
-        
-        for i, (name, shortcut, callback) in enumerate(self.filtered_commands[:10]):
-            is_selected = i == self.selected_index
-            
-            item = tk.Frame(
-                self.list_frame,
-                bg=theme.bg_tertiary if is_selected else theme.bg_secondary,
-                highlightbackground=theme.accent_primary if is_selected else theme.bg_secondary,
-                highlightthickness=1
-            )
-            item.pack(fill=tk.X, pady=2)
+        if self._empty is not None:
+            self._empty.pack_forget()
 
-            accent = tk.Frame(
-                item,
-                bg=theme.accent_primary if is_selected else item.cget('bg'),
-                width=3
-            )
-            accent.pack(side=tk.LEFT, fill=tk.Y)
-            
-            name_label = tk.Label(
-                item, text=name, bg=item.cget('bg'),
-                fg=theme.text_primary, font=FONTS.body(bold=is_selected),
-                anchor="w"
-            )
-            name_label.pack(side=tk.LEFT, padx=10, pady=9)
-            
-            shortcut_label = None
+        while len(self._rows) < len(visible):
+            self._rows.append(self._create_row(theme, len(self._rows)))
+
+        for i, row in enumerate(self._rows):
+            if i >= len(visible):
+                row.item.pack_forget()
+                continue
+            name, shortcut, _callback = visible[i]
+            self._style_row(row, theme, i == self.selected_index)
+            row.item._bop_accessible_name = name
+            row.name_label.configure(text=name)
             if shortcut:
-                shortcut_label = tk.Label(
-                    item, text=shortcut, bg=item.cget('bg'),
-                    fg=theme.text_secondary, font=FONTS.tiny()
-                )
-                shortcut_label.pack(side=tk.RIGHT, padx=10)
+                row.shortcut_label.configure(text=shortcut)
+                if not row.shortcut_label.winfo_manager():
+                    row.shortcut_label.pack(side=tk.RIGHT, padx=10)
+            else:
+                row.shortcut_label.pack_forget()
+            if not row.item.winfo_manager():
+                row.item.pack(fill=tk.X, pady=2)
 
-            make_keyboard_activatable(
-                item,
-                lambda idx=i: self._select_and_execute(idx),
-                accessible_name=name,
-            )
-            item.bind("<Enter>", lambda _event, idx=i: self._hover_command(idx))
-            for widget in [name_label, shortcut_label]:
-                if widget:
-                    widget.bind("<Enter>", lambda _event, idx=i: self._hover_command(idx))
-            route_pointer_to_control(item, name_label, shortcut_label)
+    @staticmethod
+    def _style_row(row: "_CommandPaletteRow", theme, is_selected: bool):
+        bg = theme.bg_tertiary if is_selected else theme.bg_secondary
+        row.item.configure(
+            bg=bg,
+            highlightbackground=theme.accent_primary if is_selected else theme.bg_secondary,
+        )
+        row.accent.configure(bg=theme.accent_primary if is_selected else bg)
+        row.name_label.configure(bg=bg, font=FONTS.body(bold=is_selected))
+        row.shortcut_label.configure(bg=bg)
+
+    def _select(self, index: int):
+        """Move the selection, restyling only the two rows involved."""
+        previous = self.selected_index
+        if index == previous:
+            return
+        self.selected_index = index
+        theme = get_theme()
+        shown = min(len(self.filtered_commands), len(self._rows))
+        for i in (previous, index):
+            if 0 <= i < shown:
+                self._style_row(self._rows[i], theme, i == index)
+
+    def _create_row(self, theme, index: int) -> "_CommandPaletteRow":
+        """Build one palette row bound to its slot in the visible list."""
+        item = tk.Frame(
+            self.list_frame, bg=theme.bg_secondary,
+            highlightbackground=theme.bg_secondary, highlightthickness=1
+        )
+        accent = tk.Frame(item, bg=theme.bg_secondary, width=3)
+        accent.pack(side=tk.LEFT, fill=tk.Y)
+
+        name_label = tk.Label(
+            item, bg=theme.bg_secondary, fg=theme.text_primary,
+            font=FONTS.body(), anchor="w"
+        )
+        name_label.pack(side=tk.LEFT, padx=10, pady=9)
+        shortcut_label = tk.Label(
+            item, bg=theme.bg_secondary, fg=theme.text_secondary, font=FONTS.tiny()
+        )
+
+        make_keyboard_activatable(item, lambda idx=index: self._select_and_execute(idx))
+        for widget in (item, name_label, shortcut_label):
+            widget.bind("<Enter>", lambda _event, idx=index: self._hover_command(idx))
+        route_pointer_to_control(item, name_label, shortcut_label)
+        return _CommandPaletteRow(item, accent, name_label, shortcut_label)
+
+    def _create_empty_state(self, theme):
+        empty = tk.Frame(self.list_frame, bg=theme.bg_secondary)
+        tk.Label(
+            empty, text=_("No Matching Commands"),
+            bg=theme.bg_secondary, fg=theme.text_secondary,
+            font=FONTS.body(bold=True)
+        ).pack(fill=tk.X)
+        tk.Label(
+            empty, text=_("Try Add, Import, Export, Search, Theme, or Settings."),
+            bg=theme.bg_secondary, fg=theme.text_muted,
+            font=FONTS.small(), pady=6
+        ).pack(fill=tk.X)
+        return empty
 
     def _hover_command(self, index: int):
-        if index != self.selected_index:
-            self.selected_index = index
-            self._render_commands()
+        self._select(index)
     
     def _move_up(self, e):
+        self._flush_filter()
         if self.selected_index > 0:
-            self.selected_index -= 1
-            self._render_commands()
+            self._select(self.selected_index - 1)
     
     def _move_down(self, e):
+        self._flush_filter()
         if self.selected_index < len(self.filtered_commands) - 1:
-            self.selected_index += 1
-            self._render_commands()
+            self._select(self.selected_index + 1)
     
     def _select_and_execute(self, index: int):
         self.selected_index = index
         self._execute()
     
     def _execute(self, e=None):
+        self._flush_filter()
         if self.filtered_commands and 0 <= self.selected_index < len(self.filtered_commands):
             _, _, callback = self.filtered_commands[self.selected_index]
             self.destroy()
@@ -249,6 +352,9 @@ class ViewMode(Enum):
 # =============================================================================
 class StatusBar(tk.Frame, ThemedWidget):
     """Status bar at the bottom of the window"""
+
+    PROGRESS_WIDTH = 200
+    PROGRESS_HEIGHT = 4
     
     def __init__(self, parent):
         theme = get_theme()
@@ -262,6 +368,7 @@ class StatusBar(tk.Frame, ThemedWidget):
             fg=theme.text_secondary, font=FONTS.small()
         )
         self.status_label.pack(side=tk.LEFT, padx=DesignTokens.SPACE_LG)
+        self._last_status = _("Ready")
         
         # Right: Counts
         self.counts_label = tk.Label(
@@ -269,17 +376,28 @@ class StatusBar(tk.Frame, ThemedWidget):
             fg=theme.text_muted, font=FONTS.small()
         )
         self.counts_label.pack(side=tk.RIGHT, padx=DesignTokens.SPACE_LG)
+        self._last_counts = ""
         
-        # Progress bar (hidden by default)
+        # Progress bar (hidden by default). The fill is a canvas rectangle so
+        # an update only moves its coordinates instead of re-running the placer.
         self.progress_frame = tk.Frame(self, bg=theme.bg_dark)
-        self.progress_bar = tk.Frame(self.progress_frame, bg=theme.accent_primary, height=4)
-        self.progress_bar.pack(side=tk.LEFT, fill=tk.Y)
+        self.progress_canvas = tk.Canvas(
+            self.progress_frame, width=self.PROGRESS_WIDTH, height=self.PROGRESS_HEIGHT,
+            bg=theme.bg_dark, highlightthickness=0, bd=0
+        )
+        self.progress_canvas.pack(side=tk.LEFT, anchor="center", expand=True)
+        self._progress_rect = self.progress_canvas.create_rectangle(
+            0, 0, 0, self.PROGRESS_HEIGHT, fill=theme.accent_primary, width=0
+        )
         
         self._progress_value = 0
+        self._progress_px = 0
     
     def set_status(self, message: str):
         """Set status message"""
-        self.status_label.configure(text=message)
+        if message != self._last_status:
+            self._last_status = message
+            self.status_label.configure(text=message)
     
     def set_counts(self, total: int, selected: int = 0, filtered: int = None):
         """Set bookmark counts"""
@@ -289,16 +407,20 @@ class StatusBar(tk.Frame, ThemedWidget):
             text = f"{selected} selected • {total} total"
         else:
             text = f"{total} bookmarks"
-        self.counts_label.configure(text=text)
+        if text != self._last_counts:
+            self._last_counts = text
+            self.counts_label.configure(text=text)
     
     def show_progress(self, value: float, message: str = ""):
         """Show progress bar"""
         if not self.progress_frame.winfo_ismapped():
             self.progress_frame.pack(side=tk.LEFT, fill=tk.Y, padx=20)
-            self.progress_frame.configure(width=200)
         
         self._progress_value = max(0, min(1, value))
-        self.progress_bar.place(relwidth=self._progress_value, relheight=1)
+        width = round(self._progress_value * self.PROGRESS_WIDTH)
+        if width != self._progress_px:
+            self._progress_px = width
+            self.progress_canvas.coords(self._progress_rect, 0, 0, width, self.PROGRESS_HEIGHT)
         
         if message:
             self.set_status(message)
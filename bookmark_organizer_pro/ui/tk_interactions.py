@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Callable
+import tkinter as tk
+from functools import lru_cache
+from typing import Callable, Iterable
 
 
 WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
 
 
+_LIST_SCRATCH_VAR = "::bop_combobox_values"
+
+
+@lru_cache(maxsize=8)
+def _quoted_tcl_list(interp, values: tuple) -> str:
+    # Tcl builds the list's string form once per distinct list; reading it
+    # back with ``set`` returns that string instead of a Python tuple.
+    interp.setvar(_LIST_SCRATCH_VAR, values)
+    try:
+        return interp.eval(f"set {_LIST_SCRATCH_VAR}")
+    finally:
+        interp.unsetvar(_LIST_SCRATCH_VAR)
+
+
+def combobox_values(widget, values: Iterable[str]) -> str:
+    """Return ``values`` as a ready-made Tcl list for a Combobox ``values=``.
+
+    Tkinter re-quotes every item whenever a Python list is passed, so dialogs
+    reopened with the same long category list reuse the cached string instead.
+    ``widget`` supplies the Tcl interpreter that does the quoting.
+    """
+    return _quoted_tcl_list(widget.tk, tuple(values))
+
+
 def _get_focus_color(fallback: str = "#5b8cff") -> str:
     try:
         from bookmark_organizer_pro.ui.widget_runtime import get_theme
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import tkinter as tk
+import hashlib
 import math
 import unicodedata
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from numbers import Real
 from pathlib import Path
 from tkinter import ttk
@@ -35,6 +37,40 @@ BOOKMARK_TABLE_ACTIONS = (
 SEMANTIC_TABLE_STATES = frozenset(("loading", "ready", "empty", "error"))
 
 
+@lru_cache(maxsize=1)
+def _placeholder_font():
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("arial.ttf", 10)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=256)
+def _placeholder_bitmap(letter: str, color: str, size: int = 16):
+    """Draw a letter-on-colour placeholder once per (letter, colour).
+
+    Only the PIL drawing is shared here; each table still wraps the bitmap in
+    its own Tk image because PhotoImages belong to one interpreter.
+    """
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (size, size), color)
+    draw = ImageDraw.Draw(img)
+    font = _placeholder_font()
+
+    # Center letter
+    bbox = draw.textbbox((0, 0), letter, font=font)
+    text_width = (bbox[2] - bbox[0]) if bbox else 0
+    text_height = bbox[3] - bbox[1]
+    x = (size - text_width) // 2
+    y = (size - text_height) // 2 - 2
+
+    draw.text((x, y), letter, fill="white", font=font)
+    return img
+
+
 def _item_id_key(item_id: str) -> tuple:
     """Sort numeric identifiers numerically and all other IDs predictably."""
     text = str(item_id)
@@ -75,12 +111,27 @@ def sort_table_item_ids(
     reverse: bool = False,
 ) -> List[str]:
     """Return one deterministic table order with missing values always last."""
+    item_ids = [str(item_id) for item_id in item_ids]
+    return sort_table_column(
+        item_ids,
+        {item_id: values_by_id.get(item_id, {}).get(column) for item_id in item_ids},
+        reverse=reverse,
+    )
+
+
+def sort_table_column(
+    item_ids: Iterable[str],
+    column_values: Mapping[str, object],
+    *,
+    reverse: bool = False,
+) -> List[str]:
+    """Order item IDs by one column's raw values (item ID -> value)."""
     present: List[str] = []
     missing: List[str] = []
     normalized: Dict[str, tuple] = {}
     for raw_item_id in item_ids:
         item_id = str(raw_item_id)
-        key = _typed_sort_key(values_by_id.get(item_id, {}).get(column))
+        key = _typed_sort_key(column_values.get(item_id))
         if key is None:
             missing.append(item_id)
         else:
@@ -148,6 +199,20 @@ def build_table_semantic_snapshot(
     }
 
 
+def decode_favicon(image_path: str):
+    """Load a cached favicon file as a 16px PIL image without touching Tk.
+
+    Safe to call from favicon worker threads; returns ``None`` when Pillow is
+    unavailable or the file cannot be read.
+    """
+    try:
+        from PIL import Image
+        with Image.open(image_path) as opened:
+            return opened.resize((16, 16), Image.Resampling.LANCZOS)
+    except Exception:
+        return None
+
+
 def accessible_list_mode_enabled(settings_file: Path = SETTINGS_FILE) -> bool:
     """Return the persisted preference for the native semantic table."""
     try:
@@ -170,21 +235,42 @@ class SortableTreeview(ttk.Treeview):
     Enhanced Treeview with:
     - Sortable columns (click header)
     - Favicon support
-    - Better performance
+    - Windowed rows: the full row list stays in Python and only the rows the
+      user has scrolled near are inserted into Tk
     """
+
+    # Rows inserted per window step. Scrolling past WINDOW_EDGE of the
+    # materialized rows appends the next step.
+    WINDOW_ROWS = 200
+    WINDOW_EDGE = 0.9
     
     def __init__(self, parent, columns, **kwargs):
-        super().__init__(parent, columns=columns, **kwargs)
+        self._yscroll_callback = kwargs.pop("yscrollcommand", None)
+        super().__init__(
+            parent, columns=columns, yscrollcommand=self._on_yscroll, **kwargs
+        )
         
+        self._columns = tuple(columns)
         self._sort_column = None
         self._sort_reverse = False
         self._base_headers: Dict[str, str] = {
-            column: "" for column in ("#0", *tuple(columns))
+            column: "" for column in ("#0", *self._columns)
         }
         self._updating_sort_headers = False
-        self._sort_values: Dict[str, Dict[str, object]] = {}
+        # Raw sort values stored per column (column -> item id -> value) so a
+        # header click reads one flat mapping instead of copying every row.
+        self._sort_columns: Dict[str, Dict[str, object]] = {}
+        self._rows: List[dict] = []
+        self._row_index: Dict[str, int] = {}
+        self._materialized = 0
+        # Set by select_all(): every logical row counts as selected while the
+        # native selection still covers all materialized rows.
+        self._all_selected = False
+        self._viewport_after = None
         self._favicon_images: Dict[str, tk.PhotoImage] = {}
+        self._favicon_bitmaps: Dict[bytes, tk.PhotoImage] = {}
         self._placeholder_images: Dict[str, tk.PhotoImage] = {}
+        self._blank_image = None
         self._semantic_state = "loading"
         self._semantic_message = ""
         
@@ -205,62 +291,356 @@ class SortableTreeview(ttk.Treeview):
             self._base_headers[str(column)] = str(kwargs["text"])
         return super().heading(column, option, **kwargs)
 
+    def configure(self, cnf=None, **kwargs):
+        """Route scroll notifications through the row window."""
+        if isinstance(cnf, dict):
+            kwargs = {**cnf, **kwargs}
+            cnf = None
+        if "yscrollcommand" in kwargs:
+            self._yscroll_callback = kwargs.pop("yscrollcommand") or None
+            if not kwargs and cnf is None:
+                return None
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
     def set_bookmark_rows(self, rows: Sequence[dict]):
-        """Replace native rows while preserving selection and active sorting."""
+        """Replace native rows while preserving selection and active sorting.
+
+        Rows already in Tk are diffed against the new first window rather
+        than deleted and re-inserted, so a refresh that changes a few
+        bookmarks only sends those rows across the Tcl boundary.
+        """
         selected = set(str(item) for item in self.selection())
-        existing = self.get_children("")
-        if existing:
-            super().delete(*existing)
-        self._sort_values = {}
+        all_selected = self._all_selected
+        previous = {row["iid"]: row for row in self._rows[:self._materialized]}
+        self._sort_columns = {}
+        self._rows = []
         for row in rows:
             item_id = str(row["iid"])
-            super().insert(
-                "",
-                "end",
-                iid=item_id,
-                text=str(row.get("text", "")),
-                values=tuple(row.get("values", ())),
-                tags=tuple(row.get("tags", ())),
-            )
-            self._sort_values[item_id] = dict(row.get("sort_values", {}))
+            logical = {
+                "iid": item_id,
+                "text": str(row.get("text", "")),
+                "values": tuple(row.get("values", ())),
+                "tags": tuple(row.get("tags", ())),
+            }
+            old = previous.get(item_id)
+            if old is not None:
+                for key in ("image", "favicon_path"):
+                    if key in old:
+                        logical[key] = old[key]
+            self._rows.append(logical)
+            for column, value in row.get("sort_values", {}).items():
+                self._sort_columns.setdefault(column, {})[item_id] = value
         if self._sort_column:
-            self._apply_sort(self._sort_column, emit=False)
+            self._order_rows(self._sort_column)
+            self._apply_sort_headers()
+        else:
+            self._index_rows()
+        self._all_selected = all_selected and bool(self._rows) and all(
+            row["iid"] in selected for row in self._rows
+        )
+        self._render_window(self.WINDOW_ROWS, previous)
+        if self._all_selected:
+            return
         restored = [
-            item_id for item_id in self.get_children("")
-            if str(item_id) in selected
+            row["iid"] for row in self._rows if row["iid"] in selected
         ]
         if restored:
-            self.selection_set(restored)
+            self.selection_set(restored, emit=False)
+
+    def _index_rows(self):
+        self._row_index = {row["iid"]: index for index, row in enumerate(self._rows)}
+
+    def _insert_row(self, index, row: dict):
+        """Insert one logical row with a single Tcl command.
+
+        Rows are inserted by the window in tight loops, so this skips the
+        ttk wrapper's per-call option formatting and hands Tcl the tuples
+        directly.
+        """
+        options = ["-text", row["text"], "-values", row["values"], "-tags", row["tags"]]
+        image = row.get("image")
+        if image is None and row.get("favicon_path"):
+            image = row["image"] = self._favicon_photo(row["favicon_path"])
+        if image is None:
+            image = self._blank_favicon()
+        if image is not None:
+            options += ["-image", image]
+        self.tk.call(self._w, "insert", "", index, "-id", row["iid"], *options)
+
+    def _blank_favicon(self):
+        """Return the one transparent 16px image shared by icon-less rows."""
+        if self._blank_image is None:
+            try:
+                self._blank_image = tk.PhotoImage(master=self, width=16, height=16)
+            except tk.TclError:
+                return None
+        return self._blank_image
+
+    def _materialize(self, count: int):
+        """Append logical rows to Tk until ``count`` rows are materialized."""
+        stop = min(count, len(self._rows))
+        added = self._rows[self._materialized:stop]
+        for row in added:
+            self._insert_row("end", row)
+        self._materialized = max(self._materialized, stop)
+        if self._all_selected and added:
+            super().selection_add([row["iid"] for row in added])
+
+    def _ensure_materialized(self, items) -> None:
+        """Insert every row up to the furthest requested item."""
+        if len(items) == 1 and isinstance(items[0], (tuple, list)):
+            items = items[0]
+        furthest = max(
+            (self._row_index.get(str(item), -1) for item in items),
+            default=-1,
+        )
+        if furthest >= self._materialized:
+            self._materialize(furthest + 1)
+
+    def _render_window(self, count: int, previous: Dict[str, dict] | None = None):
+        """Make Tk hold exactly the first ``count`` logical rows, in order.
+
+        Only the difference reaches Tk: rows leaving the window are deleted,
+        entering rows inserted, and kept rows moved only when out of place.
+        ``previous`` maps item ids to the row data Tk currently shows; kept
+        rows whose text, values or tags differ from it are rewritten.
+        """
+        count = min(max(0, count), len(self._rows))
+        wanted = self._rows[:count]
+        wanted_ids = {row["iid"] for row in wanted}
+        present = [str(item) for item in super().get_children("")]
+        stale = [item for item in present if item not in wanted_ids]
+        if stale:
+            super().delete(*stale)
+        native = [item for item in present if item in wanted_ids]
+        native_ids = set(native)
+        moved = set()
+        cursor = 0
+        for index, row in enumerate(wanted):
+            item_id = row["iid"]
+            while cursor < len(native) and native[cursor] in moved:
+                cursor += 1
+            if item_id not in native_ids:
+                self._insert_row(index, row)
+                continue
+            if cursor < len(native) and native[cursor] == item_id:
+                cursor += 1
+            else:
+                super().move(item_id, "", index)
+                moved.add(item_id)
+            old = previous.get(item_id) if previous else None
+            if old is not None and any(old[key] != row[key] for key in ("text", "values", "tags")):
+                super().item(item_id, text=row["text"], values=row["values"], tags=row["tags"])
+        self._materialized = count
+        if self._all_selected:
+            self._select_materialized()
+
+    def _on_yscroll(self, first, last):
+        """Forward scroll fractions and grow the window near its end."""
+        if self._yscroll_callback is not None:
+            self._yscroll_callback(first, last)
+        if self._materialized < len(self._rows) and float(last) >= self.WINDOW_EDGE:
+            self._materialize(self._materialized + self.WINDOW_ROWS)
+        if self._viewport_after is not None:
+            self.after_cancel(self._viewport_after)
+        self._viewport_after = self.after(50, self._emit_viewport_changed)
+
+    def _emit_viewport_changed(self):
+        self._viewport_after = None
+        self.event_generate("<<TableViewportChanged>>")
+
+    def destroy(self):
+        if self._viewport_after is not None:
+            self.after_cancel(self._viewport_after)
+            self._viewport_after = None
+        super().destroy()
+
+    def visible_item_ids(self, ahead: int = 0) -> List[str]:
+        """Return the logical rows currently inside the viewport.
+
+        ``ahead`` extends the list by that many following rows, whether or
+        not they are materialized yet, for work that should be ready before
+        the user scrolls to them.
+        """
+        count = self._materialized
+        if not count:
+            return []
+        first, last = (float(value) for value in super().yview())
+        start = max(0, int(first * count))
+        stop = min(count, math.ceil(last * count) + 1)
+        return [row["iid"] for row in self._rows[start:stop + max(0, ahead)]]
+
+    def insert(self, parent, index, iid=None, **kw):
+        """Insert one native row, keeping the logical row list in step."""
+        if parent:
+            return super().insert(parent, index, iid=iid, **kw)
+        self._materialize(len(self._rows))
+        item_id = str(super().insert(parent, index, iid=iid, **kw))
+        self._rows.insert(super().index(item_id), {
+            "iid": item_id,
+            "text": str(kw.get("text", "")),
+            "values": tuple(kw.get("values", ())),
+            "tags": tuple(kw.get("tags", ())),
+        })
+        self._index_rows()
+        self._materialized = len(self._rows)
+        return item_id
 
     def delete(self, *items):
-        for item in items:
-            self._sort_values.pop(str(item), None)
-        return super().delete(*items)
-
-    def _sort_source_values(self, column: str) -> Dict[str, Dict[str, object]]:
-        source: Dict[str, Dict[str, object]] = {}
-        for raw_item_id in self.get_children(""):
-            item_id = str(raw_item_id)
-            values = dict(self._sort_values.get(item_id, {}))
-            if column not in values:
-                values[column] = (
-                    self.item(item_id, "text")
-                    if column == "#0"
-                    else self.set(item_id, column)
-                )
-            source[item_id] = values
-        return source
+        removed = {str(item) for item in items}
+        for column_values in self._sort_columns.values():
+            for item_id in removed:
+                column_values.pop(item_id, None)
+        native = [
+            item for item in items
+            if self._row_index.get(str(item), -1) < self._materialized
+        ]
+        if removed & self._row_index.keys():
+            self._materialized -= sum(
+                1 for item_id in removed
+                if 0 <= self._row_index.get(item_id, -1) < self._materialized
+            )
+            self._rows = [row for row in self._rows if row["iid"] not in removed]
+            self._index_rows()
+        if native:
+            return super().delete(*native)
+        return None
 
-    def _apply_sort(self, column: str, *, emit: bool = True):
-        item_ids = [str(item) for item in self.get_children("")]
-        ordered = sort_table_item_ids(
-            item_ids,
+    def get_children(self, item=None):
+        """Return every logical top-level row, including unmaterialized ones."""
+        if item:
+            return super().get_children(item)
+        return tuple(row["iid"] for row in self._rows)
+
+    def exists(self, item):
+        return str(item) in self._row_index or super().exists(item)
+
+    def item(self, item, option=None, **kw):
+        self._ensure_materialized((item,))
+        result = super().item(item, option, **kw)
+        # Mirror edits into the logical row so re-materializing keeps them.
+        row = self._logical_row(item)
+        if row is not None:
+            if "text" in kw:
+                row["text"] = str(kw["text"])
+            if "values" in kw:
+                row["values"] = tuple(kw["values"])
+            if "tags" in kw:
+                row["tags"] = tuple(kw["tags"])
+        return result
+
+    def set(self, item, column=None, value=None):
+        self._ensure_materialized((item,))
+        result = super().set(item, column, value)
+        row = self._logical_row(item)
+        if value is not None and row is not None and column in self._columns:
+            values = list(row["values"])
+            index = self._columns.index(column)
+            values.extend([""] * (index + 1 - len(values)))
+            values[index] = value
+            row["values"] = tuple(values)
+        return result
+
+    def _logical_row(self, item) -> dict | None:
+        index = self._row_index.get(str(item))
+        return self._rows[index] if index is not None else None
+
+    def see(self, item):
+        self._ensure_materialized((item,))
+        return super().see(item)
+
+    def focus(self, item=None):
+        if item:
+            self._ensure_materialized((item,))
+        return super().focus(item)
+
+    def selection(self):
+        """Return selected ids, expanding select-all to unmaterialized rows.
+
+        Select-all is dropped as soon as the native selection stops covering
+        every materialized row, i.e. once the user picks something else.
+        """
+        native = super().selection()
+        if self._all_selected:
+            if len(native) == self._materialized:
+                return tuple(row["iid"] for row in self._rows)
+            self._all_selected = False
+        return native
+
+    def select_all(self):
+        """Select every logical row without inserting the rest into Tk.
+
+        Only the materialized window is selected natively; rows appended
+        later by scrolling join the selection as they are inserted.
+        """
+        self._all_selected = bool(self._rows)
+        self._select_materialized()
+        return self.get_children()
+
+    def _select_materialized(self):
+        super().selection_set([row["iid"] for row in self._rows[:self._materialized]])
+
+    def selection_set(self, *items, emit: bool = True):
+        """Select rows; ``emit=False`` skips the Tk call when nothing changes.
+
+        Native Treeview always queues <<TreeviewSelect>> for a selection
+        command, so programmatic restores that match the current selection
+        are dropped instead of producing a redundant event.
+        """
+        if len(items) == 1 and isinstance(items[0], (tuple, list)):
+            items = tuple(items[0])
+        self._all_selected = False
+        self._ensure_materialized(items)
+        if not emit and {str(item) for item in items} == set(super().selection()):
+            return None
+        return super().selection_set(*items)
+
+    def selection_add(self, *items):
+        self._ensure_materialized(items)
+        return super().selection_add(*items)
+
+    def _row_cell(self, row: dict, column: str) -> object:
+        if column == "#0":
+            return row["text"]
+        try:
+            return row["values"][self._columns.index(column)]
+        except (ValueError, IndexError):
+            return ""
+
+    def _sort_source_values(self, column: str) -> Dict[str, object]:
+        column_values = self._sort_columns.get(column, {})
+        if len(column_values) == len(self._rows):
+            return column_values
+        return {
+            row["iid"]: (
+                column_values[row["iid"]]
+                if row["iid"] in column_values
+                else str(self._row_cell(row, column))
+            )
+            for row in self._rows
+        }
+
+    def _order_rows(self, column: str):
+        """Reorder the logical rows; Tk is synchronized separately."""
+        rows_by_id = {row["iid"]: row for row in self._rows}
+        ordered = sort_table_column(
+            rows_by_id,
             self._sort_source_values(column),
-            column,
             reverse=self._sort_reverse,
         )
-        for index, item_id in enumerate(ordered):
-            self.move(item_id, "", index)
+        self._rows = [rows_by_id[item_id] for item_id in ordered]
+        self._index_rows()
+
+    def _apply_sort(self, column: str, *, emit: bool = True):
+        self._order_rows(column)
+        # Keep selected rows materialized so sorting never drops a selection.
+        furthest_selected = max(
+            (self._row_index.get(str(item), -1) for item in super().selection()),
+            default=-1,
+        )
+        self._render_window(max(self._materialized, furthest_selected + 1))
         self._apply_sort_headers()
         if emit:
             self.event_generate("<<TreeviewSort>>")
@@ -309,7 +689,11 @@ class SortableTreeview(ttk.Treeview):
 
     def set_sort_values(self, item_id: str, values: Dict[str, object]):
         """Attach stable raw values for columns with human-formatted cells."""
-        self._sort_values[str(item_id)] = dict(values)
+        item_id = str(item_id)
+        for column_values in self._sort_columns.values():
+            column_values.pop(item_id, None)
+        for column, value in values.items():
+            self._sort_columns.setdefault(column, {})[item_id] = value
 
     def set_semantic_state(self, state: str, message: str = ""):
         """Expose non-row table state through the native fallback contract."""
@@ -320,14 +704,12 @@ class SortableTreeview(ttk.Treeview):
 
     def semantic_snapshot(self) -> dict:
         """Return an inspectable native-table-equivalent semantic projection."""
-        columns = ("#0", *tuple(self["columns"]))
-        item_ids = [str(item) for item in self.get_children("")]
-        cells_by_id = {}
-        for item_id in item_ids:
-            values = tuple(self.item(item_id, "values"))
-            cells = [str(self.item(item_id, "text"))]
-            cells.extend(str(value) for value in values)
-            cells_by_id[item_id] = cells
+        columns = ("#0", *self._columns)
+        item_ids = [row["iid"] for row in self._rows]
+        cells_by_id = {
+            row["iid"]: [row["text"], *(str(value) for value in row["values"])]
+            for row in self._rows
+        }
         return build_table_semantic_snapshot(
             columns=columns,
             header_labels=self._base_headers,
@@ -352,84 +734,84 @@ class SortableTreeview(ttk.Treeview):
         columns = tuple(self["columns"])
         return str(columns[index - 1]) if index <= len(columns) else ""
     
-    def set_favicon(self, item_id: str, image_path: str):
-        """Set favicon for an item"""
+    def set_favicon(self, item_id: str, image_path: str, decoded=None):
+        """Set favicon for an item; rows outside the window decode on entry.
+
+        ``decoded`` is an already downscaled PIL image from
+        :func:`decode_favicon`, so only the PhotoImage wrap runs here.
+        """
+        if decoded is not None:
+            self._favicon_photo(image_path, decoded)
+        index = self._row_index.get(str(item_id))
+        if index is not None and index >= self._materialized:
+            row = self._rows[index]
+            row["favicon_path"] = image_path
+            row.pop("image", None)
+            return
+        photo = self._favicon_photo(image_path)
+        if photo is not None:
+            self._set_row_image(item_id, photo)
+
+    def needs_favicon_decode(self, image_path: str) -> bool:
+        """Whether a decoded bitmap for ``image_path`` would still be used."""
+        return image_path not in self._favicon_images
+
+    def _favicon_photo(self, image_path: str, decoded=None):
+        """Wrap one favicon file as a 16px image, once per path."""
         try:
             # Check if already loaded
             if image_path in self._favicon_images:
-                self.item(item_id, image=self._favicon_images[image_path])
-                return
-            
-            # Load image
-            if image_path.endswith('.ico'):
-                # For ICO files, try to load with PIL if available
-                try:
-                    from PIL import Image, ImageTk
-                    img = Image.open(image_path)
-                    img = img.resize((16, 16), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                except Exception:
-                    # Fallback - try direct load
-                    photo = tk.PhotoImage(file=image_path)
-                    try:
-                        photo = photo.subsample(photo.width() // 16, photo.height() // 16)
-                    except Exception:
-                        pass
+                return self._favicon_images[image_path]
+
+            if decoded is None:
+                decoded = decode_favicon(image_path)
+            if decoded is not None:
+                # Sites often share one icon across subdomains; keep a single
+                # Tk image per distinct bitmap rather than one per file.
+                bitmap = hashlib.blake2b(
+                    decoded.mode.encode() + decoded.tobytes(), digest_size=16,
+                ).digest()
+                photo = self._favicon_bitmaps.get(bitmap)
+                if photo is None:
+                    from PIL import ImageTk
+                    photo = self._favicon_bitmaps[bitmap] = ImageTk.PhotoImage(decoded)
             else:
-                # PNG or other format
+                photo = tk.PhotoImage(file=image_path)
                 try:
-                    from PIL import Image, ImageTk
-                    img = Image.open(image_path)
-                    img = img.resize((16, 16), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
+                    photo = photo.subsample(max(1, photo.width() // 16), max(1, photo.height() // 16))
                 except Exception:
-                    photo = tk.PhotoImage(file=image_path)
-                    try:
-                        photo = photo.subsample(max(1, photo.width() // 16), max(1, photo.height() // 16))
-                    except Exception:
-                        pass
-            
+                    pass
+
             self._favicon_images[image_path] = photo
-            self.item(item_id, image=photo)
+            return photo
         except Exception:
-            pass  # Silently fail - favicon not critical
+            return None  # Silently fail - favicon not critical
     
     def set_placeholder(self, item_id: str, letter: str, color: str):
         """Set placeholder image for an item"""
         key = f"{letter}_{color}"
         
         if key not in self._placeholder_images:
-            # Create a simple colored square with letter
-            # This is a minimal placeholder - real implementation would draw properly
             try:
-                size = 16
-                from PIL import Image, ImageDraw, ImageFont, ImageTk
-                
-                img = Image.new('RGB', (size, size), color)
-                draw = ImageDraw.Draw(img)
-                
-                # Draw letter
-                try:
-                    font = ImageFont.truetype("arial.ttf", 10)
-                except Exception:
-                    font = ImageFont.load_default()
-                
-                # Center letter
-                bbox = draw.textbbox((0, 0), letter, font=font)
-                text_width = (bbox[2] - bbox[0]) if bbox else 0
-                text_height = bbox[3] - bbox[1]
-                x = (size - text_width) // 2
-                y = (size - text_height) // 2 - 2
-                
-                draw.text((x, y), letter, fill="white", font=font)
-                
-                photo = ImageTk.PhotoImage(img)
-                self._placeholder_images[key] = photo
+                from PIL import ImageTk
+
+                self._placeholder_images[key] = ImageTk.PhotoImage(
+                    _placeholder_bitmap(letter, color)
+                )
             except Exception:
                 return  # Can't create placeholder
         
         if key in self._placeholder_images:
-            self.item(item_id, image=self._placeholder_images[key])
+            self._set_row_image(item_id, self._placeholder_images[key])
+
+    def _set_row_image(self, item_id: str, image):
+        """Apply an image now, or when the row enters the window."""
+        index = self._row_index.get(str(item_id))
+        if index is not None:
+            self._rows[index]["image"] = image
+            if index >= self._materialized:
+                return
+        super().item(item_id, image=image)
 
 
 class VirtualBookmarkSheet(tk.Frame):
@@ -461,6 +843,7 @@ class VirtualBookmarkSheet(tk.Frame):
         self._sort_reverse = False
         self._hovered_row: int | None = None
         self._suppress_selection_events = False
+        self._select_seen = False
         self._semantic_state = "loading"
         self._semantic_message = ""
 
@@ -522,9 +905,14 @@ class VirtualBookmarkSheet(tk.Frame):
             "copy",
             "arrowkeys",
         )
-        self._sheet.extra_bindings("select", lambda _event: self._sync_selection_from_sheet())
+        self._sheet.extra_bindings("select", self._on_sheet_select)
         try:
             # Table-body clicks update the actionable selection; header clicks sort.
+            # The press tag runs ahead of tksheet's own bindings, so a click
+            # clears the select flag before any select it triggers sets it.
+            press_tag = f"BopTablePress{id(self)}"
+            self._sheet.MT.bind_class(press_tag, "<ButtonPress-1>", self._on_table_press)
+            self._sheet.MT.bindtags((press_tag,) + self._sheet.MT.bindtags())
             self._sheet.MT.bind("<ButtonRelease-1>", self._on_table_release, add="+")
             self._sheet.MT.bind("<Motion>", self._on_table_motion, add="+")
             self._sheet.MT.bind("<Leave>", self._on_table_leave, add="+")
@@ -571,10 +959,9 @@ class VirtualBookmarkSheet(tk.Frame):
             for row in rows
         }
         if self._sort_column:
-            self._row_to_id = sort_table_item_ids(
+            self._row_to_id = sort_table_column(
                 self._row_to_id,
                 self._sort_source_values(self._sort_column),
-                self._sort_column,
                 reverse=self._sort_reverse,
             )
             self._id_to_row = {
@@ -758,10 +1145,14 @@ class VirtualBookmarkSheet(tk.Frame):
         if row is not None:
             self._sheet.see(row, 0)
 
-    def set_favicon(self, _item_id: str, _image_path: str):
+    def set_favicon(self, _item_id: str, _image_path: str, _decoded=None):
         """tksheet does not expose per-row images; retain API compatibility."""
         return None
 
+    def needs_favicon_decode(self, _image_path: str) -> bool:
+        """Favicons are never drawn here, so decoding them is wasted work."""
+        return False
+
     def set_placeholder(self, _item_id: str, _letter: str, _color: str):
         return None
 
@@ -914,9 +1305,22 @@ class VirtualBookmarkSheet(tk.Frame):
             self._selected_ids = selected
             self.event_generate("<<TreeviewSelect>>")
 
+    def _on_sheet_select(self, _event=None):
+        self._select_seen = True
+        self._sync_selection_from_sheet()
+
+    def _on_table_press(self, _event):
+        # A select seen before this click (arrow keys, programmatic) must not
+        # excuse the click's release from syncing.
+        self._select_seen = False
+
     def _on_table_release(self, _event):
         # Guarantees the actionable selection tracks the visual selection even
         # when tksheet's "select" extra-binding does not fire for a plain click.
+        # When it did fire during this click the selection is already synced.
+        if self._select_seen:
+            self._select_seen = False
+            return
         self.after_idle(self._sync_selection_from_sheet)
 
     def _on_table_motion(self, event):
@@ -954,22 +1358,22 @@ class VirtualBookmarkSheet(tk.Frame):
             return
         self._sort_by_column(self._columns[column_index])
 
-    def _sort_source_values(self, column: str) -> Dict[str, Dict[str, object]]:
-        source: Dict[str, Dict[str, object]] = {}
+    def _sort_source_values(self, column: str) -> Dict[str, object]:
+        source: Dict[str, object] = {}
+        value_index = None if column == "#0" else self._value_index(column)
         for item_id in self._row_to_id:
-            values = dict(self._item_sort_values.get(item_id, {}))
-            if column not in values:
-                if column == "#0":
-                    values[column] = self._item_text.get(item_id, "")
-                else:
-                    value_index = self._value_index(column)
-                    display_values = self._item_values.get(item_id, ())
-                    values[column] = (
-                        display_values[value_index]
-                        if value_index is not None and value_index < len(display_values)
-                        else ""
-                    )
-            source[item_id] = values
+            values = self._item_sort_values.get(item_id, {})
+            if column in values:
+                source[item_id] = values[column]
+            elif column == "#0":
+                source[item_id] = self._item_text.get(item_id, "")
+            else:
+                display_values = self._item_values.get(item_id, ())
+                source[item_id] = (
+                    display_values[value_index]
+                    if value_index is not None and value_index < len(display_values)
+                    else ""
+                )
         return source
 
     def _sort_by_column(self, column: str):
@@ -977,10 +1381,9 @@ class VirtualBookmarkSheet(tk.Frame):
         self._sort_column = column
         self._sort_reverse = reverse
         selected = set(self._selected_ids)
-        self._row_to_id = sort_table_item_ids(
+        self._row_to_id = sort_table_column(
             self._row_to_id,
             self._sort_source_values(column),
-            column,
             reverse=reverse,
         )
         self._id_to_row = {item_id: index for index, item_id in enumerate(self._row_to_id)}
@@ -1010,10 +1413,9 @@ class VirtualBookmarkSheet(tk.Frame):
         self._sort_column = column
         self._sort_reverse = bool(reverse)
         selected = set(self._selected_ids)
-        self._row_to_id = sort_table_item_ids(
+        self._row_to_id = sort_table_column(
             self._row_to_id,
             self._sort_source_values(column),
-            column,
             reverse=self._sort_reverse,
         )
         self._id_to_row = {
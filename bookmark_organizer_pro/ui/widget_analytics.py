@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 import tkinter as tk
+from operator import itemgetter
 from tkinter import ttk
 from typing import Any, Dict
 
@@ -12,6 +14,7 @@ from .foundation import FONTS, DesignTokens, truncate_middle
 from .tk_interactions import bind_scoped_mousewheel
 from .widget_controls import ModernButton, ThemedWidget
 from .widget_runtime import apply_window_chrome, get_theme
+from .window_geometry import apply_screen_aware_geometry
 
 
 # =============================================================================
@@ -19,16 +22,19 @@ from .widget_runtime import apply_window_chrome, get_theme
 # =============================================================================
 class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
     """Dashboard showing bookmark analytics and statistics"""
+
+    # Sections longer than this render in a read-only Text instead of a Label.
+    LABEL_SECTION_MAX_LINES = 40
     
     def __init__(self, parent, stats: Dict[str, Any]):
         super().__init__(parent)
         if hasattr(stats, "get_statistics"):
             stats = stats.get_statistics()
         self.stats = stats
-        theme = get_theme()
+        self._theme = theme = get_theme()
         
         self.title(_("Analytics"))
-        self.geometry("800x650")
+        apply_screen_aware_geometry(self, 800, 650)
         self.configure(bg=theme.bg_primary)
         self.transient(parent)
         
@@ -132,6 +138,26 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
         # Category Distribution
         self._create_section(content, "Top Categories", self._get_category_chart())
         
+        # Sections below the fold are built once the window has been shown
+        self._content = content
+        self._sections_built = False
+        self.after(0, self._build_remaining_sections)
+        
+        # Close button
+        btn_frame = tk.Frame(self, bg=theme.bg_primary)
+        btn_frame.pack(fill=tk.X, padx=20, pady=15)
+        
+        ModernButton(
+            btn_frame, text=_("Close"), command=self.destroy
+        ).pack(side=tk.RIGHT)
+    
+    def _build_remaining_sections(self):
+        """Build the age, domain, and issue sections below the fold once."""
+        if self._sections_built or not self.winfo_exists():
+            return
+        self._sections_built = True
+        content = self._content
+        
         # Age Distribution
         self._create_section(content, "Bookmark Age Distribution", self._get_age_chart())
         
@@ -142,20 +168,10 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
         issues = self._get_issues()
         if issues:
             self._create_section(content, "Issues to Address", issues)
-        
-        # Close button
-        btn_frame = tk.Frame(self, bg=theme.bg_primary)
-        btn_frame.pack(fill=tk.X, padx=20, pady=15)
-        
-        ModernButton(
-            btn_frame, text=_("Close"), command=self.destroy
-        ).pack(side=tk.RIGHT)
-        
-        self.center_window()
     
     def _create_stat_card(self, parent, title: str, value: str, icon: str, col: int):
         """Create a stat card"""
-        theme = get_theme()
+        theme = self._theme
         
         card = tk.Frame(parent, bg=theme.bg_secondary)
         card.grid(row=0, column=col, padx=5, pady=5, sticky="nsew")
@@ -178,7 +194,7 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
     
     def _create_section(self, parent, title: str, content_text: str):
         """Create a section with title and content"""
-        theme = get_theme()
+        theme = self._theme
         
         frame = tk.Frame(
             parent, bg=theme.bg_secondary,
@@ -191,11 +207,25 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
             fg=theme.text_primary, font=FONTS.body(bold=True)
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
-        tk.Label(
-            frame, text=content_text, bg=theme.bg_secondary,
-            fg=theme.text_secondary, font=FONTS.mono(),
-            justify=tk.LEFT
-        ).pack(anchor="w", padx=15, pady=(0, 10))
+        line_count = content_text.count("\n") + 1
+        if line_count <= self.LABEL_SECTION_MAX_LINES:
+            tk.Label(
+                frame, text=content_text, bg=theme.bg_secondary,
+                fg=theme.text_secondary, font=FONTS.mono(),
+                justify=tk.LEFT
+            ).pack(anchor="w", padx=15, pady=(0, 10))
+            return
+
+        # Long listings go into a read-only Text, which lays out and redraws
+        # only the visible lines instead of one huge multi-line label.
+        text = tk.Text(
+            frame, height=min(20, line_count), wrap=tk.NONE, bd=0,
+            bg=theme.bg_secondary, fg=theme.text_secondary, font=FONTS.mono(),
+            relief=tk.FLAT, cursor="arrow", highlightthickness=0
+        )
+        text.insert("1.0", content_text)
+        text.configure(state=tk.DISABLED)
+        text.pack(fill=tk.X, padx=15, pady=(0, 10))
     
     def _calculate_health_score(self) -> int:
         """Calculate collection health score"""
@@ -236,15 +266,18 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
             return "Import or add bookmarks to populate category signals."
         
         # Sort and take top 8
-        sorted_cats = [item for item in sorted(counts.items(), key=lambda x: -x[1]) if item[1] > 0][:8]
+        sorted_cats = heapq.nlargest(
+            8, (item for item in counts.items() if item[1] > 0), key=itemgetter(1)
+        )
         if not sorted_cats:
             return "No active categories yet."
 
-        lines = []
-        for cat, count in sorted_cats:
-            pct = (count / total) * 100
-            name = truncate_middle(cat, 30)
-            lines.append(f"{name:<34} {count:>4}  {pct:>5.1f}%")
+        scale = 100.0 / total
+        row = "{:<34} {:>4}  {:>5.1f}%".format
+        lines = [
+            row(truncate_middle(cat, 30), count, count * scale)
+            for cat, count in sorted_cats
+        ]
         
         return "\n".join(lines)
     
@@ -256,10 +289,9 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
         if total == 0:
             return "Import or add bookmarks to populate age distribution."
         
-        lines = []
-        for period, count in age_dist.items():
-            pct = (count / total) * 100
-            lines.append(f"{period:<16} {count:>4}  {pct:>5.1f}%")
+        scale = 100.0 / total
+        row = "{:<16} {:>4}  {:>5.1f}%".format
+        lines = [row(period, count, count * scale) for period, count in age_dist.items()]
         
         return "\n".join(lines)
     
@@ -270,11 +302,8 @@ class AnalyticsDashboard(tk.Toplevel, ThemedWidget):
         if not domains:
             return "Import or add bookmarks to populate domain signals."
         
-        lines = []
-        for domain, count in domains:
-            lines.append(f"  {domain:35} {count:4}")
-        
-        return "\n".join(lines)
+        row = "  {:35} {:4}".format
+        return "\n".join([row(domain, count) for domain, count in domains])
     
     def _get_issues(self) -> str:
         """Get issues to address"""
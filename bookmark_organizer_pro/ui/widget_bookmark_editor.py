@@ -12,7 +12,7 @@ from bookmark_organizer_pro.managers import TagManager
 from bookmark_organizer_pro.models import Bookmark
 
 from .foundation import FONTS, DesignTokens, readable_text_on
-from .tk_interactions import bind_scoped_mousewheel, make_keyboard_activatable
+from .tk_interactions import bind_scoped_mousewheel, combobox_values, make_keyboard_activatable
 from .widget_controls import ModernButton, TagEditor, ThemedWidget
 from .widget_runtime import _open_external_url, apply_window_chrome, get_theme
 from .window_geometry import apply_screen_aware_geometry
@@ -23,6 +23,11 @@ from .window_geometry import apply_screen_aware_geometry
 # =============================================================================
 class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
     """Dialog for editing a single bookmark's fields."""
+
+    # Tk variable sets handed back by closed editors as (interpreter, vars),
+    # so reopening the editor resets values instead of creating Tcl variables.
+    _var_pool: List[tuple] = []
+    _VAR_POOL_LIMIT = 4
     
     def __init__(self, parent, bookmark: Bookmark = None, 
                  categories: List[str] = None, tag_manager: TagManager = None,
@@ -35,7 +40,7 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         self.on_save = on_save
         self.result = None
         
-        theme = get_theme()
+        self._theme = theme = get_theme()
         
         self.title(_("Edit Bookmark") if bookmark else _("Add Bookmark"))
         apply_screen_aware_geometry(self, 640, 760)
@@ -105,7 +110,9 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         
         # URL
         self._create_field(content, _("URL"), 1)
-        self.url_var = tk.StringVar(value=bookmark.url if bookmark else "")
+        (self.url_var, self.title_var, self.category_var,
+         self.pinned_var, self.archived_var, self.read_later_var) = self._pooled_vars = self._acquire_vars()
+        self.url_var.set(bookmark.url if bookmark else "")
         self.url_entry = tk.Entry(
             content, textvariable=self.url_var,
             bg=theme.bg_secondary, fg=theme.text_primary,
@@ -119,11 +126,11 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
             bg=theme.bg_primary, fg=theme.text_muted, font=FONTS.tiny(), anchor="w"
         )
         self.url_feedback.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(0, 14))
-        self.url_var.trace_add("write", lambda *_: self._clear_validation())
+        self._url_trace = self.url_var.trace_add("write", lambda *_: self._clear_validation())
         
         # Title
         self._create_field(content, _("Title"), 4)
-        self.title_var = tk.StringVar(value=bookmark.title if bookmark else "")
+        self.title_var.set(bookmark.title if bookmark else "")
         self.title_entry = tk.Entry(
             content, textvariable=self.title_var,
             bg=theme.bg_secondary, fg=theme.text_primary,
@@ -140,10 +147,10 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         
         # Category
         self._create_field(content, _("Category"), 7)
-        self.category_var = tk.StringVar(value=bookmark.category if bookmark else "Uncategorized / Needs Review")
+        self.category_var.set(bookmark.category if bookmark else "Uncategorized / Needs Review")
         self.category_combo = ttk.Combobox(
             content, textvariable=self.category_var,
-            values=self.categories,
+            values=combobox_values(content, self.categories),
             font=FONTS.body()
         )
         self.category_combo.grid(row=8, column=0, columnspan=2, sticky="ew", pady=(0, 15))
@@ -239,19 +246,19 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         checks_frame = tk.Frame(content, bg=theme.bg_primary)
         checks_frame.grid(row=checks_row, column=0, columnspan=2, sticky="w", pady=(0, 15))
         
-        self.pinned_var = tk.BooleanVar(value=bookmark.is_pinned if bookmark else False)
+        self.pinned_var.set(bookmark.is_pinned if bookmark else False)
         self.pinned_check = ttk.Checkbutton(
             checks_frame, text=_("Pinned"), variable=self.pinned_var
         )
         self.pinned_check.pack(side=tk.LEFT, padx=(0, 20))
         
-        self.archived_var = tk.BooleanVar(value=bookmark.is_archived if bookmark else False)
+        self.archived_var.set(bookmark.is_archived if bookmark else False)
         self.archived_check = ttk.Checkbutton(
             checks_frame, text=_("Archived"), variable=self.archived_var
         )
         self.archived_check.pack(side=tk.LEFT, padx=(0, 20))
 
-        self.read_later_var = tk.BooleanVar(value=bookmark.read_later if bookmark else False)
+        self.read_later_var.set(bookmark.read_later if bookmark else False)
         self.read_later_check = ttk.Checkbutton(
             checks_frame, text=_("Read Later"), variable=self.read_later_var
         )
@@ -280,12 +287,41 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         
         self.bind("<Escape>", lambda e: self.destroy())
         self.bind("<Control-Return>", lambda e: self._save())
-        self.center_window()
         self.url_entry.focus_set()
     
+    def _acquire_vars(self) -> tuple:
+        """Take a pooled variable set for this interpreter, or create one."""
+        pool = BookmarkEditorDialog._var_pool
+        while pool:
+            interp, variables = pool.pop()
+            if interp is self.tk:
+                return variables
+        return (
+            tk.StringVar(self), tk.StringVar(self), tk.StringVar(self),
+            tk.BooleanVar(self), tk.BooleanVar(self), tk.BooleanVar(self),
+        )
+
+    def _release_vars(self):
+        """Detach this editor's trace and return its variables to the pool."""
+        variables = getattr(self, "_pooled_vars", None)
+        if variables is None:
+            return
+        self._pooled_vars = None
+        try:
+            self.url_var.trace_remove("write", self._url_trace)
+        except (AttributeError, tk.TclError):
+            return
+        pool = BookmarkEditorDialog._var_pool
+        if len(pool) < self._VAR_POOL_LIMIT:
+            pool.append((self.tk, variables))
+
+    def destroy(self):
+        self._release_vars()
+        super().destroy()
+
     def _create_field(self, parent, label: str, row: int):
         """Create a field label"""
-        theme = get_theme()
+        theme = self._theme
         tk.Label(
             parent, text=label, bg=theme.bg_primary,
             fg=theme.text_secondary, font=FONTS.small(bold=True)
@@ -295,7 +331,7 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         """Reset inline validation once the user edits the URL."""
         if not hasattr(self, "url_feedback"):
             return
-        theme = get_theme()
+        theme = self._theme
         self.url_feedback.configure(
             text=_("Paste a full URL, or type a domain and the app will add https://."),
             fg=theme.text_muted,
@@ -304,7 +340,7 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
 
     def _show_url_error(self, message: str):
         """Show URL validation inline instead of interrupting the dialog flow."""
-        theme = get_theme()
+        theme = self._theme
         self.url_feedback.configure(text=message, fg=theme.accent_error)
         self.url_entry.configure(highlightbackground=theme.accent_error)
     
@@ -321,16 +357,25 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
+        # Read each control once; the notes buffer is a Tcl copy per get()
+        title = title or url
+        category = self.category_var.get()
+        tags = self.tag_editor.get_tags()
+        notes = self.notes_text.get("1.0", tk.END).strip()
+        is_pinned = self.pinned_var.get()
+        is_archived = self.archived_var.get()
+        read_later = self.read_later_var.get()
+        
         # Update bookmark object if editing existing
         if self.bookmark:
             self.bookmark.url = url
-            self.bookmark.title = title or url
-            self.bookmark.category = self.category_var.get()
-            self.bookmark.tags = self.tag_editor.get_tags()
-            self.bookmark.notes = self.notes_text.get("1.0", tk.END).strip()
-            self.bookmark.is_pinned = self.pinned_var.get()
-            self.bookmark.is_archived = self.archived_var.get()
-            self.bookmark.read_later = self.read_later_var.get()
+            self.bookmark.title = title
+            self.bookmark.category = category
+            self.bookmark.tags = tags
+            self.bookmark.notes = notes
+            self.bookmark.is_pinned = is_pinned
+            self.bookmark.is_archived = is_archived
+            self.bookmark.read_later = read_later
             self.bookmark.modified_at = datetime.now().isoformat()
             
             # Call on_save callback if provided
@@ -339,13 +384,13 @@ class BookmarkEditorDialog(tk.Toplevel, ThemedWidget):
         
         self.result = {
             "url": url,
-            "title": title or url,
-            "category": self.category_var.get(),
-            "tags": self.tag_editor.get_tags(),
-            "notes": self.notes_text.get("1.0", tk.END).strip(),
-            "is_pinned": self.pinned_var.get(),
-            "is_archived": self.archived_var.get(),
-            "read_later": self.read_later_var.get(),
+            "title": title,
+            "category": category,
+            "tags": list(tags),
+            "notes": notes,
+            "is_pinned": is_pinned,
+            "is_archived": is_archived,
+            "read_later": read_later,
         }
         self.destroy()
     
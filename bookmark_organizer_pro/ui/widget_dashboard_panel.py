@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 import tkinter as tk
+from operator import itemgetter
 
 from bookmark_organizer_pro.i18n import _, format_message, layout_anchor, layout_side
 from bookmark_organizer_pro.managers import BookmarkManager
@@ -98,7 +100,7 @@ class DashboardPanel(tk.Frame, ThemedWidget):
         cat_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
         cat_counts = stats.category_counts
-        sorted_cats = sorted(cat_counts.items(), key=lambda x: -x[1])[:10]
+        sorted_cats = heapq.nlargest(10, cat_counts.items(), key=itemgetter(1))
         
         for cat, count in sorted_cats:
             self._create_bar(cat_frame, cat, count, stats.total_bookmarks)
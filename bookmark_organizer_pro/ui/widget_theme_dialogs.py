@@ -426,6 +426,7 @@ class ThemeSelectorDialog(tk.Toplevel, ThemedWidget):
         super().__init__(parent)
         self.theme_manager = theme_manager
         self.result = None
+        self._preview_images: Dict[Tuple[str, str], tk.PhotoImage] = {}
         theme = get_theme()
         
         self.title(_("Theme Settings"))
@@ -527,17 +528,11 @@ class ThemeSelectorDialog(tk.Toplevel, ThemedWidget):
             )
             item_frame.pack(fill=tk.X, padx=5, pady=3)
             
-            # Color preview
-            preview_frame = tk.Frame(item_frame, bg=theme.bg_secondary, width=60, height=40)
-            preview_frame.pack(side=tk.LEFT, padx=10, pady=10)
-            preview_frame.pack_propagate(False)
-            
-            # Show theme colors
-            colors_preview = tk.Frame(preview_frame, bg=theme_info.colors.bg_primary)
-            colors_preview.pack(fill=tk.BOTH, expand=True)
-            
-            accent_bar = tk.Frame(colors_preview, bg=theme_info.colors.accent_primary, height=8)
-            accent_bar.pack(side=tk.BOTTOM, fill=tk.X)
+            # Color preview: one cached image instead of nested frames
+            tk.Label(
+                item_frame, image=self._preview_image(theme_info.colors),
+                bg=theme.bg_secondary, bd=0,
+            ).pack(side=tk.LEFT, padx=10, pady=10)
             
             # Theme info
             info_frame = tk.Frame(item_frame, bg=item_frame.cget('bg'))
@@ -547,20 +542,22 @@ class ThemeSelectorDialog(tk.Toplevel, ThemedWidget):
             if is_selected:
                 name_text += " ✓"
             
-            tk.Label(
+            name_label = tk.Label(
                 info_frame, text=name_text,
                 bg=info_frame.cget('bg'),
                 fg=theme.text_primary if not is_selected else theme.accent_primary,
                 font=FONTS.small(bold=is_selected)
-            ).pack(anchor="w")
+            )
+            name_label.pack(anchor="w")
             
             mode_text = _("Dark") if theme_info.is_dark else _("Light")
-            tk.Label(
+            meta_label = tk.Label(
                 info_frame, text=format_message('{value_0} • {value_1}', value_0=mode_text, value_1=theme_info.author),
                 bg=info_frame.cget('bg'),
                 fg=theme.text_secondary,
                 font=FONTS.small()
-            ).pack(anchor="w")
+            )
+            meta_label.pack(anchor="w")
             
             # Select button
             if not is_selected:
@@ -570,31 +567,33 @@ class ThemeSelectorDialog(tk.Toplevel, ThemedWidget):
                 )
                 select_btn.pack(side=tk.RIGHT, padx=10)
             
-            # Hover effect
-            def on_enter(e, f=item_frame):
-                if f.cget('bg') != theme.bg_tertiary:
-                    f.configure(bg=theme.bg_hover)
-                    for child in f.winfo_children():
-                        if isinstance(child, ModernButton):
-                            continue
-                        if isinstance(child, tk.Frame):
-                            for subchild in child.winfo_children():
-                                if isinstance(subchild, tk.Label):
-                                    subchild.configure(bg=theme.bg_hover)
-            
-            def on_leave(e, f=item_frame, sel=is_selected):
-                bg = theme.bg_tertiary if sel else theme.bg_secondary
-                f.configure(bg=bg)
-                for child in f.winfo_children():
-                    if isinstance(child, ModernButton):
-                        continue
-                    if isinstance(child, tk.Frame):
-                        for subchild in child.winfo_children():
-                            if isinstance(subchild, tk.Label):
-                                subchild.configure(bg=bg)
-            
-            item_frame.bind("<Enter>", on_enter)
-            item_frame.bind("<Leave>", on_leave)
+            # Hover effect: repaint the row's own surfaces, no child walks
+            if not is_selected:
+                parts = (item_frame, info_frame, name_label, meta_label)
+                item_frame.bind(
+                    "<Enter>",
+                    lambda _e, p=parts: self._paint_theme_row(p, theme.bg_hover),
+                )
+                item_frame.bind(
+                    "<Leave>",
+                    lambda _e, p=parts: self._paint_theme_row(p, theme.bg_secondary),
+                )
+
+    @staticmethod
+    def _paint_theme_row(parts, bg: str):
+        for widget in parts:
+            widget.configure(bg=bg)
+
+    def _preview_image(self, colors: ThemeColors) -> tk.PhotoImage:
+        """Return a 60x40 swatch (background with accent bar), once per palette."""
+        key = (colors.bg_primary, colors.accent_primary)
+        image = self._preview_images.get(key)
+        if image is None:
+            image = tk.PhotoImage(master=self, width=60, height=40)
+            image.put(colors.bg_primary, to=(0, 0, 60, 32))
+            image.put(colors.accent_primary, to=(0, 32, 60, 40))
+            self._preview_images[key] = image
+        return image
     
     def _select_theme(self, theme_name: str):
         """Select a theme"""
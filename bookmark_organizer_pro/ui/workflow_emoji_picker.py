@@ -98,45 +98,62 @@ class EmojiPicker(tk.Toplevel, ThemedWidget):
         self.center_window()
     
     def _render_emojis(self, filter_text: str = ""):
-        """Render emoji grid"""
-        theme = get_theme()
-        
-        for widget in self.emoji_frame.winfo_children():
-            widget.destroy()
-        
-        for category, emojis in self.EMOJIS.items():
-            if filter_text:
-                # Filter by category name or emoji
-                if filter_text.lower() not in category.lower():
-                    emojis = ''.join(e for e in emojis if filter_text in e)
-                    if not emojis:
-                        continue
-            
-            # Category header
-            tk.Label(
-                self.emoji_frame, text=category, bg=theme.bg_primary,
-                fg=theme.text_secondary, font=FONTS.small(bold=True),
-                anchor="w"
-            ).pack(fill=tk.X, padx=10, pady=(10, 5))
-            
-            # Emoji grid
-            grid_frame = tk.Frame(self.emoji_frame, bg=theme.bg_primary)
+        """Show the emoji grid for ``filter_text``.
+
+        Every header and emoji cell is built once; filtering only re-grids
+        the matching cells and hides the rest, so typing in the search box
+        never destroys and recreates the grid.
+        """
+        if not hasattr(self, "_emoji_sections"):
+            self._emoji_sections = [
+                self._build_emoji_section(category, emojis)
+                for category, emojis in self.EMOJIS.items()
+            ]
+
+        for header, grid_frame, _cells in self._emoji_sections:
+            header.pack_forget()
+            grid_frame.pack_forget()
+        needle = filter_text.lower()
+        for category, (header, grid_frame, cells) in zip(self.EMOJIS, self._emoji_sections):
+            category_matches = not filter_text or needle in category.lower()
+            visible = []
+            for emoji, cell in cells:
+                if category_matches or filter_text in emoji:
+                    visible.append(cell)
+                else:
+                    cell.grid_forget()
+            if not visible:
+                continue
+            header.pack(fill=tk.X, padx=10, pady=(10, 5))
             grid_frame.pack(fill=tk.X, padx=10)
-            
-            for i, emoji in enumerate(emojis):
-                btn = tk.Label(
-                    grid_frame, text=emoji, bg=theme.bg_primary,
-                    font=FONTS.title(bold=False), cursor="hand2"
-                )
-                btn.grid(row=i // 10, column=i % 10, padx=2, pady=2)
-                make_keyboard_activatable(
-                    btn, lambda em=emoji: self._select(em), accessible_name=f"Select {emoji}"
-                )
-                
-                # Hover effect
-                btn.bind("<Enter>", lambda e, b=btn: b.configure(bg=theme.bg_secondary))
-                btn.bind("<Leave>", lambda e, b=btn: b.configure(bg=theme.bg_primary))
-    
+            for i, cell in enumerate(visible):
+                cell.grid(row=i // 10, column=i % 10, padx=2, pady=2)
+
+    def _build_emoji_section(self, category: str, emojis: str):
+        """Create one category header and its emoji cells, unmapped."""
+        theme = get_theme()
+        header = tk.Label(
+            self.emoji_frame, text=category, bg=theme.bg_primary,
+            fg=theme.text_secondary, font=FONTS.small(bold=True),
+            anchor="w"
+        )
+        grid_frame = tk.Frame(self.emoji_frame, bg=theme.bg_primary)
+        cells = []
+        for emoji in emojis:
+            btn = tk.Label(
+                grid_frame, text=emoji, bg=theme.bg_primary,
+                font=FONTS.title(bold=False), cursor="hand2"
+            )
+            make_keyboard_activatable(
+                btn, lambda em=emoji: self._select(em), accessible_name=f"Select {emoji}"
+            )
+
+            # Hover effect
+            btn.bind("<Enter>", lambda e, b=btn: b.configure(bg=theme.bg_secondary))
+            btn.bind("<Leave>", lambda e, b=btn: b.configure(bg=theme.bg_primary))
+            cells.append((emoji, btn))
+        return header, grid_frame, cells
+
     def _filter_emojis(self, *args):
         """Filter emojis based on search"""
         search_text = self.search_var.get()
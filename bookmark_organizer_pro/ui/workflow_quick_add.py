@@ -32,6 +32,7 @@ from .quick_add import (
     pick_default_category,
     prepare_quick_add_payload,
 )
+from .tk_interactions import combobox_values
 from .widget_controls import ModernButton, ThemedWidget
 from .widget_runtime import apply_window_chrome, get_theme
 from .window_geometry import apply_screen_aware_geometry
@@ -153,7 +154,7 @@ class QuickAddDialog(tk.Toplevel, ThemedWidget):
         self.category_var = tk.StringVar(value=default_category)
         self.category_combo = ttk.Combobox(
             cat_frame, textvariable=self.category_var,
-            values=categories or [default_category], state="readonly"
+            values=combobox_values(cat_frame, categories or [default_category]), state="readonly"
         )
         self.category_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
         
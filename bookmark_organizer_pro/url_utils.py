@@ -7,8 +7,37 @@ import html as html_module
 import ipaddress
 import re
 import socket
+import threading
+import time
 import urllib.parse
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+_DNS_CACHE_TTL_SECONDS = 300.0
+_DNS_CACHE_MAX_ENTRIES = 1024
+_dns_cache: Dict[Tuple[str, Optional[int]], Tuple[float, list]] = {}
+_dns_cache_lock = threading.Lock()
+
+
+def _getaddrinfo_cached(host: str, port: Optional[int]) -> list:
+    """``socket.getaddrinfo`` behind a short in-process TTL cache.
+
+    Every protected request resolves its host while validating and again when
+    connecting, and link checks revisit the same hosts constantly, so repeats
+    are answered from memory. Resolver failures are never cached.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+    infos = socket.getaddrinfo(host, port, socket.AF_UNSPEC)
+    with _dns_cache_lock:
+        _dns_cache.pop(key, None)
+        if len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.pop(next(iter(_dns_cache)))
+        _dns_cache[key] = (now + _DNS_CACHE_TTL_SECONDS, infos)
+    return infos
 
 
 class URLUtilities:
@@ -80,7 +109,7 @@ class URLUtilities:
         try:
             ascii_host = hostname.encode("idna").decode("ascii")
             addresses: list[str] = []
-            for info in socket.getaddrinfo(ascii_host, parsed.port, socket.AF_UNSPEC):
+            for info in _getaddrinfo_cached(ascii_host, parsed.port):
                 address = str(ipaddress.ip_address(info[4][0]))
                 ip = ipaddress.ip_address(address)
                 if cls._ip_is_blocked(ip):
@@ -98,6 +127,12 @@ class URLUtilities:
         except Exception as exc:
             return [], f"URL validation failed: {exc}"
 
+    @staticmethod
+    def clear_resolution_cache() -> None:
+        """Forget cached DNS answers used by outbound URL validation."""
+        with _dns_cache_lock:
+            _dns_cache.clear()
+
     @classmethod
     def check_safe_url(cls, url: str) -> Tuple[bool, str]:
         """Validate an outbound HTTP URL and return ``(allowed, reason)``.
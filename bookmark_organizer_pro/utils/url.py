@@ -5,6 +5,7 @@ Academic-grade URL normalization inspired by:
 - BrowserBookmarkChecker's URL canonicalization pipeline
 """
 
+from functools import lru_cache
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 
@@ -57,6 +58,9 @@ def normalize_url(url: str) -> str:
     - Sort remaining query parameters
     - Remove default index files (index.html, etc.)
     - Upgrade http to https
+
+    Results are memoized per URL string, so duplicate scans and import
+    de-duplication only parse each distinct URL once.
     """
     if url is None:
         return ""
@@ -64,6 +68,11 @@ def normalize_url(url: str) -> str:
     raw = str(url).strip()
     if not raw:
         return ""
+    return _normalize_stripped_url(raw)
+
+
+@lru_cache(maxsize=16384)
+def _normalize_stripped_url(raw: str) -> str:
     try:
         parsed = urlparse(raw)
     except Exception:
@@ -107,11 +116,9 @@ def normalize_url(url: str) -> str:
     path = parsed.path or '/'
 
     # Remove default index files
-    path_lower = path.lower()
-    for idx_file in INDEX_FILES:
-        if path_lower.endswith('/' + idx_file):
-            path = path[:-(len(idx_file))]
-            break
+    head, slash, last_segment = path.rpartition('/')
+    if slash and last_segment.lower() in INDEX_FILES:
+        path = head + slash
 
     # Remove trailing slash
     path = path.rstrip('/') or ''
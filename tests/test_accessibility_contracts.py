@@ -80,6 +80,31 @@ def test_graph_tab_navigation_wraps_without_tk_window():
     assert selected[-1] == "two"
 
 
+def test_graph_canvas_pans_only_after_the_drag_threshold():
+    calls = []
+    dialog = object.__new__(GraphViewDialog)
+    dialog.canvas = SimpleNamespace(
+        scan_mark=lambda x, y: calls.append(("mark", x, y)),
+        scan_dragto=lambda x, y, gain: calls.append(("drag", x, y)),
+    )
+    dialog._node_id_from_event = lambda _event: None
+
+    dialog._on_canvas_press(SimpleNamespace(x=100, y=100))
+    dialog._on_canvas_drag(SimpleNamespace(x=102, y=103))
+    assert calls == []
+    dialog._on_canvas_drag(SimpleNamespace(x=100, y=106))
+    dialog._on_canvas_drag(SimpleNamespace(x=90, y=120))
+    assert calls == [("mark", 100, 100), ("drag", 100, 106), ("drag", 90, 120)]
+
+    selected = []
+    dialog._select_node = selected.append
+    dialog._node_id_from_event = lambda _event: "one"
+    dialog._on_canvas_press(SimpleNamespace(x=5, y=5))
+    dialog._on_canvas_drag(SimpleNamespace(x=50, y=50))
+    assert selected == ["one"]
+    assert len(calls) == 3
+
+
 def test_graph_keyboard_activation_opens_selected_bookmark():
     bookmark = object()
     opened = []
@@ -174,7 +199,6 @@ def test_pointer_and_wheel_contracts_enumerate_custom_surfaces():
         "bookmark_organizer_pro/ui/components.py",
         "bookmark_organizer_pro/ui/widget_chat_panel.py",
         "bookmark_organizer_pro/ui/widget_bookmark_editor.py",
-        "bookmark_organizer_pro/ui/management_dialogs.py",
         "bookmark_organizer_pro/ui/cleanup_review.py",
         "bookmark_organizer_pro/ui/import_center.py",
         "bookmark_organizer_pro/ui/widget_theme_dialogs.py",
@@ -186,6 +210,16 @@ def test_pointer_and_wheel_contracts_enumerate_custom_surfaces():
         assert ".bind_all(" not in source, relative
         assert ".unbind_all(" not in source, relative
 
+    # Native Treeview lists scroll through their own class bindings.
+    native_scroll_surfaces = (
+        "bookmark_organizer_pro/ui/management_dialogs.py",
+    )
+    for relative in native_scroll_surfaces:
+        source = (ROOT / relative).read_text(encoding="utf-8")
+        assert "ttk.Treeview(" in source, relative
+        assert ".bind_all(" not in source, relative
+        assert ".unbind_all(" not in source, relative
+
     chat_source = (ROOT / "bookmark_organizer_pro/ui/widget_chat_panel.py").read_text(encoding="utf-8")
     read_later_source = (ROOT / "bookmark_organizer_pro/ui/read_later_queue.py").read_text(encoding="utf-8")
     assert "Open cited bookmark" in chat_source
@@ -1,5 +1,6 @@
 """Core tests for pattern engine, URL normalization, search, and bookmark model."""
 
+import copy
 import json
 import os
 import subprocess
@@ -9,14 +10,14 @@ import threading
 import time
 import tokenize
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 # Ensure package is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from bookmark_organizer_pro.models.bookmark import Bookmark
+from bookmark_organizer_pro.models.bookmark import Bookmark, char_mask
 from bookmark_organizer_pro.models.category import Category
 from bookmark_organizer_pro.ai import AIClient, AIConfigManager
 from bookmark_organizer_pro.constants import IS_WINDOWS
@@ -81,6 +82,26 @@ class TestBookmarkModel(unittest.TestCase):
         self.assertEqual(bm.url, bm2.url)
         self.assertEqual(bm.tags, bm2.tags)
 
+    def test_domain_is_parsed_once_per_url(self):
+        bm = Bookmark(id=1, url="https://WWW.Example.com/a", title="Example")
+        self.assertEqual(bm.domain, "example.com")
+        with patch("bookmark_organizer_pro.models.bookmark.urlparse") as parse:
+            self.assertEqual(bm.domain, "example.com")
+            parse.assert_not_called()
+        bm.url = "https://docs.example.org/b"
+        self.assertEqual(bm.domain, "docs.example.org")
+        self.assertNotIn("_domain", bm.to_dict())
+
+    def test_bookmark_fields_and_memos_live_in_slots(self):
+        bm = Bookmark(id=1, url="https://example.com", title="Example", tags=["a"])
+        bm.search_blob()
+        self.assertEqual(bm.domain, "example.com")
+        self.assertEqual(vars(bm), {})
+        clone = copy.deepcopy(bm)
+        self.assertEqual((clone, clone.domain), (bm, "example.com"))
+        bm.local_archive_path = "/tmp/page.html"
+        self.assertNotIn("local_archive_path", bm.to_dict())
+
     def test_from_dict_empty_url_raises(self):
         with self.assertRaises(ValueError):
             Bookmark.from_dict({"url": "", "title": "empty"})
@@ -227,6 +248,41 @@ class TestCategoryModelAndManager(unittest.TestCase):
             manager = CategoryManager(filepath=path)
             self.assertEqual(manager.categories["A"].parent, "")
 
+    def test_category_manager_caches_tree_until_mutation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "categories.json"
+            manager = CategoryManager(filepath=path)
+            self.assertTrue(manager.add_category("Parent"))
+            first = manager.get_tree()
+            version = manager.version
+            first.clear()
+            self.assertIs(manager.get_tree()[0][0], manager.get_tree()[0][0])
+            self.assertEqual(manager.version, version)
+
+            self.assertTrue(manager.add_category("Child", parent="Parent"))
+            self.assertGreater(manager.version, version)
+            self.assertIn(("Child", 1), [(cat.name, depth) for cat, depth in manager.get_tree()])
+
+            manager.categories.pop("Child")
+            manager.save_categories()
+            self.assertNotIn("Child", [cat.name for cat, _depth in manager.get_tree()])
+
+    def test_sorted_categories_are_cached_until_the_set_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = CategoryManager(filepath=Path(tmp) / "categories.json")
+            self.assertTrue(manager.add_category("Zeta"))
+            first = manager.get_sorted_categories()
+            self.assertEqual(first[-1], "Uncategorized / Needs Review")
+            first.clear()
+            with patch("bookmark_organizer_pro.core.category_manager.sorted", create=True) as resort:
+                self.assertIn("Zeta", manager.get_sorted_categories())
+                resort.assert_not_called()
+
+            self.assertTrue(manager.add_category("Alpha"))
+            self.assertIn("Alpha", manager.get_sorted_categories())
+            self.assertTrue(manager.rename_category("Alpha", "Omega"))
+            self.assertNotIn("Alpha", manager.get_sorted_categories())
+
 
 class TestPatternEngine(unittest.TestCase):
     """Test URL/title categorization engine."""
@@ -405,6 +461,14 @@ class TestURLNormalization(unittest.TestCase):
         self.assertNotIn("utm_source", normalized)
         self.assertIn("real=1", normalized)
 
+    def test_strips_index_files_and_memoizes_per_url(self):
+        from bookmark_organizer_pro.utils import url as url_module
+
+        self.assertEqual(normalize_url("https://example.com/docs/Index.HTML"), "https://example.com/docs")
+        self.assertEqual(normalize_url("https://example.com/myindex.html"), "https://example.com/myindex.html")
+        with patch.object(url_module, "urlparse", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(normalize_url(" https://example.com/docs/Index.HTML "), "https://example.com/docs")
+
     def test_strips_www(self):
         url = "https://www.example.com/page"
         normalized = normalize_url(url)
@@ -935,6 +999,346 @@ class TestNetworkSafety(unittest.TestCase):
         self.assertFalse(ok)
         self.assertEqual(status, 0)
 
+    def test_link_checker_spreads_same_host_bookmarks_across_workers(self):
+        from bookmark_organizer_pro.link_checker import interleave_by_host
+
+        urls = [
+            "https://a.example/1", "https://a.example/2", "https://a.example/3",
+            "https://b.example/1", "https://c.example/1", "https://b.example/2",
+        ]
+        bookmarks = [Bookmark(id=i, url=url, title=url) for i, url in enumerate(urls, 1)]
+
+        ordered = [bm.url for bm in interleave_by_host(bookmarks)]
+
+        self.assertEqual(ordered, [
+            "https://a.example/1", "https://b.example/1", "https://c.example/1",
+            "https://a.example/2", "https://b.example/2", "https://a.example/3",
+        ])
+
+    def test_host_slots_cap_concurrent_requests_per_host(self):
+        from bookmark_organizer_pro.link_checker import HostSlots
+
+        slots = HostSlots(per_host=2)
+        lock = threading.Lock()
+        active = {}
+        peak = {}
+
+        def check(url):
+            host = url.split("/")[2]
+            with slots.hold(url):
+                with lock:
+                    active[host] = active.get(host, 0) + 1
+                    peak[host] = max(peak.get(host, 0), active[host])
+                time.sleep(0.05)
+                with lock:
+                    active[host] -= 1
+
+        urls = [f"https://a.example/{i}" for i in range(6)] + ["https://b.example/1"]
+        threads = [threading.Thread(target=check, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(peak, {"a.example": 2, "b.example": 1})
+
+    def test_link_checker_fetches_duplicate_urls_once(self):
+        urls = ["https://a.example/x", "https://b.example/y", "https://a.example/x"]
+        bookmarks = [Bookmark(id=i, url=url, title=url) for i, url in enumerate(urls, 1)]
+        bookmarks[2].custom_data["redirect_url"] = "https://stale.example/"
+        checked = []
+
+        def check(bookmark):
+            checked.append(bookmark.url)
+            if bookmark.url == "https://a.example/x":
+                bookmark.custom_data["redirect_url"] = "https://a.example/new"
+                bookmark.custom_data["redirect_count"] = 1
+            return True, 200
+
+        checker = LinkChecker()
+        checker._running = True
+        checker._total = len(bookmarks)
+        progress = []
+        with patch.object(checker, "_check_url", side_effect=check):
+            checker._worker(bookmarks, lambda done, total, bm: progress.append((done, total, bm.id)))
+
+        self.assertEqual(sorted(checked), ["https://a.example/x", "https://b.example/y"])
+        self.assertEqual(progress[-1][:2], (3, 3))
+        self.assertEqual(checker.progress, (3, 3))
+        self.assertTrue(all(bm.http_status == 200 and bm.last_checked for bm in bookmarks))
+        self.assertEqual(bookmarks[2].custom_data["redirect_url"], "https://a.example/new")
+        self.assertEqual(bookmarks[2].custom_data["redirect_count"], 1)
+
+    def test_link_checker_coalesces_progress_reports(self):
+        bookmarks = [Bookmark(id=i, url=f"https://h{i}.example/", title=str(i)) for i in range(1, 51)]
+        checker = LinkChecker()
+        checker._running = True
+        checker._total = len(bookmarks)
+        progress = []
+        with patch.object(checker, "_check_url", return_value=(True, 200)), \
+                patch("bookmark_organizer_pro.link_checker.time.monotonic", return_value=100.0):
+            checker._worker(bookmarks, lambda done, total, bm: progress.append((done, total)))
+
+        self.assertEqual(progress, [(1, 50), (50, 50)])
+        self.assertTrue(all(bm.is_valid for bm in bookmarks))
+        self.assertEqual(len({bm.last_checked for bm in bookmarks}), 1)
+
+    def test_link_checker_abandons_checks_past_its_time_budget(self):
+        bookmarks = [
+            Bookmark(id=1, url="https://fast.example/", title="Fast"),
+            Bookmark(id=2, url="https://slow.example/", title="Slow"),
+        ]
+        release = threading.Event()
+
+        def check(bookmark):
+            if bookmark.id == 2:
+                release.wait(timeout=5)
+            return True, 200
+
+        checker = LinkChecker(time_budget=0.2)
+        checker._running = True
+        checker._total = len(bookmarks)
+        progress = []
+        try:
+            with patch.object(checker, "_check_url", side_effect=check):
+                started = time.monotonic()
+                checker._worker(bookmarks, lambda done, total, bm: progress.append((done, total)))
+                elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 2)
+        self.assertTrue(checker.timed_out)
+        self.assertEqual(progress[-1], (1, 2))
+        self.assertEqual(bookmarks[0].http_status, 200)
+        self.assertFalse(bookmarks[1].last_checked)
+        self.assertFalse(checker.is_running)
+
+    def test_link_checker_opens_its_pool_and_client_on_demand(self):
+        checker = LinkChecker()
+        self.assertIsNone(checker._pool)
+        self.assertIsNone(checker._http)
+
+        client = checker._client
+        with patch.object(client, "close") as close:
+            checker.stop()
+        close.assert_called_once_with()
+        with self.assertRaises(RuntimeError):
+            checker._client
+        checker._reopen()
+        self.assertIsNot(checker._client, client)
+
+        pool = checker._executor
+        checker.close()
+        self.assertTrue(pool._shutdown)
+        self.assertIsNone(checker._pool)
+        self.assertIsNone(checker._http)
+
+    def test_closing_the_checker_mid_check_opens_no_new_client(self):
+        from bookmark_organizer_pro.services import egress
+
+        bookmark = Bookmark(id=1, url="https://slow.example/", title="Slow")
+        first_hop = threading.Event()
+        release = threading.Event()
+        moved = Mock(status_code=301, headers={"Location": "https://new.example/"})
+        probed = []
+
+        def probe(client, url, **_kwargs):
+            probed.append(url)
+            first_hop.set()
+            release.wait(timeout=5)
+            return moved
+
+        checker = LinkChecker()
+        result = []
+        with patch("bookmark_organizer_pro.link_checker.probe_url", side_effect=probe), \
+                patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=True), \
+                patch.object(checker, "_rate_limit"), \
+                patch.object(egress, "BoundedEgressClient", wraps=egress.BoundedEgressClient) as opened:
+            worker = threading.Thread(target=lambda: result.append(checker.check_url(bookmark)))
+            worker.start()
+            self.assertTrue(first_hop.wait(timeout=5))
+            checker.close()
+            release.set()
+            worker.join(timeout=5)
+
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(probed, ["https://slow.example/"])
+        self.assertEqual(result, [(False, 0)])
+        self.assertIsNone(checker._http)
+
+    def test_link_checker_abandoned_checks_leave_redirects_unwritten(self):
+        bookmark = Bookmark(id=1, url="https://slow.example/", title="Slow")
+        release = threading.Event()
+        moved = Mock(status_code=301, headers={"Location": "https://new.example/"})
+        landed = Mock(status_code=200, headers={})
+
+        def probe(_client, url, **_kwargs):
+            if url == bookmark.url:
+                release.wait(timeout=5)
+                return moved
+            return landed
+
+        checker = LinkChecker(time_budget=0.1)
+        checker._running = True
+        checker._total = 1
+        with patch("bookmark_organizer_pro.link_checker.probe_url", side_effect=probe), \
+                patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=True), \
+                patch.object(checker, "_rate_limit"):
+            checker._worker([bookmark], None)
+            self.assertTrue(checker.timed_out)
+            release.set()
+            checker._pool.shutdown(wait=True)
+
+        self.assertNotIn("redirect_url", bookmark.custom_data)
+        self.assertFalse(bookmark.last_checked)
+
+    def test_link_checker_reuses_its_worker_threads_across_runs(self):
+        threads = set()
+
+        def check(_bookmark):
+            threads.add(threading.current_thread().name)
+            return True, 200
+
+        checker = LinkChecker(max_workers=2)
+        pool = checker._executor
+        with patch.object(checker, "_check_url", side_effect=check):
+            for run in range(3):
+                bookmarks = [Bookmark(id=i, url=f"https://h{run}-{i}.example/", title=str(i)) for i in range(4)]
+                checker._running = True
+                checker._total = len(bookmarks)
+                checker._worker(bookmarks, None)
+                self.assertTrue(all(bm.is_valid for bm in bookmarks))
+
+        self.assertIs(checker._executor, pool)
+        self.assertLessEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("linkcheck") for name in threads))
+        checker.close()
+        with self.assertRaises(RuntimeError):
+            pool.submit(check, None)
+
+    def test_link_checker_skips_urls_with_fresh_results(self):
+        now = datetime.now()
+        fresh_ok = Bookmark(id=1, url="https://ok.example/", title="OK")
+        fresh_ok.last_checked = (now - timedelta(hours=3)).isoformat()
+        fresh_ok.http_status = 200
+        stale_error = Bookmark(id=2, url="https://flaky.example/", title="Flaky")
+        stale_error.last_checked = (now - timedelta(hours=3)).isoformat()
+        stale_error.http_status, stale_error.is_valid = 503, False
+        never = Bookmark(id=3, url="https://new.example/", title="New")
+        bookmarks = [fresh_ok, stale_error, never]
+        checked = []
+
+        def check(bookmark):
+            checked.append(bookmark.id)
+            return True, 200
+
+        self.assertFalse(LinkChecker().reuse_recent)
+        checker = LinkChecker(reuse_recent=True)
+        checker._running = True
+        checker._total = len(bookmarks)
+        with patch.object(checker, "_check_url", side_effect=check):
+            checker._worker(bookmarks, None)
+
+        self.assertEqual(sorted(checked), [2, 3])
+        self.assertEqual(checker.progress, (3, 3))
+        self.assertEqual(fresh_ok.last_checked, (now - timedelta(hours=3)).isoformat())
+
+        checker.reuse_recent = False
+        checker._running = True
+        checked.clear()
+        with patch.object(checker, "_check_url", side_effect=check):
+            checker._worker(bookmarks, None)
+        self.assertEqual(sorted(checked), [1, 2, 3])
+
+    def test_link_checker_reserves_per_host_slots_without_holding_a_lock(self):
+        checker = LinkChecker()
+        sleeps = []
+        with patch("bookmark_organizer_pro.link_checker.time.monotonic", return_value=100.0), \
+                patch("bookmark_organizer_pro.link_checker.time.sleep", side_effect=sleeps.append):
+            for url in ("https://a.example/1", "https://a.example/2", "https://b.example/1", "https://a.example/3"):
+                checker._rate_limit(url)
+
+        self.assertEqual(sleeps, [1.0, 2.0])
+        self.assertEqual(checker._domain_last_request, {"a.example": 102.0, "b.example": 100.0})
+
+    def test_link_checker_retries_refused_head_with_a_one_byte_get(self):
+        class Response:
+            def __init__(self, status):
+                self.status_code = status
+                self.headers = {}
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        checker = LinkChecker()
+        bm = Bookmark(id=1, url="https://cdn.example/page", title="CDN")
+        refused, ranged = Response(405), Response(206)
+        with patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=True), \
+                patch.object(checker, "_rate_limit"), \
+                patch.object(checker._client, "head", return_value=refused), \
+                patch.object(checker._client, "get", return_value=ranged) as get:
+            self.assertEqual(checker._check_url(bm), (True, 206))
+
+        self.assertEqual(get.call_args.kwargs["headers"], {"Range": "bytes=0-0"})
+        self.assertTrue(get.call_args.kwargs["stream"])
+        self.assertTrue(refused.closed and ranged.closed)
+
+    def test_link_checker_fails_fast_on_hosts_that_keep_not_answering(self):
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+
+        checker = LinkChecker()
+        bookmarks = [
+            Bookmark(id=i, url=f"https://down.example/{i}", title=str(i)) for i in range(5)
+        ]
+        with patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=True), \
+                patch.object(checker, "_rate_limit"), \
+                patch.object(checker._client, "head", side_effect=RequestsConnectionError()) as head:
+            results = [checker._check_url(bm) for bm in bookmarks]
+
+        self.assertEqual(results, [(False, 0)] * 5)
+        self.assertEqual(head.call_count, 3)
+        checker.reset_host_state()
+        self.assertFalse(checker._is_dead_host("https://down.example/next"))
+
+    def test_link_checker_only_counts_transport_failures_against_a_host(self):
+        checker = LinkChecker()
+        bookmarks = [
+            Bookmark(id=i, url=f"https://slowapp.example/{i}", title=str(i)) for i in range(4)
+        ]
+        answered = Mock(status_code=408, headers={})
+        with patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=True), \
+                patch.object(checker, "_rate_limit"), \
+                patch.object(checker._client, "head", return_value=answered) as head:
+            results = [checker._check_url(bm) for bm in bookmarks]
+
+        self.assertEqual(results, [(False, 408)] * 4)
+        self.assertEqual(head.call_count, 4)
+        self.assertFalse(checker._is_dead_host("https://slowapp.example/next"))
+
+        with patch("bookmark_organizer_pro.link_checker.URLUtilities._is_safe_url", return_value=False):
+            for bm in bookmarks:
+                self.assertEqual(checker._check_url(bm), (False, 0))
+        self.assertFalse(checker._is_dead_host("https://slowapp.example/next"))
+
+    def test_url_validation_reuses_fresh_dns_answers(self):
+        from bookmark_organizer_pro import url_utils
+
+        answer = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        clock = [1000.0]
+        URLUtilities.clear_resolution_cache()
+        self.addCleanup(URLUtilities.clear_resolution_cache)
+        with patch.object(url_utils.socket, "getaddrinfo", return_value=answer) as lookup, \
+                patch.object(url_utils.time, "monotonic", side_effect=lambda: clock[0]):
+            self.assertTrue(URLUtilities._is_safe_url("https://cached.example/a"))
+            self.assertTrue(URLUtilities._is_safe_url("https://cached.example/b"))
+            self.assertEqual(lookup.call_count, 1)
+
+            clock[0] += url_utils._DNS_CACHE_TTL_SECONDS + 1
+            self.assertTrue(URLUtilities._is_safe_url("https://cached.example/c"))
+            self.assertEqual(lookup.call_count, 2)
+
     def test_non_global_ip_urls_are_not_safe_fetch_targets(self):
         self.assertFalse(URLUtilities._is_safe_url("http://169.254.169.254/latest"))
         self.assertFalse(URLUtilities._is_safe_url("http://224.0.0.1/"))
@@ -1075,6 +1479,18 @@ class TestSearchQuery(unittest.TestCase):
         q = SearchQuery("python tutorial")
         self.assertEqual(q.text_terms, ["python", "tutorial"])
 
+    def test_term_search_reuses_the_bookmark_search_blob(self):
+        bm = Bookmark(id=1, url="https://docs.example", title="Python Guide", tags=["Lang"])
+        text, mask = bm.search_blob()
+        self.assertEqual(text, SearchQuery._searchable_text(bm).lower())
+        self.assertIs(bm.search_blob()[0], text)
+        self.assertEqual(mask & char_mask("guide"), char_mask("guide"))
+
+        self.assertTrue(SearchQuery("guide lang").matches(bm))
+        self.assertFalse(SearchQuery("zebra").matches(bm))
+        bm.tags.append("Zebra")
+        self.assertTrue(SearchQuery("zebra").matches(bm))
+
     def test_domain_filter(self):
         q = SearchQuery("domain:github.com")
         self.assertEqual(q.domain_filters, ["github.com"])
@@ -1121,6 +1537,21 @@ class TestSearchQuery(unittest.TestCase):
         self.assertTrue(SearchQuery("tag:research").matches(bm))
         self.assertTrue(SearchQuery("has:tags").matches(bm))
 
+    def test_clause_predicates_are_compiled_once_per_query(self):
+        busy = Bookmark(
+            id=1, url="https://docs.github.com/a", title="Python guide", visit_count=9
+        )
+        quiet = Bookmark(id=2, url="https://example.com", title="Python notes")
+        q = SearchQuery("python domain:github.com visits:>=9 -is:pinned OR notes")
+
+        self.assertTrue(q.matches(busy))
+        predicates = q._predicates
+        self.assertTrue(q.matches(quiet))
+        self.assertIs(q._predicates, predicates)
+        self.assertEqual([len(group) for group in predicates], [4, 1])
+        busy.visit_count = 8
+        self.assertFalse(q.matches(busy))
+
     def test_timezone_date_filter_is_applied(self):
         bm = Bookmark(
             id=1,
@@ -1581,6 +2012,213 @@ class TestMainAppManagers(unittest.TestCase):
             self.assertIn(7, manager.bookmarks)
             self.assertNotEqual(second.id, 7)
 
+    def test_search_as_you_type_scans_only_previous_matches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            for index, title in enumerate(("Python docs", "Pylons guide", "Rust book")):
+                manager.add_bookmark(
+                    Bookmark(id=index + 1, url=f"https://site{index}.example", title=title),
+                    save=False,
+                )
+
+            self.assertEqual([bm.id for bm in manager.search_bookmarks("py")], [1, 2])
+            with patch.object(manager, "_corpus_candidates", wraps=manager._corpus_candidates) as scan:
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("pyt")], [1])
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("pyt docs")], [1])
+                scan.assert_not_called()
+
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("rust")], [3])
+                self.assertEqual(scan.call_count, 1)
+                manager.add_bookmark(
+                    Bookmark(id=9, url="https://rustacean.example", title="Rustacean"),
+                    save=False,
+                )
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("rusta")], [9])
+                self.assertEqual(scan.call_count, 2)
+
+    def test_full_library_search_prefilters_on_the_joined_corpus(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            for index, title in enumerate(("Python docs", "Rust book", "Python tips", "Zig")):
+                manager.add_bookmark(
+                    Bookmark(id=index + 1, url=f"https://site{index}.example", title=title),
+                    save=False,
+                )
+
+            self.assertEqual([bm.id for bm in manager._corpus_candidates("python")], [1, 3])
+            self.assertEqual([bm.id for bm in manager._corpus_candidates("zig")], [4])
+            self.assertEqual(manager._corpus_candidates("haskell"), [])
+            self.assertEqual({bm.id for bm in manager.search_bookmarks("tips python")}, {3})
+            self.assertEqual({bm.id for bm in manager.search_bookmarks("site1")}, {2})
+
+    def test_delete_bookmarks_removes_many_with_one_save(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            for bm_id in (1, 2, 3, 4):
+                manager.add_bookmark(Bookmark(id=bm_id, url=f"https://{bm_id}.example", title=str(bm_id)))
+
+            with patch.object(manager.storage, "save", wraps=manager.storage.save) as save:
+                self.assertEqual(manager.delete_bookmarks([2, "3", 3, 99, None]), 2)
+                self.assertEqual(save.call_count, 1)
+                self.assertEqual(manager.delete_bookmarks([99]), 0)
+                self.assertEqual(save.call_count, 1)
+
+            self.assertEqual(sorted(manager.bookmarks), [1, 4])
+
+    def test_record_visit_can_defer_the_library_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One"))
+            stored = manager.get_bookmark(1)
+
+            with patch.object(manager.storage, "save", wraps=manager.storage.save) as save:
+                self.assertIs(manager.record_visit(1, save=False), stored)
+                self.assertIs(manager.record_visit("1", save=False), stored)
+                save.assert_not_called()
+                self.assertIsNone(manager.record_visit(99, save=False))
+                manager.save_bookmarks()
+                self.assertEqual(save.call_count, 1)
+
+            self.assertEqual(stored.visit_count, 2)
+            self.assertTrue(stored.last_visited)
+
+    def test_deferred_visits_survive_an_external_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One"))
+            manager.add_bookmark(Bookmark(id=2, url="https://two.example", title="Two"))
+            manager.record_visit(1, save=False)
+
+            other = self._make_manager(tmp)
+            other.update_bookmark(2, title="Renamed elsewhere")
+            manager.reload()
+            self.assertEqual(manager.get_bookmark(1).visit_count, 1)
+
+            manager.record_visit(1, save=False)
+            other.update_bookmark(2, notes="Second external write")
+            self.assertTrue(manager.save_pending_visits())
+            self.assertFalse(manager.save_pending_visits())
+
+            reloaded = self._make_manager(tmp)
+            self.assertEqual(reloaded.get_bookmark(1).visit_count, 2)
+            self.assertEqual(reloaded.get_bookmark(2).title, "Renamed elsewhere")
+            self.assertEqual(reloaded.get_bookmark(2).notes, "Second external write")
+
+    def test_repeated_searches_reuse_results_until_the_library_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="Python docs"))
+            manager.add_bookmark(Bookmark(id=2, url="https://two.example", title="Rust book"))
+
+            self.assertEqual([bm.id for bm in manager.search_bookmarks("python")], [1])
+            manager.search_bookmarks("rust")
+            with patch.object(manager.search_engine, "search", wraps=manager.search_engine.search) as run:
+                results = manager.search_bookmarks("python")
+                self.assertEqual([bm.id for bm in results], [1])
+                results.clear()
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("python")], [1])
+                run.assert_not_called()
+
+                manager.update_bookmark(2, title="Python for Rustaceans")
+                self.assertEqual({bm.id for bm in manager.search_bookmarks("python")}, {1, 2})
+                self.assertEqual(run.call_count, 1)
+
+    def test_search_result_cache_evicts_the_least_recent_query(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One"))
+            manager.SEARCH_RESULT_CACHE_SIZE = 2
+            for query in ("one", "two", "one", "three"):
+                manager.search_bookmarks(query)
+
+            cached = manager._cached_view("search_results", dict)
+            self.assertEqual([key[:2] for key in cached], [("one", None), ("three", None)])
+
+    def test_time_relative_searches_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One"))
+
+            with patch.object(manager.search_engine, "search", wraps=manager.search_engine.search) as run:
+                for _ in range(2):
+                    self.assertEqual([bm.id for bm in manager.search_bookmarks("is:recent")], [1])
+                    manager.search_bookmarks("one is:stale")
+                self.assertEqual(run.call_count, 4)
+            self.assertEqual(len(manager._cached_view("search_results", dict)), 0)
+
+    def test_category_counts_are_cached_until_the_library_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One", category="Dev"))
+            manager.add_bookmark(Bookmark(id=2, url="https://two.example", title="Two", category="Dev"))
+
+            self.assertEqual(manager.get_category_counts()["Dev"], 2)
+            with patch("bookmark_organizer_pro.managers.bookmarks.Counter") as tally:
+                self.assertEqual(manager.get_category_counts()["Dev"], 2)
+                tally.assert_not_called()
+
+            manager.update_bookmark(2, category="News")
+            counts = manager.get_category_counts()
+            self.assertEqual((counts["Dev"], counts["News"]), (1, 1))
+            manager.delete_bookmark(1)
+            self.assertNotIn("Dev", manager.get_category_counts())
+
+    def test_sorted_bookmarks_are_cached_in_library_list_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://b.example", title="beta", category="Dev"))
+            manager.add_bookmark(Bookmark(id=2, url="https://a.example", title="Alpha", category="Dev"))
+            manager.add_bookmark(Bookmark(id=3, url="https://z.example", title="Zed", is_pinned=True))
+
+            self.assertEqual([bm.id for bm in manager.get_sorted_bookmarks()], [3, 2, 1])
+            self.assertEqual([bm.id for bm in manager.get_sorted_bookmarks("Dev")], [2, 1])
+            with patch("bookmark_organizer_pro.managers.bookmarks.sorted", create=True) as resort:
+                manager.get_sorted_bookmarks()
+                resort.assert_not_called()
+
+            manager.update_bookmark(1, title="Aardvark")
+            self.assertEqual([bm.id for bm in manager.get_sorted_bookmarks("Dev")], [1, 2])
+
+    def test_flag_filters_share_cached_library_columns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One", is_pinned=True))
+            manager.add_bookmark(Bookmark(id=2, url="https://two.example", title="Two", is_valid=False))
+            old = Bookmark(id=3, url="https://old.example", title="Old", created_at="2001-01-01T00:00:00Z")
+            manager.add_bookmark(old)
+
+            self.assertEqual([bm.id for bm in manager.get_pinned_bookmarks()], [1])
+            with patch("bookmark_organizer_pro.managers.bookmarks._created_datetime") as parse:
+                self.assertEqual([bm.id for bm in manager.find_broken_links()], [2])
+                self.assertEqual({bm.id for bm in manager.get_recent_bookmarks()}, {1, 2})
+                parse.assert_not_called()
+
+            manager.update_bookmark(2, is_pinned=True, category="Dev")
+            manager.update_bookmark(1, title="Zebra")
+            self.assertEqual([bm.id for bm in manager.get_pinned_bookmarks()], [2, 1])
+            self.assertEqual([bm.id for bm in manager.get_pinned_bookmarks("Dev")], [2])
+            self.assertEqual([bm.id for bm in manager.find_broken_links("Dev")], [2])
+            self.assertEqual([bm.id for bm in manager.get_recent_bookmarks(category="Dev")], [2])
+
+    def test_link_check_results_reach_cached_filters_before_save(self):
+        from bookmark_organizer_pro.app_mixins.tools import ToolsActionsMixin
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            manager.add_bookmark(Bookmark(id=1, url="https://one.example", title="One"))
+            manager.add_bookmark(Bookmark(id=2, url="https://two.example", title="Two"))
+            self.assertEqual(manager.find_broken_links(), [])
+            self.assertEqual(manager.search_bookmarks("is:broken"), [])
+
+            tools = ToolsActionsMixin.__new__(ToolsActionsMixin)
+            tools.bookmark_manager = manager
+            with patch.object(manager, "save_bookmarks") as save:
+                self.assertEqual(tools._apply_link_check_rows([(2, 404, False), (9, 200, True)]), (1, 1))
+                self.assertEqual([bm.id for bm in manager.find_broken_links()], [2])
+                self.assertEqual([bm.id for bm in manager.search_bookmarks("is:broken")], [2])
+                save.assert_not_called()
+            self.assertEqual(manager.get_bookmark(2).http_status, 404)
+
     def test_statistics_use_one_consistent_bookmark_snapshot(self):
         with tempfile.TemporaryDirectory() as tmp:
             manager = self._make_manager(tmp)
@@ -1622,6 +2260,53 @@ class TestMainAppManagers(unittest.TestCase):
             self.assertEqual(stats["with_notes"], 1)
             self.assertEqual(stats["with_tags"], 2)
 
+    def test_statistics_age_buckets_and_staleness_match_bookmark_properties(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            now = datetime.now()
+            cases = [
+                (3, None),
+                (20, (now - timedelta(days=5)).isoformat()),
+                (60, (now - timedelta(days=120)).isoformat()),
+                (60, "not-a-date"),
+                (400, None),
+                (None, None),
+            ]
+            for index, (age, last_visited) in enumerate(cases, 1):
+                bookmark = Bookmark(id=index, url=f"https://site{index}.example", title=str(index))
+                bookmark.created_at = (
+                    (now - timedelta(days=age)).isoformat() if age is not None else "garbage"
+                )
+                bookmark.last_visited = last_visited
+                manager.add_bookmark(bookmark, save=False)
+
+            stats = manager.get_statistics()
+            bookmarks = manager.get_all_bookmarks()
+
+            self.assertEqual(
+                stats["age_distribution"],
+                {"<7 days": 2, "7-30 days": 1, "1-6 months": 2, ">6 months": 1},
+            )
+            self.assertEqual(stats["stale"], sum(bm.age_days > 90 or bm.is_stale for bm in bookmarks))
+            self.assertEqual(stats["stale"], 3)
+
+    def test_domain_stats_rank_by_count_and_keep_insertion_order_for_ties(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = self._make_manager(tmp)
+            urls = [
+                "https://beta.example/a",
+                "https://alpha.example/a",
+                "https://gamma.example/a",
+                "https://gamma.example/b",
+            ]
+            for index, url in enumerate(urls, 1):
+                manager.add_bookmark(Bookmark(id=index, url=url, title=url), save=False)
+
+            self.assertEqual(
+                manager.get_domain_stats(),
+                [("gamma.example", 2), ("beta.example", 1), ("alpha.example", 1)],
+            )
+
     def test_import_json_uses_canonical_duplicate_detection_without_id_overwrite(self):
         with tempfile.TemporaryDirectory() as tmp:
             manager = self._make_manager(tmp)
@@ -3082,6 +3767,23 @@ class TestUIFoundation(unittest.TestCase):
         self.assertEqual(pulse.action_key, "import")
 
 
+    def test_dashboard_health_score_is_shared_between_refresh_surfaces(self):
+        from bookmark_organizer_pro.app_mixins.dashboard import (
+            DashboardActionsMixin,
+            _health_score,
+        )
+
+        stats = {
+            "total_bookmarks": 10, "broken": 1, "uncategorized": 2,
+            "duplicate_bookmarks": 1, "with_tags": 5, "with_notes": 2,
+        }
+        _health_score.cache_clear()
+        mixin = DashboardActionsMixin()
+        self.assertEqual(mixin._calculate_health_score(stats), 52)
+        self.assertEqual(mixin._calculate_health_score(dict(stats)), 52)
+        self.assertEqual(_health_score.cache_info().hits, 1)
+        self.assertEqual(mixin._calculate_health_score({"total_bookmarks": 0}), 0)
+
 class TestUITheme(unittest.TestCase):
     """Test toolkit-independent theme models and persistence."""
 
@@ -3656,6 +4358,41 @@ class TestNavigationHelpers(unittest.TestCase):
         self.assertEqual(delivered, ["worker"])
         self.assertTrue(root.cancelled)
 
+    def test_dispatcher_coalesces_latest_events_per_key(self):
+        class FakeRoot:
+            def __init__(self):
+                self.callbacks = {}
+                self._next_id = 0
+
+            def after(self, _delay, callback):
+                self._next_id += 1
+                after_id = f"after-{self._next_id}"
+                self.callbacks[after_id] = callback
+                return after_id
+
+            def after_cancel(self, after_id):
+                self.callbacks.pop(after_id, None)
+
+            def run_next(self):
+                after_id = next(iter(self.callbacks))
+                self.callbacks.pop(after_id)()
+
+        root = FakeRoot()
+        dispatcher = TkEventDispatcher(root, poll_interval_ms=1)
+        delivered = []
+
+        for done in range(1, 101):
+            dispatcher.post_latest("progress", delivered.append, ("progress", done))
+        dispatcher.post_latest("other", delivered.append, ("other", 1))
+        dispatcher.post(delivered.append, "done")
+        root.run_next()
+
+        self.assertEqual(delivered, [("progress", 100), ("other", 1), "done"])
+        dispatcher.post_latest("progress", delivered.append, ("progress", 101))
+        dispatcher.shutdown()
+        self.assertFalse(dispatcher.post_latest("progress", delivered.append, ("progress", 102)))
+        self.assertEqual(len(delivered), 3)
+
     def test_task_runner_drops_running_worker_completion_after_shutdown(self):
         class FakeRoot:
             def __init__(self):
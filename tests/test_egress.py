@@ -139,5 +139,38 @@ class TestBoundedEgress(unittest.TestCase):
         self.assertEqual(session.calls, [])
 
 
+    def test_pool_sizes_are_configurable_and_close_releases_the_session(self):
+        class Session(_Session):
+            def __init__(self):
+                super().__init__([])
+                self.adapters = {}
+                self.closed = False
+
+            def mount(self, prefix, adapter):
+                self.adapters[prefix] = adapter
+
+            def close(self):
+                self.closed = True
+
+        session = Session()
+        client = BoundedEgressClient(session=session, pool_connections=64, pool_maxsize=32)
+
+        adapter = session.adapters["https://"]
+        self.assertIs(session.adapters["http://"], adapter)
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize), (64, 32))
+        client.close()
+        self.assertTrue(session.closed)
+
+    def test_link_checker_keeps_its_own_keep_alive_client(self):
+        from bookmark_organizer_pro.link_checker import _USER_AGENT, LinkChecker
+        from bookmark_organizer_pro.services.egress import public_egress
+
+        checker = LinkChecker(max_workers=32)
+        adapter = checker._client.session.get_adapter("https://example.com")
+
+        self.assertIsNot(checker._client, public_egress)
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize), (64, 32))
+        self.assertEqual(checker._client.session.headers["User-Agent"], _USER_AGENT)
+
 if __name__ == "__main__":
     unittest.main()
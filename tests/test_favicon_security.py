@@ -149,6 +149,31 @@ class TestFaviconSecurity(unittest.TestCase):
             "https://www.google.com/s2/favicons?domain=saved-domain.example&sz=32",
         )
 
+    def test_prefetch_submits_each_uncached_domain_once(self):
+        manager = self.manager
+        manager._cache["cached.example"] = "/tmp/cached.png"
+        manager._failed_domains.add("failed.example")
+        manager._pending.add("pending.example")
+        pending = MagicMock()
+        with patch.object(manager._executor, "submit", return_value=pending) as submit:
+            started = manager.prefetch([
+                ("new.example", 1),
+                ("NEW.example", 2),
+                ("cached.example", 3),
+                ("failed.example", 4),
+                ("pending.example", 5),
+                ("", 6),
+                ("other.example", 7),
+            ])
+
+        self.assertEqual(started, 2)
+        self.assertEqual(
+            [(call.args[1], call.args[2]) for call in submit.call_args_list],
+            [("new.example", 1), ("other.example", 7)],
+        )
+        self.assertEqual(manager._pending, {"pending.example", "new.example", "other.example"})
+        self.assertEqual(manager.progress[1], 2)
+
     def test_disabling_policy_cancels_queued_work(self):
         manager = HighSpeedFaviconManager(max_workers=1, enabled=True)
         self.addCleanup(manager.shutdown)
@@ -5,10 +5,16 @@ from __future__ import annotations
 import unittest
 from unittest.mock import patch
 
+from bookmark_organizer_pro.app_mixins import bookmark_crud
 from bookmark_organizer_pro.app_mixins.tools import ToolsActionsMixin
 from bookmark_organizer_pro.models.bookmark import Bookmark
 from bookmark_organizer_pro.models.category import Category
-from bookmark_organizer_pro.ui.cleanup_review import CleanupApplyResult, CleanupReviewDialog
+from bookmark_organizer_pro.ui import cleanup_review
+from bookmark_organizer_pro.ui.cleanup_review import (
+    CleanupApplyResult,
+    CleanupReviewDialog,
+    CleanupReviewGroup,
+)
 from bookmark_organizer_pro.ui.management_dialogs import CategoryManagementDialog
 
 
@@ -49,10 +55,14 @@ class FakeBookmarkManager:
     def find_duplicates(self):
         return self.duplicates
 
-    def delete_bookmark(self, bookmark_id):
+    def delete_bookmarks(self, bookmark_ids):
+        doomed = set(bookmark_ids)
         before = len(self.bookmarks)
-        self.bookmarks = [bm for bm in self.bookmarks if bm.id != bookmark_id]
-        return len(self.bookmarks) != before
+        self.bookmarks = [bm for bm in self.bookmarks if bm.id not in doomed]
+        removed = before - len(self.bookmarks)
+        if removed:
+            self.save_count += 1
+        return removed
 
 
 class FakeCategoryManager:
@@ -238,6 +248,47 @@ class TestMaintenanceFlows(unittest.TestCase):
         self.assertEqual("disabled", dialog.apply_button.value)
         self.assertIn("Reopen this workflow", dialog._status_var.value)
 
+    def test_cleanup_group_card_lists_items_in_one_label(self):
+        created = []
+
+        class Widget:
+            def __init__(self, *_args, **kwargs):
+                self.options = kwargs
+                created.append(self)
+
+            def pack(self, **_kwargs):
+                pass
+
+        class Theme:
+            def __getattr__(self, _name):
+                return "#000000"
+
+        fake_tk = type("FakeTk", (), {
+            "BooleanVar": lambda value=True: value,
+            "Frame": Widget,
+            "Checkbutton": Widget,
+            "Label": Widget,
+            "X": "x",
+            "LEFT": "left",
+        })
+        dialog = CleanupReviewDialog.__new__(CleanupReviewDialog)
+        dialog._theme = Theme()
+        dialog._vars = {}
+        dialog._selection_changed = lambda: None
+        group = CleanupReviewGroup(
+            key="url:1", title="example.com", subtitle="Two duplicates.",
+            items=tuple(f"Remove #{index}" for index in range(200)),
+            action_label="Remove 200 duplicate(s)",
+        )
+
+        with patch.object(cleanup_review, "tk", fake_tk):
+            dialog._add_group(object(), group)
+
+        self.assertEqual(4, len(created))
+        lines = created[-1].options["text"].splitlines()
+        self.assertEqual(200, len(lines))
+        self.assertEqual("- Remove #0", lines[0])
+
     def test_clear_all_tags_aborts_when_safepoint_is_unavailable(self):
         app = MaintenanceHarness([
             bookmark(1, "https://example.com", tags=["python"], ai_tags=["docs"]),
@@ -351,6 +402,109 @@ class TestMaintenanceFlows(unittest.TestCase):
         self.assertEqual(["Dev", "Dev"], [bm.category for bm in manager.bookmarks])
         self.assertIn("Restored", statuses[-1])
 
+    def test_category_manager_lists_categories_as_tree_rows(self):
+        class Tree:
+            def __init__(self):
+                self.rows = {}
+                self.selected = ()
+
+            def get_children(self):
+                return tuple(self.rows)
+
+            def delete(self, *items):
+                for item in items:
+                    self.rows.pop(item)
+
+            def insert(self, _parent, _index, iid, values):
+                self.rows[iid] = values
+
+            def selection_set(self, item):
+                self.selected = (item,)
+
+            def selection(self):
+                return self.selected
+
+            def focus(self, _item):
+                pass
+
+        class Packable:
+            def pack(self, **_kwargs):
+                pass
+
+            def pack_forget(self):
+                pass
+
+        child = bookmark(3, "https://docs.example", category="Python")
+        child.parent_category = "Dev"
+        manager = FakeBookmarkManager([
+            bookmark(1, "https://example.com", category="Dev"),
+            bookmark(2, "https://other.example", category="Uncategorized / Needs Review"),
+            child,
+        ])
+        manager.get_bookmarks_by_category = None
+        categories = FakeCategoryManager()
+        categories.get_sorted_categories = lambda: list(categories.categories)
+        dialog = CategoryManagementDialog.__new__(CategoryManagementDialog)
+        dialog.bookmark_manager = manager
+        dialog.category_manager = categories
+        dialog.cat_tree = Tree()
+        dialog.cat_tree.rows["stale"] = ()
+        dialog.cat_empty_label = dialog._cat_tree_frame = dialog._cat_row_actions = Packable()
+        renamed = []
+        dialog._edit_category = renamed.append
+
+        dialog._populate_categories()
+        dialog._edit_selected_category()
+
+        self.assertEqual(
+            {
+                "Dev": ("D Dev", "2 bookmarks"),
+                "Uncategorized / Needs Review": ("? Uncategorized / Needs Review", "1 bookmark"),
+            },
+            dialog.cat_tree.rows,
+        )
+        self.assertEqual(["Dev"], renamed)
+
+    def test_editing_the_same_bookmark_again_raises_the_open_editor(self):
+        opened = []
+
+        class Editor:
+            def __init__(self, _root, bookmark, **_kwargs):
+                self.bookmark = bookmark
+                self.alive = True
+                self.raised = 0
+                opened.append(self)
+
+            def winfo_exists(self):
+                return self.alive
+
+            def lift(self):
+                self.raised += 1
+
+            def focus_set(self):
+                pass
+
+        first, second = bookmark(1, "https://a.example"), bookmark(2, "https://b.example")
+        app = bookmark_crud.BookmarkCrudMixin()
+        app.root = object()
+        app.bookmark_manager = FakeBookmarkManager([first, second])
+        app.category_manager = type("Categories", (), {"get_sorted_categories": lambda _self: []})()
+        app.tag_manager = type("Tags", (), {"get_all_tags": lambda _self: []})()
+        app.selected_bookmarks = [1]
+
+        with patch.object(bookmark_crud, "BookmarkEditorDialog", Editor):
+            app._edit_selected()
+            app._edit_selected()
+            self.assertEqual(1, len(opened))
+            self.assertEqual(1, opened[0].raised)
+
+            opened[0].alive = False
+            app._edit_selected()
+            app.selected_bookmarks = [2]
+            app._edit_selected()
+
+        self.assertEqual([first, first, second], [editor.bookmark for editor in opened])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1609,6 +1609,8 @@ class TestReadLaterQueue(_IsolatedTestBase):
         self.assertEqual([row.bookmark_id for row in rows], [2, 1])
         self.assertEqual([row.position for row in rows], [1, 2])
         self.assertEqual(rows[0].title, "Second")
+        self.assertEqual(rows[0].label, "01. Second  [r2.com]")
+        self.assertEqual(rows[1].label, "02. First  [r1.com]")
 
 
 # ── 9. HybridSearch (keyword-only fallback) ─────────────────────────
@@ -1690,6 +1692,32 @@ class TestDeadLinkScanner(_IsolatedTestBase):
         self.assertEqual(len(scanner2._results), 0)
 
 
+    def test_scan_checks_each_distinct_url_once(self):
+        from bookmark_organizer_pro.services.dead_link_scanner import DeadLinkScanner
+
+        bookmarks = [
+            _make_bookmark(id=1, url="https://gone.example/a", title="One"),
+            _make_bookmark(id=2, url="https://gone.example/a", title="Copy"),
+            _make_bookmark(id=3, url="https://ok.example/", title="Fine"),
+        ]
+        scanner = DeadLinkScanner(
+            get_bookmarks=lambda: bookmarks,
+            results_file=Path(self._tmp) / "dead_links.json",
+        )
+        checked = []
+
+        def check(bookmark):
+            checked.append(bookmark.url)
+            return (False, 404) if "gone" in bookmark.url else (True, 200)
+
+        with patch.object(scanner.checker, "_check_url", side_effect=check):
+            records = scanner.scan_now()
+
+        self.assertEqual(sorted(checked), ["https://gone.example/a", "https://ok.example/"])
+        self.assertEqual(sorted(record.bookmark_id for record in records), [1, 2])
+        self.assertEqual([bm.http_status for bm in bookmarks], [404, 404, 200])
+        self.assertEqual(scanner._progress.done, 3)
+
 # ── 12. WallabagJSONImporter ────────────────────────────────────────
 
 class TestWallabagImporter(_IsolatedTestBase):
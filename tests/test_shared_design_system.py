@@ -4,7 +4,16 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from bookmark_organizer_pro.ui import shell_widgets, treeview, widget_controls
+from bookmark_organizer_pro.ui import (
+    components,
+    shell_widgets,
+    treeview,
+    widget_analytics,
+    widget_bookmark_editor,
+    widget_controls,
+    widget_theme_dialogs,
+    workflow_emoji_picker,
+)
 from bookmark_organizer_pro.ui.foundation import DesignTokens, FONTS
 from bookmark_organizer_pro.ui.style_manager import StyleManager
 from bookmark_organizer_pro.ui.theme import ThemeColors
@@ -15,8 +24,15 @@ from bookmark_organizer_pro.ui.workflow_detail_panel import (
     _next_action,
 )
 from bookmark_organizer_pro.app_mixins.app_shell import AppShellMixin
+from bookmark_organizer_pro.app_mixins.categories import CategoryActionsMixin
+from bookmark_organizer_pro.app_mixins.filters import FilterActionsMixin
+from bookmark_organizer_pro.app_mixins import filters as filters_module
+from bookmark_organizer_pro.app_mixins.lifecycle import LifecycleActionsMixin
 from bookmark_organizer_pro.app_mixins.bookmarks import (
+    BookmarkViewMixin,
+    _bookmark_row_cells,
     _bookmark_status,
+    _fmt_tags,
     _relative_added,
     _saved_cell,
     _saved_sort_value,
@@ -180,6 +196,1160 @@ def test_virtual_table_programmatic_selection_is_atomic():
     assert table._sheet.events == []
 
 
+def test_virtual_table_click_syncs_selection_once():
+    table = object.__new__(treeview.VirtualBookmarkSheet)
+    table._select_seen = False
+    synced = []
+    idle = []
+    table._sync_selection_from_sheet = lambda: synced.append(True)
+    table.after_idle = idle.append
+
+    table._on_table_press(SimpleNamespace())
+    table._on_sheet_select()
+    table._on_table_release(SimpleNamespace())
+    assert (len(synced), idle) == (1, [])
+
+    table._on_table_press(SimpleNamespace())
+    table._on_table_release(SimpleNamespace())
+    assert idle == [table._sync_selection_from_sheet]
+
+    # An arrow-key select leaves the flag set; the next plain click still syncs.
+    table._on_sheet_select()
+    table._on_table_press(SimpleNamespace())
+    table._on_table_release(SimpleNamespace())
+    assert (len(synced), idle) == (2, [table._sync_selection_from_sheet] * 2)
+
+
+class _NativeTreeTk:
+    """Minimal Tcl stand-in for the native treeview item commands."""
+
+    def __init__(self):
+        self.items = []
+        self.selected = []
+        self.selection_commands = 0
+
+    def call(self, _widget, command, *args):
+        if command == "selection":
+            if not args:
+                return tuple(self.selected)
+            if args[0] == "add":
+                self.selected += [item for item in args[1] if item not in self.selected]
+            else:
+                self.selected = list(args[1])
+            self.selection_commands += 1
+        if command == "insert":
+            _parent, index, _flag, iid, *_options = args
+            position = len(self.items) if index == "end" else int(index)
+            self.items.insert(position, iid)
+            return iid
+        if command == "children":
+            return tuple(self.items)
+        if command == "delete":
+            for item in args[0]:
+                self.items.remove(item)
+        if command == "move":
+            item, _parent, index = args
+            self.items.remove(item)
+            self.items.insert(int(index), item)
+        return ()
+
+    def splitlist(self, value):
+        return tuple(value)
+
+
+def _native_table(window_rows):
+    table = object.__new__(treeview.SortableTreeview)
+    table.tk = _NativeTreeTk()
+    table._w = ".library"
+    table._columns = ("title",)
+    table._base_headers = {"#0": "Site", "title": "Title"}
+    table._updating_sort_headers = False
+    table._sort_column = None
+    table._sort_reverse = False
+    table._sort_columns = {}
+    table._rows = []
+    table._row_index = {}
+    table._materialized = 0
+    table._all_selected = False
+    table._blank_image = "blank-favicon"
+    table._yscroll_callback = None
+    table._viewport_after = None
+    table.after = lambda _delay, _callback: "after#1"
+    table.after_cancel = lambda _identifier: None
+    table._semantic_state = "ready"
+    table._semantic_message = ""
+    table.WINDOW_ROWS = window_rows
+    return table
+
+
+def test_native_table_cancels_pending_viewport_event_on_destroy(monkeypatch):
+    table = _native_table(window_rows=3)
+    cancelled = []
+    destroyed = []
+    table.after_cancel = cancelled.append
+    monkeypatch.setattr(treeview.ttk.Treeview, "destroy", lambda self: destroyed.append(self))
+
+    table._on_yscroll("0.0", "0.5")
+    table.destroy()
+
+    assert cancelled == ["after#1"]
+    assert table._viewport_after is None
+    assert destroyed == [table]
+
+
+def test_native_table_materializes_rows_in_scroll_windows():
+    table = _native_table(window_rows=3)
+    scrolls = []
+    table._yscroll_callback = lambda first, last: scrolls.append((first, last))
+    table.set_bookmark_rows([
+        {"iid": str(index), "text": f"site{index}", "values": (f"Title {index}",),
+         "sort_values": {"title": index}}
+        for index in range(8)
+    ])
+
+    assert table.tk.items == ["0", "1", "2"]
+    assert table.get_children() == tuple(str(index) for index in range(8))
+    table._on_yscroll("0.0", "0.5")
+    assert len(table.tk.items) == 3
+    table._on_yscroll("0.4", "1.0")
+    assert table.tk.items == [str(index) for index in range(6)]
+    assert scrolls == [("0.0", "0.5"), ("0.4", "1.0")]
+
+    decoded = []
+    table._favicon_photo = lambda path: decoded.append(path) or f"image:{path}"
+    table.set_favicon("7", "site7.png")
+    assert decoded == []
+    table.see("7")
+    assert len(table.tk.items) == 8
+    assert decoded == ["site7.png"]
+    table.delete("3")
+    assert "3" not in table.get_children()
+    assert table.tk.items == ["0", "1", "2", "4", "5", "6", "7"]
+
+    table.selection_set(["5"], emit=False)
+    table.selection_set(["5"], emit=False)
+    assert table.tk.selected == ["5"]
+    assert table.tk.selection_commands == 1
+
+
+def test_native_table_cell_edits_survive_leaving_the_window():
+    table = _native_table(window_rows=3)
+    table.set_bookmark_rows([
+        {"iid": str(index), "text": f"site{index}", "values": (f"Title {index}",)}
+        for index in range(5)
+    ])
+
+    table.item("1", text="renamed", values=("New title",), tags=("pinned",))
+    table.set("4", "title", "Edited")
+    assert table.tk.items == ["0", "1", "2", "3", "4"]
+
+    table._render_window(0)
+    table._render_window(5)
+    snapshot = {row["iid"]: row for row in table._rows}
+    assert (snapshot["1"]["text"], snapshot["1"]["values"], snapshot["1"]["tags"]) == (
+        "renamed", ("New title",), ("pinned",),
+    )
+    assert snapshot["4"]["values"] == ("Edited",)
+
+
+def test_native_table_select_all_leaves_unscrolled_rows_out_of_tk():
+    table = _native_table(window_rows=3)
+    rows = [
+        {"iid": str(index), "text": f"site{index}", "values": (f"Title {index}",)}
+        for index in range(8)
+    ]
+    table.set_bookmark_rows(rows)
+
+    assert table.select_all() == tuple(str(index) for index in range(8))
+    assert table.tk.items == ["0", "1", "2"]
+    assert table.selection() == tuple(str(index) for index in range(8))
+
+    table._on_yscroll("0.4", "1.0")
+    assert table.tk.selected == [str(index) for index in range(6)]
+    table.set_bookmark_rows(rows[:7])
+    assert len(table.tk.items) == 3
+    assert table.selection() == tuple(str(index) for index in range(7))
+
+    table.tk.selected = ["1"]
+    assert table.selection() == ("1",)
+    table.tk.selected = ["0", "1", "2"]
+    assert table.selection() == ("0", "1", "2")
+
+
+def test_native_table_lists_rows_ahead_of_the_viewport_for_prefetch(monkeypatch):
+    table = _native_table(window_rows=4)
+    table.set_bookmark_rows([
+        {"iid": str(index), "text": "", "values": ("",)} for index in range(10)
+    ])
+    monkeypatch.setattr(treeview.ttk.Treeview, "yview", lambda self: (0.0, 0.25))
+
+    assert table.visible_item_ids() == ["0", "1"]
+    assert table.visible_item_ids(ahead=3) == ["0", "1", "2", "3", "4"]
+    assert table.visible_item_ids(ahead=50)[-1] == "9"
+    assert table.tk.items == ["0", "1", "2", "3"]
+
+    prefetched = []
+    view = object.__new__(BookmarkViewMixin)
+    view.tree = table
+    view.favicon_manager = SimpleNamespace(enabled=True, prefetch=prefetched.extend)
+    view._tree_item_domains = {str(index): f"site{index}.example" for index in range(10) if index != 1}
+    view._queue_visible_favicons()
+    assert prefetched[0] == ("site0.example", 0)
+    assert [item for _domain, item in prefetched] == [0, *range(2, 10)]
+
+
+def test_native_table_refresh_sends_only_changed_rows_to_tk():
+    table = _native_table(window_rows=3)
+    table.set_bookmark_rows([
+        {"iid": str(index), "text": f"site{index}", "values": (f"Title {index}",)}
+        for index in range(5)
+    ])
+    assert table.tk.items == ["0", "1", "2"]
+    table._rows[1]["image"] = "icon-1"
+
+    commands = []
+    call = table.tk.call
+    table.tk.call = lambda widget, command, *args: (
+        commands.append((command, args[0] if args else None)) or call(widget, command, *args)
+    )
+    table.set_bookmark_rows([
+        {"iid": "1", "text": "site1", "values": ("Title 1",)},
+        {"iid": "2", "text": "site2", "values": ("Renamed",)},
+        {"iid": "9", "text": "site9", "values": ("Title 9",)},
+        {"iid": "3", "text": "site3", "values": ("Title 3",)},
+    ])
+
+    assert table.tk.items == ["1", "2", "9"]
+    assert table.get_children() == ("1", "2", "9", "3")
+    assert [command for command, _ in commands if command not in ("selection", "children")] == [
+        "delete", "item", "insert",
+    ]
+    assert ("item", "2") in commands
+    assert table._rows[0]["image"] == "icon-1"
+
+
+def test_native_table_shares_favicon_images(tmp_path, monkeypatch):
+    from PIL import Image, ImageTk
+
+    monkeypatch.setattr(ImageTk, "PhotoImage", lambda image: ("photo", image.size))
+    table = _native_table(window_rows=3)
+    table._favicon_images = {}
+    table._favicon_bitmaps = {}
+    paths = []
+    for name, color in (("a", "red"), ("b", "red"), ("c", "blue")):
+        path = tmp_path / f"{name}.png"
+        Image.new("RGBA", (32, 32), color).save(path)
+        paths.append(str(path))
+
+    assert table.needs_favicon_decode(paths[0])
+    photos = [table._favicon_photo(path) for path in paths]
+    assert not table.needs_favicon_decode(paths[0])
+    assert photos[0] is photos[1]
+    assert photos[0] is not photos[2]
+    assert len(table._favicon_bitmaps) == 2
+
+    inserted = []
+    table.tk.call = lambda *args: inserted.append(args) or args[4]
+    table._insert_row("end", {"iid": "1", "text": "", "values": ("A", ""), "tags": ("pinned",)})
+    assert inserted == [(
+        ".library", "insert", "", "end", "-id", "1",
+        "-text", "", "-values", ("A", ""), "-tags", ("pinned",), "-image", "blank-favicon",
+    )]
+
+
+def test_native_table_sorts_logical_rows_before_the_window():
+    table = _native_table(window_rows=2)
+    table.set_bookmark_rows([
+        {"iid": str(index), "text": "", "values": ("",), "sort_values": {"title": index}}
+        for index in range(5)
+    ])
+    table._sort_column = "title"
+    table._sort_reverse = True
+
+    table._apply_sort("title", emit=False)
+
+    assert table.get_children() == ("4", "3", "2", "1", "0")
+    assert table.tk.items == ["4", "3"]
+    assert table.semantic_snapshot()["rows"][0]["id"] == "4"
+
+
+def test_native_table_keeps_sort_values_by_column():
+    table = _native_table(window_rows=5)
+    table.set_bookmark_rows([
+        {"iid": "1", "text": "b", "values": ("",), "sort_values": {"title": "beta"}},
+        {"iid": "2", "text": "a", "values": ("",), "sort_values": {"title": "Alpha"}},
+        {"iid": "3", "text": "c", "values": ("",), "sort_values": {}},
+    ])
+    assert table._sort_columns == {"title": {"1": "beta", "2": "Alpha"}}
+    assert table._sort_source_values("title") == {"1": "beta", "2": "Alpha", "3": ""}
+    assert table._sort_source_values("#0") == {"1": "b", "2": "a", "3": "c"}
+
+    table.set_sort_values("3", {"title": "gamma"})
+    table._sort_column = "title"
+    table._apply_sort("title", emit=False)
+    assert table.get_children() == ("2", "1", "3")
+
+    table.delete("1")
+    assert table._sort_columns == {"title": {"2": "Alpha", "3": "gamma"}}
+    assert treeview.sort_table_column(["1", "2", "3"], {"1": 3, "3": 1}) == ["3", "1", "2"]
+
+
+def test_favicon_ready_checks_the_image_cache_on_the_ui_thread(tmp_path):
+    from PIL import Image
+
+    icon = tmp_path / "site.png"
+    Image.new("RGBA", (32, 32), (200, 10, 10, 255)).save(icon)
+    decoded = treeview.decode_favicon(str(icon))
+    assert decoded.size == (16, 16)
+    assert treeview.decode_favicon(str(tmp_path / "missing.png")) is None
+
+    posted = []
+    submitted = []
+    checked = []
+    view = object.__new__(BookmarkViewMixin)
+    view._post_to_ui = posted.append
+    view._favicon_decodes_pending = set()
+    view._favicon_decode_pool = SimpleNamespace(
+        submit=lambda fn, *args: submitted.append((fn, args)),
+    )
+    view._tree_domains = {"example.com": ["7"]}
+    applied = []
+    cached_paths = set()
+    view.tree = SimpleNamespace(
+        set_favicon=lambda *args: applied.append(args),
+        needs_favicon_decode=lambda path: checked.append(path) or path not in cached_paths,
+    )
+
+    # The favicon worker only posts; the cache lookup happens in the UI callback.
+    view._on_favicon_ready_threadsafe("example.com", str(icon), 7)
+    assert (checked, applied, submitted) == ([], [], [])
+    posted[0]()
+    assert checked == [str(icon)]
+    fn, args = submitted[0]
+    fn(*args)
+    posted[1]()
+    assert applied[0][:2] == ("7", str(icon))
+    assert applied[0][2].size == (16, 16)
+
+    cached_paths.add(str(icon))
+    view._on_favicon_ready_threadsafe("example.com", str(icon), 8)
+    posted[2]()
+    assert applied[1] == ("7", str(icon), None)
+    assert len(submitted) == 1
+
+
+def test_uncached_favicons_decode_once_off_the_ui_thread(tmp_path):
+    from PIL import Image
+
+    icon = tmp_path / "site.png"
+    Image.new("RGBA", (32, 32), (10, 200, 10, 255)).save(icon)
+    submitted = []
+    posted = []
+    applied = []
+    view = object.__new__(BookmarkViewMixin)
+    view._favicon_decodes_pending = set()
+    view._favicon_decode_pool = SimpleNamespace(
+        submit=lambda fn, *args: submitted.append((fn, args)),
+    )
+    view._post_to_ui = posted.append
+    view._tree_domains = {"example.com": ["7", "8"]}
+    view.tree = SimpleNamespace(set_favicon=lambda *args: applied.append(args))
+
+    view._decode_favicons_async({str(icon): "example.com"})
+    view._decode_favicons_async({str(icon): "example.com"})
+    assert len(submitted) == 1
+    assert applied == []
+
+    fn, args = submitted[0]
+    fn(*args)
+    assert applied == []
+    posted[0]()
+    assert [call[:2] for call in applied] == [("7", str(icon)), ("8", str(icon))]
+    assert applied[0][2].size == (16, 16)
+    view._decode_favicons_async({str(icon): "example.com"})
+    assert len(submitted) == 2
+
+
+def test_list_populate_reuses_row_invariants_across_rows():
+    rendered = []
+    view = object.__new__(BookmarkViewMixin)
+    view.theme = ThemeColors()
+    view.favicon_manager = SimpleNamespace(get_cached=lambda _domain: None)
+    view.tree = SimpleNamespace(
+        tag_configure=lambda *_args, **_kwargs: None,
+        set_bookmark_rows=rendered.extend,
+    )
+    view._update_status_counts = view._update_selection_bar = lambda: None
+    bookmarks = [
+        Bookmark(id=1, url="https://a.example", title="A", is_pinned=True),
+        Bookmark(id=2, url="https://b.example", title="B", is_valid=False),
+        Bookmark(id=3, url="https://c.example", title="C", is_archived=True),
+        Bookmark(id=4, url="https://d.example", title="D", is_archived=True),
+    ]
+
+    view._populate_list_view(bookmarks)
+
+    assert [row["tags"] for row in rendered] == [
+        ("oddrow",), ("evenrow", "broken"), ("oddrow", "archived"), ("evenrow", "archived"),
+    ]
+    assert [row["values"][-1] for row in rendered] == ["Yes", "No", "No", "No"]
+    assert [row["sort_values"]["status"] for row in rendered] == [2, 0, 2, 2]
+    assert view._tree_domains["b.example"] == ["2"]
+    assert view._tree_item_ids == {"1": 1, "2": 2, "3": 3, "4": 4}
+    assert view._bookmark_ids_for(("4", "2", "17")) == [4, 2, 17]
+
+
+class _SidebarTree:
+    def __init__(self):
+        self.items = {}
+        self.children = {"": []}
+        self.selected = ()
+        self.item_writes = 0
+        self.deleted = []
+        self.moves = 0
+        self.packed = True
+        self.options = {}
+
+    @property
+    def order(self):
+        flat = []
+
+        def walk(parent):
+            for child in self.children[parent]:
+                flat.append(child)
+                walk(child)
+
+        walk("")
+        return flat
+
+    def get_children(self, item=""):
+        return tuple(self.children.get(item, ()))
+
+    def exists(self, item):
+        return item in self.items
+
+    def delete(self, *items):
+        for item in items:
+            self.deleted.append(item)
+            for child in list(self.children.pop(item, ())):
+                self.delete(child)
+            parent = self.items.pop(item)["parent"]
+            self.children[parent].remove(item)
+
+    def insert(self, parent, index, iid, text, open):
+        self.items[iid] = {"parent": parent, "text": text, "values": ()}
+        self.children[parent].insert(len(self.children[parent]) if index == "end" else index, iid)
+        self.children[iid] = []
+        return iid
+
+    def move(self, item, parent, index):
+        self.moves += 1
+        self.children[self.items[item]["parent"]].remove(item)
+        self.children[parent].insert(len(self.children[parent]) if index == "end" else index, item)
+        self.items[item]["parent"] = parent
+
+    def item(self, iid, **options):
+        self.item_writes += 1
+        self.items[iid].update(options)
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items)
+
+    def selection_remove(self, *_items):
+        self.selected = ()
+
+    def see(self, _item):
+        return None
+
+    def winfo_manager(self):
+        return "pack" if self.packed else ""
+
+    def pack(self, **_kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+
+def test_category_sidebar_tree_rewrites_only_changed_items():
+    counts = {"Dev": 2, "Dev / Python": 1, "News": 1}
+    host = object.__new__(CategoryActionsMixin)
+    # No bind(): the frame's context menu is bound once, with the tree.
+    host.categories_frame = SimpleNamespace()
+    host.current_category = None
+    host.bookmark_manager = SimpleNamespace(
+        get_category_counts=lambda: dict(counts),
+        get_all_bookmarks=lambda: [object(), object(), object()],
+    )
+    host.category_manager = SimpleNamespace(
+        get_sorted_categories=lambda: ["Dev", "Dev / Python", "News"],
+    )
+    host._set_category_notice = lambda _text: None
+    tree = _SidebarTree()
+    host._category_tree_order = []
+    host._category_tree_counts = {}
+    host._category_tree_layout = {}
+    host._category_tree_widget = lambda: tree
+
+    host._refresh_category_list()
+    assert tree.order == ["Dev", "Dev / Python", "News"]
+    assert tree.items["Dev / Python"]["parent"] == "Dev"
+    assert tree.items["Dev / Python"]["text"] == "Python"
+    assert tree.items["Dev"]["values"] == ("2",)
+    assert tree.options["height"] == 3
+    writes = tree.item_writes
+
+    host.current_category = "News"
+    counts["Dev"] = 5
+    host._refresh_category_list()
+    assert tree.deleted == []
+    assert tree.item_writes == writes + 1
+    assert tree.selected == ("News",)
+
+    counts.pop("Dev")
+    host._refresh_category_list()
+    assert tree.deleted == ["Dev"]
+    assert tree.order == ["Dev / Python", "News"]
+    assert tree.items["Dev / Python"] == {
+        "parent": "", "text": "Dev / Python", "values": ("1",),
+    }
+    assert tree.selected == ("News",)
+
+    counts["Art"] = 4
+    writes = tree.item_writes
+    host._refresh_category_list()
+    assert tree.deleted == ["Dev"]
+    assert tree.order == ["Art", "Dev / Python", "News"]
+    assert tree.item_writes == writes + 1
+    assert tree.options["height"] == 3
+
+    counts["Dev"] = 1
+    moves = tree.moves
+    host._refresh_category_list()
+    assert tree.deleted == ["Dev"]
+    assert tree.moves == moves + 1
+    assert tree.order == ["Art", "Dev", "Dev / Python", "News"]
+    assert tree.items["Dev / Python"]["parent"] == "Dev"
+    assert tree.items["Dev / Python"]["text"] == "Python"
+
+
+def test_category_sidebar_refresh_bursts_coalesce_into_one_render():
+    scheduled = []
+    cancelled = []
+    host = object.__new__(CategoryActionsMixin)
+    host.root = SimpleNamespace(
+        after_idle=lambda callback: scheduled.append(callback) or f"idle#{len(scheduled)}",
+        after_cancel=cancelled.append,
+    )
+    host.categories_frame = None
+
+    for _ in range(5):
+        host._schedule_category_refresh()
+    assert len(scheduled) == 1
+
+    host._flush_category_refresh()
+    assert cancelled == ["idle#1"]
+    assert host._category_refresh_after is None
+    host._schedule_category_refresh()
+    assert len(scheduled) == 2
+
+
+def test_category_tree_events_select_toggle_and_open_menus():
+    host = object.__new__(CategoryActionsMixin)
+    host.current_category = "Dev"
+    selected = []
+    menus = []
+    host._select_category = selected.append
+    host._show_category_context_menu = lambda _event, name: menus.append(name)
+    host._show_add_category_menu = lambda _event: menus.append(None)
+    focused = ["Dev"]
+    widget = SimpleNamespace(
+        selection=lambda: ("News",),
+        focus=lambda: focused[0],
+        identify_row=lambda y: "Dev" if y < 30 else "",
+    )
+    host.category_tree = widget
+
+    host._on_category_tree_select(SimpleNamespace(widget=widget))
+    host._activate_category_tree_row()
+    focused[0] = ""
+    host._activate_category_tree_row()
+    host._on_category_tree_context(SimpleNamespace(widget=widget, y=10))
+    host._on_category_tree_context(SimpleNamespace(widget=widget, y=40))
+
+    assert selected == ["News", "Dev"]
+    assert menus == ["Dev", None]
+
+
+def test_theme_previews_are_cached_swatch_images(monkeypatch):
+    class _Image:
+        def __init__(self, master, width, height):
+            self.size = (width, height)
+            self.fills = []
+
+        def put(self, color, to):
+            self.fills.append((color, to))
+
+    monkeypatch.setattr(widget_theme_dialogs.tk, "PhotoImage", _Image)
+    dialog = object.__new__(widget_theme_dialogs.ThemeSelectorDialog)
+    dialog._preview_images = {}
+    colors = ThemeColors()
+
+    image = dialog._preview_image(colors)
+    assert dialog._preview_image(ThemeColors()) is image
+    assert image.size == (60, 40)
+    assert image.fills == [
+        (colors.bg_primary, (0, 0, 60, 32)),
+        (colors.accent_primary, (0, 32, 60, 40)),
+    ]
+
+    parts = (_Configurable(), _Configurable())
+    widget_theme_dialogs.ThemeSelectorDialog._paint_theme_row(parts, "#123456")
+    assert [part.options["bg"] for part in parts] == ["#123456", "#123456"]
+
+
+def test_scrollable_frame_takes_scroll_region_from_the_inner_frame_size():
+    configured = []
+    frame = components.ScrollableFrame.__new__(components.ScrollableFrame)
+    frame._scroll_region = None
+    frame.canvas = SimpleNamespace(
+        configure=lambda **kwargs: configured.append(kwargs),
+        bbox=lambda *_args: (_ for _ in ()).throw(AssertionError("bbox walk")),
+    )
+
+    frame._on_frame_configure(SimpleNamespace(width=240, height=900))
+    frame._on_frame_configure(SimpleNamespace(width=240, height=900))
+    frame._on_frame_configure(SimpleNamespace(width=240, height=960))
+
+    assert configured == [
+        {"scrollregion": (0, 0, 240, 900)},
+        {"scrollregion": (0, 0, 240, 960)},
+    ]
+
+
+def test_import_area_hover_recolours_its_cached_surface_widgets():
+    painted = []
+
+    class Surface:
+        def __init__(self, name):
+            self.name = name
+
+        def configure(self, **kwargs):
+            painted.append((self.name, kwargs["bg"]))
+
+    zone = components.DragDropImportArea.__new__(components.DragDropImportArea)
+    zone._surface_widgets = [Surface("zone"), Surface("icon"), Surface("copy")]
+    zone.compact_row = None
+
+    zone._apply_surface("#123456")
+
+    assert painted == [("zone", "#123456"), ("icon", "#123456"), ("copy", "#123456")]
+
+
+def test_analytics_helpers_reuse_the_dialog_palette(monkeypatch):
+    labels = []
+
+    class Widget:
+        def __init__(self, _parent=None, **kwargs):
+            labels.append(kwargs)
+
+        def pack(self, **_kwargs):
+            pass
+
+        grid = pack
+
+    monkeypatch.setattr(widget_analytics.tk, "Frame", Widget)
+    monkeypatch.setattr(widget_analytics.tk, "Label", Widget)
+    monkeypatch.setattr(
+        widget_analytics, "get_theme",
+        lambda: (_ for _ in ()).throw(AssertionError("palette re-resolved")),
+    )
+    dashboard = widget_analytics.AnalyticsDashboard.__new__(widget_analytics.AnalyticsDashboard)
+    dashboard._theme = ThemeColors()
+
+    dashboard._create_stat_card(object(), "Tags", "4", "", 0)
+    dashboard._create_section(object(), "Top Domains", "example.com 4")
+
+    assert {label.get("bg") for label in labels} == {ThemeColors().bg_secondary}
+
+
+def test_emoji_filter_regrids_pooled_cells_instead_of_rebuilding(monkeypatch):
+    created = []
+
+    class Widget:
+        def __init__(self, _parent=None, **kwargs):
+            self.text = kwargs.get("text")
+            self.packed = False
+            self.cell = None
+            created.append(self)
+
+        def pack(self, **_kwargs):
+            self.packed = True
+
+        def pack_forget(self):
+            self.packed = False
+
+        def grid(self, row, column, **_kwargs):
+            self.cell = (row, column)
+
+        def grid_forget(self):
+            self.cell = None
+
+        def bind(self, *_args):
+            pass
+
+    monkeypatch.setattr(workflow_emoji_picker.tk, "Frame", Widget)
+    monkeypatch.setattr(workflow_emoji_picker.tk, "Label", Widget)
+    monkeypatch.setattr(workflow_emoji_picker, "make_keyboard_activatable", lambda *_a, **_k: None)
+    monkeypatch.setattr(workflow_emoji_picker, "get_theme", ThemeColors)
+    picker = object.__new__(workflow_emoji_picker.EmojiPicker)
+    picker.EMOJIS = {"Food": "🍕🍔", "Tech": "💻"}
+    picker.emoji_frame = object()
+
+    picker._render_emojis()
+    built = len(created)
+    headers = {widget.text: widget for widget in created if widget.text in picker.EMOJIS}
+    cells = {widget.text: widget for widget in created if widget.text in {"🍕", "🍔", "💻"}}
+    assert all(widget.packed for widget in headers.values())
+
+    picker._render_emojis("🍔")
+    assert len(created) == built
+    assert not headers["Tech"].packed
+    assert (cells["🍕"].cell, cells["🍔"].cell) == (None, (0, 0))
+
+    picker._render_emojis("tech")
+    assert len(created) == built
+    assert (headers["Food"].packed, headers["Tech"].packed) == (False, True)
+    assert cells["💻"].cell == (0, 0)
+
+
+def test_analytics_long_sections_render_in_a_read_only_text(monkeypatch):
+    created = []
+
+    class Widget:
+        def __init__(self, _parent=None, **kwargs):
+            self.kwargs = kwargs
+            self.calls = []
+            created.append((type(self).__name__, self))
+
+        def pack(self, **_kwargs):
+            pass
+
+        def insert(self, index, text):
+            self.calls.append(("insert", index, text))
+
+        def configure(self, **kwargs):
+            self.calls.append(("configure", kwargs))
+
+    class Frame(Widget):
+        pass
+
+    class Label(Widget):
+        pass
+
+    class Text(Widget):
+        pass
+
+    monkeypatch.setattr(widget_analytics.tk, "Frame", Frame)
+    monkeypatch.setattr(widget_analytics.tk, "Label", Label)
+    monkeypatch.setattr(widget_analytics.tk, "Text", Text)
+    dashboard = widget_analytics.AnalyticsDashboard.__new__(widget_analytics.AnalyticsDashboard)
+    dashboard._theme = ThemeColors()
+    limit = dashboard.LABEL_SECTION_MAX_LINES
+
+    dashboard._create_section(object(), "Short", "\n".join(["row"] * limit))
+    assert [kind for kind, _widget in created] == ["Frame", "Label", "Label"]
+
+    created.clear()
+    long_text = "\n".join(["row"] * (limit + 1))
+    dashboard._create_section(object(), "Long", long_text)
+
+    assert [kind for kind, _widget in created] == ["Frame", "Label", "Text"]
+    text = created[-1][1]
+    assert text.kwargs["height"] == 20
+    assert text.calls == [("insert", "1.0", long_text), ("configure", {"state": "disabled"})]
+
+
+def test_analytics_below_the_fold_sections_are_built_once():
+    dashboard = widget_analytics.AnalyticsDashboard.__new__(widget_analytics.AnalyticsDashboard)
+    dashboard.stats = {
+        "total_bookmarks": 4, "age_distribution": {"Older": 4}, "top_domains": [],
+        "uncategorized": 1, "duplicate_bookmarks": 0, "broken": 0, "stale": 0,
+    }
+    dashboard._content = "content"
+    dashboard._sections_built = False
+    dashboard.winfo_exists = lambda: True
+    built = []
+    dashboard._create_section = lambda parent, title, _text: built.append((parent, title))
+
+    dashboard._build_remaining_sections()
+    dashboard._build_remaining_sections()
+
+    assert built == [
+        ("content", "Bookmark Age Distribution"),
+        ("content", "Top Domains"),
+        ("content", "Issues to Address"),
+    ]
+
+
+def test_analytics_text_charts_format_shares_of_the_library():
+    dashboard = widget_analytics.AnalyticsDashboard.__new__(widget_analytics.AnalyticsDashboard)
+    dashboard.stats = {
+        "total_bookmarks": 8,
+        "category_counts": {"Docs": 1, "Empty": 0, "Research": 3},
+        "age_distribution": {"This week": 2, "Older": 6},
+        "top_domains": [("example.com", 5), ("docs.python.org", 3)],
+    }
+
+    assert dashboard._get_category_chart().splitlines() == [
+        f"{'Research':<34}    3   37.5%",
+        f"{'Docs':<34}    1   12.5%",
+    ]
+    assert dashboard._get_age_chart().splitlines() == [
+        f"{'This week':<16}    2   25.0%",
+        f"{'Older':<16}    6   75.0%",
+    ]
+    assert dashboard._get_domains_list().splitlines() == [
+        f"  {'example.com':<35}    5",
+        f"  {'docs.python.org':<35}    3",
+    ]
+
+
+def test_quick_filter_hover_skips_repaints_of_the_current_state():
+    calls = []
+
+    class Part:
+        def configure(self, **kwargs):
+            calls.append(kwargs)
+
+    filters = FilterActionsMixin()
+    filters.theme = ThemeColors()
+    filters.filter_button_parts = {"Pinned": (Part(), Part(), Part())}
+
+    filters._set_filter_visual("Pinned", False, hover=True)
+    painted = len(calls)
+    filters._set_filter_visual("Pinned", False, hover=True)
+    assert len(calls) == painted
+    filters._set_filter_visual("Pinned", False)
+    assert len(calls) == painted * 2
+
+
+def test_sidebar_hover_dispatches_through_shared_class_bindings():
+    bound = {}
+    visuals = []
+    shell = object.__new__(AppShellMixin)
+    shell.theme = ThemeColors()
+    shell.root = SimpleNamespace(bind_class=lambda tag, sequence, handler: bound.setdefault((tag, sequence), handler))
+    shell.active_filter = "All"
+    shell._set_filter_visual = lambda name, active, hover=False: visuals.append((name, hover))
+    shell._bind_sidebar_row_classes()
+
+    pinned = SimpleNamespace(_bop_filter_name="Pinned")
+    bound[("BopQuickFilter", "<Enter>")](SimpleNamespace(widget=pinned))
+    bound[("BopQuickFilter", "<Leave>")](SimpleNamespace(widget=pinned))
+    bound[("BopQuickFilter", "<Enter>")](SimpleNamespace(widget=SimpleNamespace(_bop_filter_name="All")))
+    assert visuals == [("Pinned", True), ("Pinned", False)]
+
+    row = _Configurable()
+    bound[("BopSidebarRow", "<Enter>")](SimpleNamespace(widget=row))
+    assert row.options == {"bg": ThemeColors().bg_hover, "fg": ThemeColors().text_primary}
+
+
+def test_display_refreshes_merge_into_one_idle_flush():
+    scheduled = []
+    calls = []
+    host = object.__new__(LifecycleActionsMixin)
+    host.root = SimpleNamespace(
+        after_idle=lambda callback: scheduled.append(callback) or "after#1",
+        after_cancel=lambda _after_id: None,
+    )
+    host.status_label = None
+    for name in (
+        "_refresh_category_list", "_refresh_bookmark_list", "_refresh_analytics",
+        "_update_status_counts",
+    ):
+        setattr(host, name, lambda name=name: calls.append(name))
+
+    host._refresh_all()
+    host._set_status("Moved")
+    host._refresh_all()
+    assert len(scheduled) == 1 and calls == []
+
+    scheduled[0]()
+    assert calls == [
+        "_refresh_category_list", "_refresh_bookmark_list", "_refresh_analytics",
+        "_update_status_counts",
+    ]
+    host._set_status("Ready")
+    assert len(scheduled) == 2
+
+
+def test_opening_several_bookmarks_saves_the_library_once(monkeypatch):
+    from bookmark_organizer_pro.app_mixins import selection as selection_module
+    from bookmark_organizer_pro.app_mixins.bookmark_crud import BookmarkCrudMixin
+    from bookmark_organizer_pro.app_mixins.selection import SelectionActionsMixin
+
+    class Host(BookmarkCrudMixin, SelectionActionsMixin, LifecycleActionsMixin):
+        pass
+
+    scheduled = []
+    cancelled = []
+    saves = []
+    visits = []
+    host = object.__new__(Host)
+    host.root = SimpleNamespace(
+        after=lambda delay, callback: scheduled.append((delay, callback)) or f"after#{len(scheduled)}",
+        after_cancel=cancelled.append,
+    )
+    host.bookmark_manager = SimpleNamespace(
+        get_bookmark=lambda bm_id: SimpleNamespace(id=bm_id, url=f"https://{bm_id}.example"),
+        record_visit=lambda bm_id, save=True: visits.append((bm_id, save)) or object(),
+        save_pending_visits=lambda: saves.append(True),
+    )
+    host.selected_bookmarks = [1, 2, 3]
+    monkeypatch.setattr(selection_module, "_open_external_url", lambda _url: True)
+    host._open_selected()
+
+    assert visits == [(1, False), (2, False), (3, False)]
+    assert cancelled == ["after#1", "after#2"]
+    assert saves == []
+    scheduled[-1][1]()
+    host._flush_save()
+    assert saves == [True]
+
+
+def test_select_all_refreshes_selection_chrome_once():
+    from bookmark_organizer_pro.app_mixins.selection import SelectionActionsMixin
+
+    class Host(SelectionActionsMixin, BookmarkViewMixin):
+        pass
+
+    calls = []
+    host = object.__new__(Host)
+    host._tree_item_ids = {"1": 1, "2": 2, "3": 3}
+    selection = []
+
+    def select_all():
+        selection[:] = ["1", "2", "3"]
+        host._on_selection_change(None)
+        return tuple(selection)
+
+    host.tree = SimpleNamespace(select_all=select_all, selection=lambda: tuple(selection))
+    for name in (
+        "_update_status_counts", "_update_selection_bar", "_update_right_rail_selection",
+        "_refresh_table_semantic_status",
+    ):
+        setattr(host, name, lambda name=name: calls.append(name))
+    host._set_status = lambda message: calls.append(message)
+
+    assert host._select_all_bookmarks() == "break"
+    assert host.selected_bookmarks == [1, 2, 3]
+    assert calls == [
+        "_update_status_counts", "_update_selection_bar", "_update_right_rail_selection",
+        "_refresh_table_semantic_status", "3 bookmarks selected",
+    ]
+
+
+def test_moving_a_selection_batches_its_library_writes():
+    import contextlib
+    from bookmark_organizer_pro.app_mixins.bookmark_crud import BookmarkCrudMixin
+    from bookmark_organizer_pro.app_mixins.selection import SelectionActionsMixin
+
+    class Host(BookmarkCrudMixin, SelectionActionsMixin):
+        pass
+
+    events = []
+
+    @contextlib.contextmanager
+    def batch():
+        events.append("begin")
+        yield
+        events.append("save")
+
+    bookmarks = {bm_id: SimpleNamespace(id=bm_id, category="Old") for bm_id in (1, 2)}
+    host = object.__new__(Host)
+    host.bookmark_manager = SimpleNamespace(
+        batch=batch,
+        get_bookmark=bookmarks.get,
+        update_bookmark=lambda bm: events.append(("update", bm.id)),
+    )
+    host._refresh_all = lambda: None
+    host._set_status = lambda _message: None
+
+    host.selected_bookmarks = [1, 2]
+    host._send_to_category("New")
+    assert events == ["begin", ("update", 1), ("update", 2), "save"]
+    assert {bm.category for bm in bookmarks.values()} == {"New"}
+
+    events.clear()
+    host.selected_bookmarks = [1]
+    host._send_to_category("Solo")
+    assert events == [("update", 1)]
+
+
+def test_search_keystrokes_collapse_into_one_debounced_refresh():
+    scheduled = []
+    cancelled = []
+    visuals = []
+    refreshes = []
+    filters = FilterActionsMixin()
+    filters.root = SimpleNamespace(
+        after=lambda delay, callback: scheduled.append((delay, callback)) or f"after#{len(scheduled)}",
+        after_cancel=cancelled.append,
+    )
+    filters._show_filter_hints = lambda _text: None
+    filters._set_filter_visual = lambda name, active: visuals.append((name, active))
+    filters._refresh_bookmark_list = lambda: refreshes.append(filters.search_query)
+    filters.filter_buttons = {"All": object(), "Pinned": object()}
+    filters.quick_filter = "pinned"
+    filters.active_filter = "Pinned"
+
+    for text in ("p", "py", "pyt"):
+        filters.search_var = SimpleNamespace(get=lambda text=text: text)
+        filters._on_search_change()
+
+    assert visuals == [("All", False), ("Pinned", False)]
+    assert cancelled == ["after#1", "after#2"]
+    assert {delay for delay, _ in scheduled} == {filters_module.SEARCH_DEBOUNCE_MS}
+    scheduled[-1][1]()
+    assert refreshes == ["pyt"]
+    assert filters._search_after is None
+
+
+def test_filter_hint_popup_is_reused_while_hints_are_unchanged(monkeypatch):
+    built = []
+    destroyed = []
+
+    class FakeWidget:
+        def __init__(self, *args, **kwargs):
+            self.kwargs = kwargs
+
+        def __getattr__(self, _name):
+            return lambda *args, **kwargs: None
+
+    class FakeToplevel(FakeWidget):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            built.append(self)
+
+        def destroy(self):
+            destroyed.append(self)
+
+    monkeypatch.setattr(filters_module.tk, "Toplevel", FakeToplevel)
+    monkeypatch.setattr(filters_module.tk, "Frame", FakeWidget)
+    monkeypatch.setattr(filters_module.tk, "Label", FakeWidget)
+    monkeypatch.setattr(FilterActionsMixin, "_filter_hint_popup", None)
+    monkeypatch.setattr(FilterActionsMixin, "_filter_hint_key", None)
+    filters = FilterActionsMixin()
+    filters.theme = ThemeColors()
+    filters.root = object()
+    filters.search_entry = SimpleNamespace(
+        update_idletasks=lambda: None,
+        winfo_rootx=lambda: 0,
+        winfo_rooty=lambda: 0,
+        winfo_height=lambda: 20,
+    )
+
+    for text in ("d", "do", "dom", "doma"):
+        filters._show_filter_hints(text)
+    assert len(built) == 1 and destroyed == []
+
+    filters._show_filter_hints("domain:")
+    assert destroyed == built
+    assert FilterActionsMixin._filter_hint_popup is None
+    filters._show_filter_hints("   ")
+    assert len(built) == 1
+
+
+def test_bookmark_editor_save_reads_each_control_once():
+    reads = []
+
+    class Var:
+        def __init__(self, name, value):
+            self.name, self.value = name, value
+
+        def get(self, *_args):
+            reads.append(self.name)
+            return self.value
+
+    bookmark = Bookmark(id=1, url="https://old.example", title="Old")
+    editor = widget_bookmark_editor.BookmarkEditorDialog.__new__(
+        widget_bookmark_editor.BookmarkEditorDialog
+    )
+    editor.bookmark = bookmark
+    editor.on_save = None
+    editor.destroy = lambda: None
+    editor.url_var = Var("url", "example.com")
+    editor.title_var = Var("title", "")
+    editor.category_var = Var("category", "Docs")
+    editor.tag_editor = SimpleNamespace(get_tags=Var("tags", ["a"]).get)
+    editor.notes_text = Var("notes", " note \n")
+    editor.pinned_var = Var("pinned", True)
+    editor.archived_var = Var("archived", False)
+    editor.read_later_var = Var("read_later", True)
+
+    editor._save()
+
+    assert sorted(reads) == sorted(
+        ["url", "title", "category", "tags", "notes", "pinned", "archived", "read_later"]
+    )
+    assert editor.result["notes"] == bookmark.notes == "note"
+    assert editor.result["title"] == bookmark.title == "https://example.com"
+    assert editor.result["tags"] == bookmark.tags == ["a"]
+    assert editor.result["tags"] is not bookmark.tags
+
+
+def test_bookmark_editor_recycles_tk_variables_per_interpreter(monkeypatch):
+    dialog_cls = widget_bookmark_editor.BookmarkEditorDialog
+    monkeypatch.setattr(dialog_cls, "_var_pool", [])
+    removed = []
+
+    class Var:
+        def trace_remove(self, mode, name):
+            removed.append((mode, name))
+
+    interp, other_interp = object(), object()
+    variables = tuple(Var() for _ in range(6))
+    editor = dialog_cls.__new__(dialog_cls)
+    editor.tk = interp
+    editor.url_var = variables[0]
+    editor._url_trace = "trace-1"
+    editor._pooled_vars = variables
+
+    editor._release_vars()
+    editor._release_vars()
+
+    assert removed == [("write", "trace-1")]
+    assert dialog_cls._var_pool == [(interp, variables)]
+
+    dialog_cls._var_pool.insert(0, (other_interp, ()))
+    reopened = dialog_cls.__new__(dialog_cls)
+    reopened.tk = interp
+    assert reopened._acquire_vars() is variables
+    assert dialog_cls._var_pool == [(other_interp, ())]
+
+
+def test_combobox_values_quote_once_and_round_trip_through_tcl():
+    import tkinter
+
+    from bookmark_organizer_pro.ui.tk_interactions import combobox_values
+
+    interp = tkinter.Tcl()
+    categories = ["Docs", "Work / Clients", "Odd {brace", "", "[cmd] $x"]
+    quoted = combobox_values(interp, categories)
+
+    assert isinstance(quoted, str)
+    assert combobox_values(interp, list(categories)) is quoted
+    assert interp.splitlist(quoted) == tuple(categories)
+    assert interp.tk.call("info", "exists", "::bop_combobox_values") == 0
+
+
 def test_dropdown_keyboard_selection_wraps(monkeypatch):
     monkeypatch.setattr(shell_widgets, "get_theme", lambda: ThemeColors())
     menu = object.__new__(shell_widgets.StyledDropdownMenu)
@@ -198,6 +1368,11 @@ def test_library_rows_surface_time_and_state_without_color_only():
     assert _relative_added("2026-07-11T08:00:00", now) == "Yesterday"
     assert _relative_added("2026-07-09T08:00:00", now) == "3 days ago"
     assert _relative_added("not-a-date", now) == "—"
+    assert _relative_added("2026-07-11T23:30:00-04:00", now) == "Yesterday"
+    assert _relative_added("2026-07-12", now) == "Today"
+    assert _relative_added("2026-02-30T00:00:00", now) == "—"
+    assert _relative_added("20260711T080000", now) == "Yesterday"
+    assert _relative_added("", now) == "—"
     assert _saved_cell("2026-07-12T08:00:00", now) == "Today\nJul 12"
     assert _saved_cell("2026-06-12T08:00:00", now) == "Jun 12\n2026"
 
@@ -211,6 +1386,41 @@ def test_library_rows_surface_time_and_state_without_color_only():
     assert _bookmark_status(bookmark) == "● Needs review"
 
 
+def test_library_row_cells_are_cached_until_displayed_fields_change():
+    today = datetime(2026, 7, 12).date()
+    bookmark = Bookmark(
+        id=1, url="https://www.example.com/a", title="Example",
+        created_at="2026-07-12T08:00:00", tags=["docs"],
+    )
+
+    cells = bookmark.row_cache(_bookmark_row_cells, today)
+    assert cells[:2] == ("example.com", "example.com")
+    assert cells[3].endswith("\n#docs")
+    assert cells[4] == "Today\nJul 12"
+    assert bookmark.row_cache(_bookmark_row_cells, today) is cells
+
+    assert _fmt_tags(["docs", "python"], ["ai"]) == "#docs +2"
+    assert _fmt_tags([], ["ai", "ml"]) == "AI #ai +1"
+    assert _fmt_tags([], ["ai"]) == "AI #ai"
+    assert _fmt_tags([], []) == "—"
+
+    bookmark.tags.append("python")
+    assert bookmark.row_cache(_bookmark_row_cells, today)[3].endswith("#docs +1")
+    assert "_row_cache" not in bookmark.to_dict()
+    assert bookmark == Bookmark.from_dict(bookmark.to_dict())
+
+
+def test_rendered_row_lookup_uses_the_populate_index():
+    view = object.__new__(BookmarkViewMixin)
+    assert view._has_table_row("7") is False
+    view._tree_items = {7: "7", 12: "12"}
+
+    assert view._has_table_row("7") is True
+    assert view._has_table_row(12) is True
+    assert view._has_table_row("8") is False
+    assert view._has_table_row("not-an-id") is False
+
+
 def test_bookmark_table_sorting_uses_typed_values_and_stable_ties():
     values = {
         "10": {"saved": _saved_sort_value("2026-01-02T00:00:00Z")},
@@ -356,6 +1566,118 @@ def test_single_selection_opens_contextual_focus_inspector():
     assert modes == ["focus"]
 
 
+class _PooledLabel:
+    created = 0
+
+    def __init__(self, _parent=None, **kwargs):
+        _PooledLabel.created += 1
+        self.options = dict(kwargs)
+        self.manager = ""
+        self.tags = ("Label",)
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    config = configure
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self.tags
+        self.tags = tags
+
+    def pack(self, **_kwargs):
+        self.manager = "pack"
+
+    def pack_forget(self):
+        self.manager = ""
+
+    def winfo_manager(self):
+        return self.manager
+
+
+def test_read_later_sidebar_recycles_its_row_labels(monkeypatch):
+    from bookmark_organizer_pro.app_mixins import app_shell
+
+    activations = []
+    monkeypatch.setattr(app_shell.tk, "Label", _PooledLabel)
+    monkeypatch.setattr(
+        app_shell, "make_keyboard_activatable",
+        lambda widget, command, **_kwargs: activations.append(command),
+    )
+
+    queued = []
+    for index in range(3):
+        bookmark = Bookmark(id=index + 1, url=f"https://q{index}.example", title=f"Queued {index}")
+        bookmark.read_later = True
+        bookmark.read_later_position = index
+        queued.append(bookmark)
+
+    shell = object.__new__(AppShellMixin)
+    shell.bookmark_manager = SimpleNamespace(get_all_bookmarks=lambda: list(queued))
+    shell.theme = ThemeColors()
+    shell._rl_frame = object()
+    shell._rl_count_label = _PooledLabel()
+    shell._rl_empty = _PooledLabel()
+    shell._rl_empty.pack()
+    shell._rl_rows = []
+    shell._rl_row_ids = []
+    _PooledLabel.created = 0
+
+    shell._refresh_read_later_sidebar()
+    first_rows = list(shell._rl_rows)
+    queued.pop(0)
+    shell._refresh_read_later_sidebar()
+
+    assert _PooledLabel.created == 3
+    assert shell._rl_rows == first_rows
+    assert [row.manager for row in first_rows] == ["pack", "pack", ""]
+    assert first_rows[0].options["text"] == "  Queued 1"
+    assert shell._rl_empty.manager == ""
+    assert shell._rl_count_label.options["text"] == "2"
+
+    selected = []
+    shell._select_bookmark_by_id = selected.append
+    activations[0]()
+    assert selected == [2]
+
+
+def test_workflow_sidebar_recycles_its_row_labels(monkeypatch):
+    from bookmark_organizer_pro.app_mixins import app_shell
+    from bookmark_organizer_pro.services import flows as flows_module
+
+    flows = [SimpleNamespace(icon="", name=f"Trail {index}") for index in range(3)]
+    monkeypatch.setattr(app_shell.tk, "Label", _PooledLabel)
+    monkeypatch.setattr(
+        flows_module, "FlowManager", lambda: SimpleNamespace(list_flows=lambda: list(flows)),
+    )
+
+    shell = object.__new__(AppShellMixin)
+    shell.theme = ThemeColors()
+    shell._flows_frame = object()
+    shell._flows_count_label = _PooledLabel()
+    shell._flows_empty = _PooledLabel()
+    shell._flows_empty.pack()
+    shell._flow_rows = []
+    _PooledLabel.created = 0
+
+    shell._refresh_flows_sidebar()
+    first_rows = list(shell._flow_rows)
+    flows.pop(0)
+    shell._refresh_flows_sidebar()
+
+    assert _PooledLabel.created == 3
+    assert shell._flow_rows == first_rows
+    assert [row.manager for row in first_rows] == ["pack", "pack", ""]
+    assert first_rows[0].options["text"] == "  📋 Trail 1"
+    assert first_rows[0].tags[0] == app_shell.SIDEBAR_ROW_BINDTAG
+    assert shell._flows_empty.manager == ""
+
+    flows.clear()
+    shell._refresh_flows_sidebar()
+    assert shell._flows_empty.manager == "pack"
+    assert shell._flows_count_label.options["text"] == "0"
+
+
 def test_favorite_column_release_routes_to_direct_pin_action():
     class Tree:
         @staticmethod
@@ -394,3 +1716,225 @@ def test_favorite_column_has_keyboard_parity():
 
     assert shell._toggle_pin_from_keyboard() == "break"
     assert toggled == ["42"]
+
+
+def test_command_palette_reconfigures_its_row_pool_per_keystroke(monkeypatch):
+    class Widget:
+        created = 0
+
+        def __init__(self, _parent=None, **kwargs):
+            Widget.created += 1
+            self.options = dict(kwargs)
+            self.manager = ""
+
+        def configure(self, **kwargs):
+            self.options.update(kwargs)
+
+        def bind(self, *_args):
+            pass
+
+        def pack(self, **_kwargs):
+            self.manager = "pack"
+
+        def pack_forget(self):
+            self.manager = ""
+
+        def winfo_manager(self):
+            return self.manager
+
+    activations = []
+    monkeypatch.setattr(shell_widgets.tk, "Frame", Widget)
+    monkeypatch.setattr(shell_widgets.tk, "Label", Widget)
+    monkeypatch.setattr(
+        shell_widgets, "make_keyboard_activatable",
+        lambda widget, command, **_kwargs: activations.append(command),
+    )
+    monkeypatch.setattr(shell_widgets, "route_pointer_to_control", lambda *_args: None)
+    monkeypatch.setattr(shell_widgets, "get_theme", ThemeColors)
+
+    commands = [(f"Command {index}", "Ctrl+K" if index == 0 else "", None) for index in range(12)]
+    commands[1] = ("COMMAND 1", "", None)
+    palette = object.__new__(shell_widgets.CommandPalette)
+    palette.commands = commands
+    palette._command_index = shell_widgets.CommandPalette._index_commands(commands)
+    palette.filtered_commands = list(commands)
+    palette.selected_index = 0
+    palette.list_frame = Widget()
+    palette._rows = []
+    palette._empty = None
+    palette.search_var = SimpleNamespace(get=lambda: "")
+
+    palette._render_commands()
+    created = Widget.created
+    rows = list(palette._rows)
+    palette.search_var = SimpleNamespace(get=lambda: "command 1")
+    palette._apply_filter()
+
+    assert Widget.created == created
+    assert palette._rows == rows and len(rows) == shell_widgets.CommandPalette.MAX_VISIBLE_COMMANDS
+    assert [row.name_label.options["text"] for row in rows[:3]] == ["COMMAND 1", "Command 10", "Command 11"]
+    assert [row.item.manager for row in rows] == ["pack"] * 3 + [""] * 7
+    assert rows[0].shortcut_label.manager == ""
+
+    palette.search_var = SimpleNamespace(get=lambda: "zzz")
+    palette._apply_filter()
+    assert all(row.item.manager == "" for row in rows)
+    assert palette._empty.manager == "pack"
+
+    executed = []
+    palette.filtered_commands = [("Only", "", lambda: executed.append(True))]
+    palette.destroy = lambda: None
+    activations[0]()
+    assert executed == [True]
+
+
+def test_command_palette_debounces_bursty_filter_input():
+    scheduled = {}
+    applied = []
+
+    def after(_ms, callback):
+        after_id = f"after#{after.calls}"
+        after.calls += 1
+        scheduled[after_id] = callback
+        return after_id
+
+    after.calls = 0
+    palette = object.__new__(shell_widgets.CommandPalette)
+    palette._filter_after = None
+    palette.after = after
+    palette.after_cancel = scheduled.pop
+    palette._apply_filter = lambda: applied.append(palette._filter_after)
+
+    for _key in "theme":
+        palette._filter()
+
+    assert list(scheduled) == ["after#4"]
+    assert applied == []
+    palette._flush_filter()
+    assert applied == [None]
+    assert scheduled == {}
+
+
+def test_command_palette_ranks_prefix_word_and_fuzzy_matches():
+    commands = [
+        ("Find Duplicates", "", None),
+        ("Export Bookmarks", "", None),
+        ("Import / Export", "", None),
+        ("Check Links", "", None),
+        ("Reexport Cache", "", None),
+    ]
+    index = shell_widgets.CommandPalette._index_commands(commands)
+
+    def names(query):
+        return [name for name, _shortcut, _callback in shell_widgets._rank_commands(query, index)]
+
+    assert names("export") == ["Export Bookmarks", "Import / Export", "Reexport Cache"]
+    assert names("exprt") == ["Export Bookmarks", "Import / Export", "Reexport Cache"]
+    assert names("chk") == ["Check Links"]
+    assert names("zq") == []
+
+
+def test_status_bar_progress_moves_only_the_canvas_fill():
+    class Canvas:
+        def __init__(self):
+            self.moves = []
+
+        def coords(self, item, *points):
+            self.moves.append((item, points))
+
+    bar = object.__new__(shell_widgets.StatusBar)
+    bar.progress_frame = SimpleNamespace(winfo_ismapped=lambda: True)
+    bar.progress_canvas = Canvas()
+    bar._progress_rect = 7
+    bar._progress_value = 0
+    bar._progress_px = 0
+
+    bar.show_progress(0.5)
+    bar.show_progress(0.501)
+    bar.show_progress(2)
+
+    assert bar.progress_canvas.moves == [(7, (0, 0, 100, 4)), (7, (0, 0, 200, 4))]
+    assert bar._progress_value == 1
+
+
+def test_status_bar_skips_unchanged_label_text():
+    bar = object.__new__(shell_widgets.StatusBar)
+    bar.status_label = _Configurable()
+    bar.counts_label = _Configurable()
+    writes = []
+    bar.status_label.configure = lambda **kwargs: writes.append(kwargs["text"])
+    bar.counts_label.configure = lambda **kwargs: writes.append(kwargs["text"])
+    bar._last_status = "Ready"
+    bar._last_counts = ""
+
+    bar.set_status("Ready")
+    bar.set_status("Checking")
+    bar.set_status("Checking")
+    bar.set_counts(5)
+    bar.set_counts(5)
+    bar.set_counts(5, selected=2)
+
+    assert writes == ["Checking", "5 bookmarks", "2 selected • 5 total"]
+
+
+def test_placeholder_bitmaps_are_drawn_once_per_letter_and_colour():
+    first = treeview._placeholder_bitmap("G", "#336699")
+
+    assert treeview._placeholder_bitmap("G", "#336699") is first
+    assert treeview._placeholder_bitmap("H", "#336699") is not first
+    assert first.size == (16, 16)
+    assert first.getpixel((0, 0)) == (0x33, 0x66, 0x99)
+
+
+def test_command_palette_navigation_restyles_only_the_two_affected_rows(monkeypatch):
+    class Widget:
+        def __init__(self, _parent=None, **kwargs):
+            self.options = dict(kwargs)
+            self.writes = 0
+            self.manager = ""
+
+        def configure(self, **kwargs):
+            self.writes += 1
+            self.options.update(kwargs)
+
+        def bind(self, *_args):
+            pass
+
+        def pack(self, **_kwargs):
+            self.manager = "pack"
+
+        def pack_forget(self):
+            self.manager = ""
+
+        def winfo_manager(self):
+            return self.manager
+
+    monkeypatch.setattr(shell_widgets.tk, "Frame", Widget)
+    monkeypatch.setattr(shell_widgets.tk, "Label", Widget)
+    monkeypatch.setattr(shell_widgets, "make_keyboard_activatable", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(shell_widgets, "route_pointer_to_control", lambda *_args: None)
+    monkeypatch.setattr(shell_widgets, "get_theme", ThemeColors)
+
+    commands = [(f"Command {index}", "", None) for index in range(4)]
+    palette = object.__new__(shell_widgets.CommandPalette)
+    palette.commands = commands
+    palette._command_index = shell_widgets.CommandPalette._index_commands(commands)
+    palette.filtered_commands = list(commands)
+    palette.selected_index = 0
+    palette.list_frame = Widget()
+    palette._rows = []
+    palette._empty = None
+    palette._filter_after = None
+    palette.search_var = SimpleNamespace(get=lambda: "")
+    palette._render_commands()
+    for row in palette._rows:
+        row.item.writes = 0
+
+    palette._apply_filter()
+    palette._move_up(None)
+    palette._move_down(None)
+
+    theme = ThemeColors()
+    assert [row.item.writes for row in palette._rows] == [1, 1, 0, 0]
+    assert palette._rows[1].item.options["bg"] == theme.bg_tertiary
+    assert palette._rows[0].item.options["bg"] == theme.bg_secondary
@@ -105,6 +105,18 @@ def test_graph_view_uses_shared_geometry_and_full_viewport_matrix():
     assert "_verify_viewport" in smoke_source
 
 
+def test_primary_dialogs_center_without_an_extra_layout_pass():
+    from bookmark_organizer_pro.ui.widget_analytics import AnalyticsDashboard
+    from bookmark_organizer_pro.ui.widget_bookmark_editor import BookmarkEditorDialog
+
+    analytics_init = inspect.getsource(AnalyticsDashboard.__init__)
+    editor_init = inspect.getsource(BookmarkEditorDialog.__init__)
+    assert "apply_screen_aware_geometry(self, 800, 650)" in analytics_init
+    assert "apply_screen_aware_geometry(self, 640, 760)" in editor_init
+    for source in (analytics_init, editor_init):
+        assert "center_window()" not in source
+        assert "update_idletasks" not in source
+
 def test_root_minimum_allows_documented_laptop_viewport():
     root = Path(__file__).resolve().parents[1]
     app_source = (root / "bookmark_organizer_pro" / "app.py").read_text(encoding="utf-8")